@@ -0,0 +1,78 @@
+"""Benchmark the chapter page data path and route latency.
+
+"uncached" rows clear the chapter commentary cache before every request.
+
+Usage:
+    python benchmarks/bench_chapter.py [--rounds N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from kjvstudy_org.kjv import bible
+
+# A mix of short, average and very long chapters.
+CHAPTERS = [("Genesis", 1), ("John", 3), ("Psalms", 23), ("Psalms", 119), ("Romans", 8)]
+
+
+def timed(fn, rounds):
+    """Returns (mean, p99) latency of fn in milliseconds."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return sum(samples) / len(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def scan_chapter(book, chapter):
+    """The original data path: filter every verse in the Bible."""
+    return [v for v in bible.iter_verses() if v.book == book and v.chapter == chapter]
+
+
+def indexed_chapter(book, chapter):
+    """The indexed data path used by the chapter routes."""
+    return bible.get_verses_by_book_chapter(book, chapter)
+
+
+def report(label, fn, rounds):
+    mean, p99 = timed(fn, rounds)
+    print(f"  {label:<32} mean {mean:9.3f} ms   p99 {p99:9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    from fastapi.testclient import TestClient
+    from kjvstudy_org.server import app, chapter_cache, generate_commentary, get_verse_commentary
+
+    client = TestClient(app)
+
+    def uncached_get(url):
+        chapter_cache.clear()
+        return client.get(url)
+
+    for book, chapter in CHAPTERS:
+        if chapter not in bible.get_chapters_for_book(book):
+            continue
+        print(f"{book} {chapter}")
+        report("scan (iter_verses)", lambda: scan_chapter(book, chapter), args.rounds)
+        report("indexed lookup", lambda: indexed_chapter(book, chapter), args.rounds)
+        verses = indexed_chapter(book, chapter)
+        report("commentary (all verses)", lambda: [generate_commentary(book, chapter, v) for v in verses], args.rounds)
+        report("commentary (precomputed)", lambda: [get_verse_commentary(book, chapter, v) for v in verses], args.rounds)
+        report("GET chapter page (uncached)", lambda: uncached_get(f"/book/{book}/chapter/{chapter}"), args.rounds)
+        report("GET chapter page", lambda: client.get(f"/book/{book}/chapter/{chapter}"), args.rounds)
+        report("GET commentary page (uncached)", lambda: uncached_get(f"/commentary/{book}/{chapter}"), args.rounds)
+        report("GET commentary page", lambda: client.get(f"/commentary/{book}/{chapter}"), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
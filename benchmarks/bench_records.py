@@ -0,0 +1,57 @@
+"""Microbenchmark: pydantic Verse models vs VerseRecord tuples for a corpus scan.
+
+Each "query" is a full-text scan like the original perform_full_text_search:
+iterate every verse and test it for a search term.
+
+Usage:
+    python benchmarks/bench_records.py [--rounds N] [--term lord]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from kjvstudy_org.kjv import bible
+
+
+def scan(verses, term):
+    return [v for v in verses if term in v.text.lower()]
+
+
+def measure(label, make_iter, term, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        scan(make_iter(), term)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    scan(make_iter(), term)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples.sort()
+    print(
+        f"  {label:<28} mean {sum(samples) / len(samples):8.2f} ms   "
+        f"min {samples[0]:8.2f} ms   peak alloc {peak / 1024:9.1f} KiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--term", default="lord")
+    args = parser.parse_args()
+
+    bible.load()
+    print(f"Full scan for {args.term!r} over {bible.get_verse_count():,} verses")
+    measure("iter_verses (pydantic)", bible.iter_verses, args.term, args.rounds)
+    measure("iter_verse_records (tuple)", bible.iter_verse_records, args.term, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
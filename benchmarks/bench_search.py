@@ -0,0 +1,72 @@
+"""Benchmark full-text search: linear scan vs the inverted index.
+
+"scoped ms" searches the index within the New Testament only. The search
+result cache is cleared before each search, so those columns are uncached.
+
+Usage:
+    python benchmarks/bench_search.py [--rounds N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from kjvstudy_org.kjv import bible
+from kjvstudy_org.search import get_search_index, parse_query
+from kjvstudy_org.server import paginated_search, search_cache, testament_spans
+
+QUERIES = [
+    "love", "lord", "the lord", "kingdom of heaven", "faith hope charity", "melchisedec", "lo",
+    '"kingdom of heaven"', "faith NEAR/3 works",
+]
+
+
+def linear_scan(query):
+    """The original search: a substring test on every verse."""
+    terms = parse_query(query).words
+    return [r.verse_id for r in bible.iter_verse_records() if all(t in r.text.lower() for t in terms)]
+
+
+def timed(fn, rounds):
+    """Returns the mean latency of fn in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = get_search_index()
+    print(f"index build {(time.perf_counter() - start) * 1000:.1f} ms, {len(index.vocabulary):,} words")
+
+    new_testament = testament_spans("New Testament")
+
+    def uncached_search(query, limit=None):
+        search_cache.clear()
+        return paginated_search(query, limit)["results"]
+
+    print(
+        f"{'query':<22}{'matches':>8}{'scan ms':>10}{'index ms':>10}"
+        f"{'scoped ms':>11}{'search ms':>11}{'limit=5 ms':>12}"
+    )
+    for query in QUERIES:
+        parsed = parse_query(query)
+        matches = len(index.search_query(parsed))
+        scan = timed(lambda: linear_scan(query), max(1, args.rounds // 10))
+        lookup = timed(lambda: index.search_query(parsed), args.rounds)
+        scoped = timed(lambda: index.search_query(parsed, new_testament), args.rounds)
+        full = timed(lambda: uncached_search(query), args.rounds)
+        top = timed(lambda: uncached_search(query, 5), args.rounds)
+        print(f"{query:<22}{matches:>8}{scan:>10.3f}{lookup:>10.3f}{scoped:>11.3f}{full:>11.3f}{top:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark cold start: module import time and process start to first byte.
+
+Usage:
+    python benchmarks/bench_startup.py [--rounds N] [--path /book/John/chapter/3]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def import_time():
+    """Seconds to import kjvstudy_org.server in a fresh interpreter."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        "import kjvstudy_org.server; print(time.perf_counter() - start)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def poll(url, deadline, expect_ok=False):
+    """Polls url until it answers (with a 2xx status if expect_ok); returns the time."""
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                response.read(1)
+                return time.perf_counter()
+        except urllib.error.HTTPError:
+            if not expect_ok:
+                return time.perf_counter()
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.005)
+    raise TimeoutError(url)
+
+
+def server_start(path, timeout=60):
+    """Returns (first byte of /health, /ready is 200, first byte of path) in seconds from spawn."""
+    port = free_port()
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "kjvstudy_org.server:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+    )
+    try:
+        deadline = start + timeout
+        base = f"http://127.0.0.1:{port}"
+        health = poll(base + "/health", deadline) - start
+        ready = poll(base + "/ready", deadline, expect_ok=True) - start
+        page = poll(base + path, deadline) - start
+        return health, ready, page
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--path", default="/book/John/chapter/3")
+    args = parser.parse_args()
+
+    imports = [import_time() for _ in range(args.rounds)]
+    print(f"{'import kjvstudy_org.server':<36} mean {sum(imports) / len(imports) * 1000:9.1f} ms")
+
+    runs = [server_start(args.path) for _ in range(args.rounds)]
+    for label, samples in zip(("first byte (/health)", "corpus ready (/ready)", f"first byte ({args.path})"), zip(*runs)):
+        print(f"{label:<36} mean {sum(samples) / len(samples) * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
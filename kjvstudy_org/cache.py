@@ -0,0 +1,83 @@
+"""A bounded in-memory cache with LRU eviction, expiry and hit/miss counters."""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """A thread-safe least-recently-used cache bounded by the total size of its values.
+
+    sizeof(value) gives the size each value counts for (1 by default, which
+    bounds the number of entries). Entries older than ttl seconds, if given,
+    are treated as missing.
+    """
+
+    def __init__(self, max_size, ttl=None, sizeof=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.sizeof = sizeof or (lambda value: 1)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (expires, size, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the cached value for key, or default, and counts a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key, value):
+        """Caches value for key, evicting the least recently used entries to make room."""
+        size = self.sizeof(value)
+        if size > self.max_size:
+            return
+
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, size, value)
+            self.size += size
+
+            while self.size > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        self.size -= self._entries.pop(key)[1]
+
+    def clear(self):
+        """Removes every entry (the counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Returns the cache's size and counters as a dict."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
@@ -0,0 +1,333 @@
+"""Curated and precomputed verse commentary.
+
+Hand-written commentary for key verses lives in static/commentary.json
+rather than in code, so it is parsed once per process instead of being
+rebuilt on every call to generate_commentary(). The file holds a list of
+entries:
+
+    {"book": "John", "chapter": 3, "verse": 16,
+     "analysis": "...", "historical": "...", "questions": ["..."],
+     "cross_references": [...]}          (optional)
+
+Entries without cross_references get generated ones.
+
+The commentary generated for every other verse can be precomputed into a
+binary file that the server memory-maps, so a chapter page looks it up
+instead of running the generators per verse. Generated text repeats a lot
+between verses, so each distinct string is stored once and every verse is
+a short record of string numbers.
+
+Layout (little-endian, every section padded to 4 bytes):
+
+    header           magic, version, book/verse/record/string counts,
+                     sizes, fingerprint of the generator version, seed,
+                     curated commentary and corpus
+    book_name_offsets u32[books + 1]   into the book name table
+    verse_ids        u32[verses]       sorted packed verse IDs, with book
+                                       ordinals from the book name table
+    record_offsets   u32[verses + 1]   into the records
+    records          u32[...]          per verse: analysis, historical,
+                                       question count, questions...,
+                                       reference count, (text, url,
+                                       context) per reference
+    string_offsets   u32[strings + 1]  into the string table
+    book names       UTF-8
+    string table     UTF-8
+
+Build it from the corpus, using every core, with:
+
+    python -m kjvstudy_org.commentary
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .corpus import DEFAULT_CORPUS
+from .kjv import make_verse_id
+
+COMMENTARY_VERSION = 1
+DEFAULT_COMMENTARY = Path(__file__).parent / "static" / "commentary.json"
+
+# Bump whenever generate_commentary() or the helpers it calls in server.py
+# change their output, so precomputed files built by older code are ignored.
+GENERATOR_VERSION = 1
+DEFAULT_CORPUS_SOURCE = Path(__file__).parent / "static" / "verses-1769.json"
+
+MAGIC = b"KJVM"
+VERSION = 2
+DEFAULT_PRECOMPUTED = Path(__file__).parent / "static" / "commentary.kjvm"
+
+# magic, version, reserved, books, verses, record words, strings, book name bytes, string bytes, fingerprint
+HEADER = struct.Struct("<4sHHIIIIII16s")
+
+CROSS_REFERENCE_FIELDS = ("text", "url", "context")
+
+_curated = None
+_curated_lock = threading.Lock()
+
+_precomputed = None
+_precomputed_lock = threading.Lock()
+
+
+def load_curated_commentary(path=DEFAULT_COMMENTARY):
+    """Reads a commentary file into a dict keyed by (book, chapter, verse)."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if data.get("version") != COMMENTARY_VERSION:
+        raise ValueError(f"{path}: unsupported commentary version {data.get('version')!r}")
+
+    commentary = {}
+    for entry in data["verses"]:
+        entry = dict(entry)
+        key = (entry.pop("book"), entry.pop("chapter"), entry.pop("verse"))
+        commentary[key] = entry
+    return commentary
+
+
+def get_curated_commentary(book, chapter, verse):
+    """Returns the curated commentary for a verse, or None, loading the file on first use."""
+    global _curated
+    if _curated is None:
+        with _curated_lock:
+            if _curated is None:
+                _curated = load_curated_commentary()
+    return _curated.get((book, chapter, verse))
+
+
+def commentary_fingerprint(seed, curated=DEFAULT_COMMENTARY, corpus=None):
+    """Returns 16 bytes identifying the inputs generated commentary depends on.
+
+    These are GENERATOR_VERSION, the seed, the curated commentary and the
+    corpus (the JSON source, or the binary corpus when there is no source).
+    A precomputed file whose fingerprint differs was built from other inputs
+    or by other generator code, and is not used.
+    """
+    if corpus is None:
+        corpus = DEFAULT_CORPUS_SOURCE if DEFAULT_CORPUS_SOURCE.exists() else DEFAULT_CORPUS
+
+    digest = hashlib.sha256(f"{GENERATOR_VERSION}\0{seed}\0".encode("utf-8"))
+    for path in (curated, corpus):
+        data = Path(path).read_bytes()
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.digest()[:16]
+
+
+def _padding(size):
+    return -size % 4
+
+
+def _generate_chapter(book_chapter):
+    """Generates the commentary for every verse in a chapter (runs in a worker process)."""
+    from .kjv import bible
+    from .server import generate_commentary
+
+    book, chapter = book_chapter
+    return [
+        ((book, chapter, verse.verse), generate_commentary(book, chapter, verse))
+        for verse in bible.get_verses_by_book_chapter(book, chapter)
+    ]
+
+
+def build_precomputed_commentary(target=DEFAULT_PRECOMPUTED, workers=None):
+    """Generates commentary for every verse in parallel and writes it to target. Returns the target path."""
+    from .kjv import bible
+    from .server import COMMENTARY_SEED
+
+    chapters = [(book, chapter) for book in bible.get_books() for chapter in bible.get_chapters_for_book(book)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Chapters come back in canonical order.
+        entries = (entry for results in pool.map(_generate_chapter, chapters, chunksize=16) for entry in results)
+        return write_precomputed_commentary(target, entries, commentary_fingerprint(COMMENTARY_SEED))
+
+
+def write_precomputed_commentary(target, entries, fingerprint):
+    """Writes ((book, chapter, verse), commentary dict) pairs, in canonical order, to target.
+
+    Returns the target path.
+    """
+    books = {}
+    strings = {}
+    verse_ids = array("I")
+    record_offsets = array("I", [0])
+    records = array("I")
+
+    def string_number(text):
+        return strings.setdefault(text, len(strings))
+
+    for (book, chapter, verse), commentary in entries:
+        verse_id = make_verse_id(books.setdefault(book, len(books) + 1), chapter, verse)
+        if verse_ids and verse_id <= verse_ids[-1]:
+            raise ValueError(f"{book} {chapter}:{verse} is out of order")
+
+        verse_ids.append(verse_id)
+        records.append(string_number(commentary["analysis"]))
+        records.append(string_number(commentary["historical"]))
+        records.append(len(commentary["questions"]))
+        records.extend(string_number(question) for question in commentary["questions"])
+        records.append(len(commentary["cross_references"]))
+        for reference in commentary["cross_references"]:
+            if tuple(reference) != CROSS_REFERENCE_FIELDS:
+                raise ValueError(f"Unexpected cross reference fields {tuple(reference)} in {book} {chapter}:{verse}")
+            records.extend(string_number(reference[field]) for field in CROSS_REFERENCE_FIELDS)
+        record_offsets.append(len(records))
+
+    book_names = bytearray()
+    book_name_offsets = array("I", [0])
+    for book in books:
+        book_names += book.encode("utf-8")
+        book_name_offsets.append(len(book_names))
+
+    string_table = bytearray()
+    string_offsets = array("I", [0])
+    for text in strings:
+        string_table += text.encode("utf-8")
+        string_offsets.append(len(string_table))
+
+    sections = [book_name_offsets, verse_ids, record_offsets, records, string_offsets]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+
+    target = Path(target)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(
+            MAGIC, VERSION, 0,
+            len(books), len(verse_ids), len(records), len(strings), len(book_names), len(string_table),
+            fingerprint,
+        ))
+        for section in sections + [book_names, string_table]:
+            data = bytes(section)
+            f.write(data)
+            f.write(b"\0" * _padding(len(data)))
+
+    # Replace atomically, so running workers never see a half-written file.
+    tmp.replace(target)
+    return target
+
+
+class PrecomputedCommentary:
+    """Read-only, memory-mapped view of a precomputed commentary file."""
+
+    def __init__(self, fname):
+        if sys.byteorder != "little":
+            raise ValueError("The precomputed commentary format requires a little-endian host.")
+
+        self.fname = Path(fname)
+        with open(self.fname, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _, book_count, self.verse_count, record_size, string_count, names_size, string_size,
+         self.fingerprint) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.fname} is not a version {VERSION} precomputed commentary file.")
+
+        view = memoryview(self._mmap)
+        offset = HEADER.size
+
+        def section(fmt, count):
+            nonlocal offset
+            size = count * struct.calcsize(fmt)
+            data = view[offset:offset + size].cast(fmt)
+            offset += size + _padding(size)
+            return data
+
+        book_name_offsets = section("I", book_count + 1)
+        self._verse_ids = section("I", self.verse_count)
+        self._record_offsets = section("I", self.verse_count + 1)
+        self._records = section("I", record_size)
+        self._string_offsets = section("I", string_count + 1)
+        names = section("B", names_size)
+        self._strings = section("B", string_size)
+
+        self._book_ordinals = {
+            bytes(names[book_name_offsets[i]:book_name_offsets[i + 1]]).decode("utf-8"): i + 1
+            for i in range(book_count)
+        }
+
+    def _string(self, number):
+        return str(self._strings[self._string_offsets[number]:self._string_offsets[number + 1]], "utf-8")
+
+    def get(self, book, chapter, verse):
+        """Returns the commentary dict for a verse, or None."""
+        ordinal = self._book_ordinals.get(book)
+        if ordinal is None or not (0 <= chapter <= 0xFF and 0 <= verse <= 0xFF):
+            return None
+
+        verse_id = make_verse_id(ordinal, chapter, verse)
+        i = bisect_left(self._verse_ids, verse_id)
+        if i == self.verse_count or self._verse_ids[i] != verse_id:
+            return None
+
+        record = self._records[self._record_offsets[i]:self._record_offsets[i + 1]]
+        strings = [self._string(number) for number in record]
+        question_count = record[2]
+        questions = strings[3:3 + question_count]
+        references = strings[4 + question_count:]
+        return {
+            "analysis": strings[0],
+            "historical": strings[1],
+            "questions": questions,
+            "cross_references": [
+                dict(zip(CROSS_REFERENCE_FIELDS, references[j:j + 3]))
+                for j in range(0, len(references), 3)
+            ],
+        }
+
+    def __len__(self):
+        return self.verse_count
+
+
+def load_precomputed_commentary(seed, path=DEFAULT_PRECOMPUTED):
+    """Opens the precomputed commentary file, or returns None if it is missing or out of date."""
+    if not Path(path).exists():
+        return None
+
+    try:
+        precomputed = PrecomputedCommentary(path)
+    except ValueError as e:
+        print(f"Ignoring precomputed commentary: {e}")
+        return None
+
+    if precomputed.fingerprint != commentary_fingerprint(seed):
+        print(f"Ignoring precomputed commentary {path}: built from other inputs or by another generator version")
+        return None
+    return precomputed
+
+
+def get_precomputed_commentary(book, chapter, verse, seed):
+    """Returns the precomputed commentary for a verse, or None, opening the file on first use."""
+    global _precomputed
+    if _precomputed is None:
+        with _precomputed_lock:
+            if _precomputed is None:
+                # False marks "no usable file", so it is only checked once.
+                _precomputed = load_precomputed_commentary(seed) or False
+    return _precomputed.get(book, chapter, verse) if _precomputed else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the generated commentary for every verse.")
+    parser.add_argument("target", nargs="?", default=DEFAULT_PRECOMPUTED, help="commentary file to write")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    target = build_precomputed_commentary(args.target, args.workers)
+    print(f"Wrote {target} ({target.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
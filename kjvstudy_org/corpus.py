@@ -0,0 +1,227 @@
+"""Compact binary corpus format for the Bible text.
+
+The JSON corpus is parsed into a Python dict in every worker process. The
+binary corpus stores the same (cleaned) text as one string table plus
+fixed-width offset arrays, and is opened with mmap, so every worker on a
+machine shares the same pages through the OS page cache.
+
+Layout (little-endian, every section padded to 4 bytes):
+
+    header               magic, version, book/chapter/verse counts, sizes
+    book_name_offsets    u32[books + 1]     into the book name table
+    book_chapter_start   u32[books + 1]     into the chapter arrays
+    chapter_numbers      u16[chapters]
+    chapter_verse_start  u32[chapters + 1]  into the verse arrays
+    verse_numbers        u16[verses]
+    text_offsets         u32[verses + 1]    into the string table
+    book names           UTF-8
+    string table         UTF-8 verse text
+
+Build it from the JSON corpus with:
+
+    python -m kjvstudy_org.corpus
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from pathlib import Path
+
+MAGIC = b"KJVC"
+VERSION = 1
+
+# magic, version, reserved, books, chapters, verses, book name bytes, text bytes
+HEADER = struct.Struct("<4sHHIIIII")
+
+STATIC_DIR = Path(__file__).parent / "static"
+DEFAULT_SOURCE = STATIC_DIR / "verses-1769.json"
+DEFAULT_CORPUS = STATIC_DIR / "verses-1769.kjvc"
+
+
+def _padding(size):
+    return -size % 4
+
+
+def build_corpus(source=DEFAULT_SOURCE, target=DEFAULT_CORPUS):
+    """Builds a binary corpus file from the JSON corpus. Returns the target path."""
+    from .kjv import Bible
+
+    bible = Bible(source)
+
+    book_names = bytearray()
+    book_name_offsets = array("I", [0])
+    book_chapter_start = array("I", [0])
+    chapter_numbers = array("H")
+    chapter_verse_start = array("I", [0])
+    verse_numbers = array("H")
+    text = bytearray()
+    text_offsets = array("I", [0])
+
+    for book in bible.get_books():
+        book_names += book.encode("utf-8")
+        book_name_offsets.append(len(book_names))
+
+        for chapter in bible.get_chapters_for_book(book):
+            chapter_numbers.append(chapter)
+
+            for verse in bible.get_verses_by_book_chapter(book, chapter):
+                verse_numbers.append(verse.verse)
+                text += verse.text.encode("utf-8")
+                text_offsets.append(len(text))
+
+            chapter_verse_start.append(len(verse_numbers))
+        book_chapter_start.append(len(chapter_numbers))
+
+    sections = [
+        book_name_offsets, book_chapter_start,
+        chapter_numbers, chapter_verse_start,
+        verse_numbers, text_offsets,
+    ]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+
+    target = Path(target)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(
+            MAGIC, VERSION, 0,
+            len(book_name_offsets) - 1, len(chapter_numbers), len(verse_numbers),
+            len(book_names), len(text),
+        ))
+        for section in sections + [book_names, text]:
+            data = bytes(section)
+            f.write(data)
+            f.write(b"\0" * _padding(len(data)))
+
+    # Replace atomically, so running workers never see a half-written file.
+    tmp.replace(target)
+    return target
+
+
+class CorpusFile(Mapping):
+    """Read-only, memory-mapped view of a binary corpus file.
+
+    Behaves like the {"Book C:V": text} dict loaded from the JSON corpus,
+    but decodes each verse from the shared mapping on access.
+    """
+
+    def __init__(self, fname):
+        if sys.byteorder != "little":
+            raise ValueError("The binary corpus format requires a little-endian host.")
+
+        self.fname = Path(fname)
+        with open(self.fname, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _, self.book_count, self.chapter_count, self.verse_count,
+         names_size, text_size) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.fname} is not a version {VERSION} corpus file.")
+
+        view = memoryview(self._mmap)
+        offset = HEADER.size
+
+        def section(fmt, count):
+            nonlocal offset
+            size = count * struct.calcsize(fmt)
+            data = view[offset:offset + size].cast(fmt)
+            offset += size + _padding(size)
+            return data
+
+        self._book_name_offsets = section("I", self.book_count + 1)
+        self._book_chapter_start = section("I", self.book_count + 1)
+        self._chapter_numbers = section("H", self.chapter_count)
+        self._chapter_verse_start = section("I", self.chapter_count + 1)
+        self._verse_numbers = section("H", self.verse_count)
+        self._text_offsets = section("I", self.verse_count + 1)
+        names = section("B", names_size)
+        self._text = section("B", text_size)
+
+        self.books = [
+            bytes(names[self._book_name_offsets[i]:self._book_name_offsets[i + 1]]).decode("utf-8")
+            for i in range(self.book_count)
+        ]
+        self._book_ids = {book: i for i, book in enumerate(self.books)}
+
+    def _find(self, numbers, start, end, number):
+        """Binary searches numbers[start:end] for number; returns its position or None."""
+        i = bisect_left(numbers, number, start, end)
+        if i < end and numbers[i] == number:
+            return i
+        return None
+
+    def verse_index(self, book, chapter, verse):
+        """Returns the position of a verse in the verse arrays, or None."""
+        book_id = self._book_ids.get(book)
+        if book_id is None:
+            return None
+
+        c = self._find(
+            self._chapter_numbers,
+            self._book_chapter_start[book_id], self._book_chapter_start[book_id + 1],
+            chapter,
+        )
+        if c is None:
+            return None
+
+        return self._find(
+            self._verse_numbers,
+            self._chapter_verse_start[c], self._chapter_verse_start[c + 1],
+            verse,
+        )
+
+    def text_at(self, i):
+        """Returns the text of the verse at position i in the verse arrays."""
+        return str(self._text[self._text_offsets[i]:self._text_offsets[i + 1]], "utf-8")
+
+    def iter_entries(self):
+        """Yields (book, chapter, verse, position) for every verse, in canonical order."""
+        for book_id, book in enumerate(self.books):
+            for c in range(self._book_chapter_start[book_id], self._book_chapter_start[book_id + 1]):
+                chapter = self._chapter_numbers[c]
+                for i in range(self._chapter_verse_start[c], self._chapter_verse_start[c + 1]):
+                    yield book, chapter, self._verse_numbers[i], i
+
+    def _position(self, key):
+        if not isinstance(key, str):
+            return None
+        book, _, chapter_verse = key.rpartition(" ")
+        chapter, _, verse = chapter_verse.partition(":")
+        if not (chapter.isdigit() and verse.isdigit()):
+            return None
+        return self.verse_index(book, int(chapter), int(verse))
+
+    def __getitem__(self, key):
+        i = self._position(key)
+        if i is None:
+            raise KeyError(key)
+        return self.text_at(i)
+
+    def __contains__(self, key):
+        return self._position(key) is not None
+
+    def __iter__(self):
+        for book, chapter, verse, _ in self.iter_entries():
+            yield f"{book} {chapter}:{verse}"
+
+    def __len__(self):
+        return self.verse_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the binary Bible corpus.")
+    parser.add_argument("source", nargs="?", default=DEFAULT_SOURCE, help="JSON corpus to read")
+    parser.add_argument("target", nargs="?", default=DEFAULT_CORPUS, help="binary corpus to write")
+    args = parser.parse_args()
+
+    target = build_corpus(args.source, args.target)
+    print(f"Wrote {target} ({target.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
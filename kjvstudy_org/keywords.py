@@ -0,0 +1,87 @@
+"""Keyword spotting for the commentary generators.
+
+The theme and concept helpers each test a verse against their own keyword
+lists with substring checks ("love" in text). KeywordMatcher compiles every
+keyword into one regex, so a verse is scanned once and the helpers check
+the resulting set instead of re-scanning the text. The regex is nested by
+common prefix, and the keywords of each distinct word are remembered, since
+the same few thousand words make up most verses.
+
+Matching keeps the substring semantics of the checks it replaces: a
+keyword counts wherever it occurs, even inside a longer word ("as" in
+"was"), and overlapping keywords are all found ("faith" and "faithful").
+"""
+
+import re
+
+
+def _trie_pattern(words):
+    """Returns a regex matching any of words, nested by common prefix ("faith(?:ful)?").
+
+    The regex engine tries alternatives one by one, so branching on one
+    character at a time is much faster than a flat alternation of words.
+    Greedy optional groups make it match the longest word it can.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def pattern(node):
+        branches = [re.escape(char) + pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return pattern(trie)
+
+
+class KeywordMatcher:
+    """Finds which of a fixed set of keywords occur in a text, in one regex pass."""
+
+    # Bound on the number of distinct words whose keywords are remembered.
+    max_words = 100_000
+
+    def __init__(self, keywords):
+        self.keywords = frozenset(keywords)
+
+        # A lookahead matches at every position without consuming text, so
+        # overlapping keywords are found. It finds the longest keyword at each
+        # position; the shorter keywords starting there are its prefixes.
+        self._pattern = re.compile(f"(?=({_trie_pattern(self.keywords)}))")
+        self._prefixes = {
+            keyword: tuple(prefix for prefix in self.keywords if keyword.startswith(prefix))
+            for keyword in self.keywords
+        }
+
+        # A keyword without spaces can only occur inside one whitespace-separated
+        # word, and verses reuse a small vocabulary, so the keywords of each word
+        # are found once and remembered. The few keywords with spaces are
+        # checked on the whole text.
+        self._spaced = [keyword for keyword in self.keywords if any(char.isspace() for char in keyword)]
+        self._word_keywords = {}
+
+    def _scan(self, text):
+        found = set()
+        for match in self._pattern.finditer(text):
+            found.update(self._prefixes[match.group(1)])
+        return frozenset(found)
+
+    def find(self, text):
+        """Returns the frozenset of keywords that occur anywhere in text."""
+        found = set()
+        for word in text.split():
+            keywords = self._word_keywords.get(word)
+            if keywords is None:
+                keywords = self._scan(word)
+                if len(self._word_keywords) < self.max_words:
+                    self._word_keywords[word] = keywords
+            found.update(keywords)
+
+        for keyword in self._spaced:
+            if keyword in text:
+                found.add(keyword)
+        return frozenset(found)
@@ -1,8 +1,48 @@
 from pydantic import BaseModel
 from pathlib import Path
 from functools import lru_cache
+from typing import NamedTuple
 
 import json
+import threading
+
+from .corpus import DEFAULT_CORPUS, CorpusFile
+from .references import normalize_book_name, parse_locations, resolve_book_name
+
+
+def clean_verse_text(text):
+    """Removes the leading "# " and brackets from raw verse text.
+
+    This is a workaround for the JSON format, which marks paragraphs with "# "
+    and italicized (supplied) words with brackets.
+    Example: "# [In the beginning God created the heaven and the earth.]"
+    """
+    return text.replace("# ", "").replace("[", "").replace("]", "")
+
+
+def make_verse_id(book_ordinal, chapter, verse):
+    """Packs a verse reference into a single integer verse ID.
+
+    The ID is (book ordinal << 16) | (chapter << 8) | verse, with 1-based book
+    ordinals in canonical order, so sorting IDs sorts verses canonically.
+    Example: John 3:16 (book 43) -> 0x2B0310
+    """
+    if not (0 <= chapter <= 0xFF and 0 <= verse <= 0xFF):
+        raise ValueError(f"Chapter {chapter}, verse {verse} does not fit in a verse ID.")
+    return (book_ordinal << 16) | (chapter << 8) | verse
+
+
+def split_verse_id(verse_id):
+    """Unpacks a verse ID into a (book_ordinal, chapter, verse) tuple."""
+    return verse_id >> 16, (verse_id >> 8) & 0xFF, verse_id & 0xFF
+
+
+def _is_fresh(built, source):
+    """Returns True if the built file exists and is newer than its source."""
+    try:
+        return built.stat().st_mtime >= source.stat().st_mtime
+    except FileNotFoundError:
+        return built.exists()
 
 
 class Verse(BaseModel):
@@ -12,6 +52,24 @@ class Verse(BaseModel):
     text: str
 
 
+class VerseRecord(NamedTuple):
+    """A lightweight, tuple-backed verse for internal hot paths.
+
+    Has the same fields as Verse (plus its verse ID) but skips pydantic
+    validation; use Verse at the API boundary.
+    """
+
+    book: str
+    chapter: int
+    verse: int
+    text: str
+    verse_id: int
+
+    def to_verse(self):
+        """Converts the record to a Verse model."""
+        return Verse(book=self.book, chapter=self.chapter, verse=self.verse, text=self.text)
+
+
 class VerseReference(BaseModel):
     book: str
     chapter: int
@@ -24,20 +82,10 @@ class VerseReference(BaseModel):
         Parses a string in the format "Book Chapter:Verse" and returns a VerseReference object.
         """
 
-        # Split the string into parts.
-        split_s = s.split(" ")
-
-        # Handle the case where the book name has multiple words (e.g., "I Corinthians").
-        # If the book name has more than one word, we need to join them.
-        # The chapter and verse will always be the last part.
-        # Example: "I Corinthians 1:1" -> ["I", "Corinthians", "1:1"]
-
-        if len(split_s) > 2:
-            book = split_s[0] + " " + split_s[1]
-            chapter_verse = split_s[2]
-        else:
-            book = split_s[0]
-            chapter_verse = split_s[1]
+        # The book name may have several words (e.g. "Song of Solomon"), but the
+        # chapter and verse are always the last part.
+        # Example: "I Corinthians 1:1" -> ("I Corinthians", "1:1")
+        book, _, chapter_verse = s.strip().rpartition(" ")
 
         chapter, verse = chapter_verse.split(":")
         return cls(book=book, chapter=int(chapter), verse=int(verse))
@@ -46,20 +94,93 @@ class VerseReference(BaseModel):
 class Bible:
     """Represents a Bible."""
 
-    def __init__(self, fname=None):
+    def __init__(self, fname=None, keep_raw=False):
         if fname is None:
             # Get the directory where this script is located
             current_dir = Path(__file__).parent
             # Look for verses file in the package static directory
             self.fname = current_dir / "static" / "verses-1769.json"
+
+            # Prefer the binary corpus when it has been built and is up to date.
+            if not keep_raw and _is_fresh(DEFAULT_CORPUS, self.fname):
+                self.fname = DEFAULT_CORPUS
         else:
             self.fname = Path(fname)
 
-        # Load the JSON data from the file.
-        with open(self.fname, "r") as f:
-            self.verses = json.load(f)
+        self.raw_verses = None
+
+        if self.fname.suffix == ".kjvc":
+            # Memory-mapped, so the text is shared between worker processes.
+            # It is stored already cleaned, so there is no raw text to keep.
+            if keep_raw:
+                raise ValueError("The binary corpus has no raw text; load the JSON corpus instead.")
+            self.verses = CorpusFile(self.fname)
+        else:
+            # Load the JSON data from the file.
+            with open(self.fname, "r") as f:
+                raw_verses = json.load(f)
+
+            # Clean the text once here rather than on every access.
+            self.verses = {key: clean_verse_text(text) for key, text in raw_verses.items()}
+
+            # The raw text (with paragraph marks and brackets) is only kept on request.
+            if keep_raw:
+                self.raw_verses = raw_verses
+
+        # Build the chapter index once, so lookups never scan the whole corpus.
+        self._build_index()
+
+    def _build_index(self):
+        """Builds the verse ID, book ordinal and book -> chapter indexes."""
+
+        if isinstance(self.verses, CorpusFile):
+            # The binary corpus is already in canonical order.
+            entries = self.verses.iter_entries()
+            self._text_at = self.verses.text_at
+        else:
+            entries = self._json_entries()
+
+        # Example: {"Genesis": {1: [0x10101, 0x10102, ...]}}
+        # Books and chapters keep the order of the source data (canonical order).
+        index = {}
+        books = []
+        positions = {}
+
+        for book, chapter, verse, position in entries:
+            chapters = index.get(book)
+            if chapters is None:
+                chapters = index[book] = {}
+                books.append(book)
+            verse_id = make_verse_id(len(books), chapter, verse)
+            chapters.setdefault(chapter, []).append(verse_id)
+            positions[verse_id] = position
+
+        self._index = index
+        self._books = books
+        self._book_ordinals = {book: ordinal for ordinal, book in enumerate(books, 1)}
+        self._book_keys = {normalize_book_name(book): book for book in books}
+        self._positions = positions
+
+    def _json_entries(self):
+        """Yields (book, chapter, verse, position) for the JSON corpus, in canonical order."""
+
+        by_book = {}
+        for key in self.verses:
+            # The book name may contain spaces (e.g. "Song of Solomon 1:1"),
+            # so split on the last space only.
+            book, _, chapter_verse = key.rpartition(" ")
+            chapter, verse = chapter_verse.split(":")
+            by_book.setdefault(book, []).append((int(chapter), int(verse), key))
+
+        texts = []
+        self._text_at = texts.__getitem__
+
+        for book, verses in by_book.items():
+            verses.sort()
+            for chapter, verse, key in verses:
+                yield book, chapter, verse, len(texts)
+                texts.append(self.verses[key])
 
-    @lru_cache(maxsize=1024)
     def __getitem__(self, verse):
         """Returns the text of the verse."""
 
@@ -72,37 +193,23 @@ class Bible:
     def iter_verses(self):
         """Iterates over the verses in the Bible."""
 
-        for verse in self.verses:
-            verse_ref = VerseReference.from_string(verse)
+        for record in self.iter_verse_records():
+            yield record.to_verse()
 
-            # Remove the leading "# " and brackets from the text.
-            # This is a workaround for the JSON format.
-            # The text is stored as a string with leading "# " and brackets.
-            # Example: "# [In the beginning God created the heaven and the earth.]"
-            text = self.verses[verse]
-            text = text.replace("# ", "").replace("[", "").replace("]", "")
+    def iter_verse_records(self):
+        """Iterates over the verses in the Bible as lightweight VerseRecords."""
 
-            yield Verse(
-                book=verse_ref.book,
-                chapter=verse_ref.chapter,
-                verse=verse_ref.verse,
-                text=text,
-            )
+        text_at = self._text_at
+        positions = self._positions
+
+        for book, chapters in self._index.items():
+            for chapter, verse_ids in chapters.items():
+                for verse_id in verse_ids:
+                    yield VerseRecord(book, chapter, verse_id & 0xFF, text_at(positions[verse_id]), verse_id)
 
-    @lru_cache(maxsize=1)
     def get_books(self):
         """Returns a list of all books in the Bible."""
-        yielded = set()
-        books = []
-
-        for verse in self.verses:
-            verse_ref = VerseReference.from_string(verse)
-            if verse_ref.book in yielded:
-                continue
-            yielded.add(verse_ref.book)
-            books.append(verse_ref.book)
-        
-        return books
+        return list(self._books)
 
     def iter_books(self):
         """Iterates over the books in the Bible."""
@@ -112,17 +219,11 @@ class Bible:
     @lru_cache(maxsize=1)
     def get_chapters(self):
         """Returns a list of all chapters in the Bible."""
-        yielded = set()
-        chapters = []
-
-        for verse in self.verses:
-            verse_ref = VerseReference.from_string(verse)
-            if (verse_ref.book, verse_ref.chapter) in yielded:
-                continue
-            yielded.add((verse_ref.book, verse_ref.chapter))
-            chapters.append((verse_ref.book, verse_ref.chapter))
-        
-        return chapters
+        return [
+            (book, chapter)
+            for book, chapters in self._index.items()
+            for chapter in chapters
+        ]
 
     def iter_chapters(self):
         """Iterates over the chapters in the Bible."""
@@ -131,58 +232,166 @@ class Bible:
 
     def iter_chapters_by_book(self):
         """Iterates over the chapters in the Bible, grouped by book."""
-
-        yielded = set()
-
-        for verse in self.verses:
-            verse_ref = VerseReference.from_string(verse)
-            if (verse_ref.book, verse_ref.chapter) in yielded:
-                continue
-            yielded.add((verse_ref.book, verse_ref.chapter))
-            yield verse_ref.book, verse_ref.chapter
+        for book, chapters in self._index.items():
+            for chapter in chapters:
+                yield book, chapter
 
     def iter_verse_references(self):
         """Iterates over the verse references in the Bible."""
 
-        for verse in self.verses:
-            yield VerseReference.from_string(verse)
+        for book, chapters in self._index.items():
+            for chapter, verse_ids in chapters.items():
+                for verse_id in verse_ids:
+                    yield VerseReference(book=book, chapter=chapter, verse=verse_id & 0xFF)
 
-    @lru_cache(maxsize=256)
     def get_verses_by_book_chapter(self, book, chapter):
-        """Returns a list of verses for a specific book and chapter."""
-        verses = []
-        for verse in self.verses:
-            verse_ref = VerseReference.from_string(verse)
-            if verse_ref.book == book and verse_ref.chapter == chapter:
-                # Clean up the text
-                text = self.verses[verse]
-                text = text.replace("# ", "").replace("[", "").replace("]", "")
-                verses.append(Verse(
-                    book=verse_ref.book,
-                    chapter=verse_ref.chapter,
-                    verse=verse_ref.verse,
-                    text=text,
-                ))
-        return sorted(verses, key=lambda v: v.verse)
-
-    @lru_cache(maxsize=128)
+        """Returns a list of VerseRecords for a specific book and chapter."""
+        return [
+            VerseRecord(book, chapter, verse_id & 0xFF, self._text_at(self._positions[verse_id]), verse_id)
+            for verse_id in self._index.get(book, {}).get(chapter, ())
+        ]
+
     def get_chapters_for_book(self, book):
         """Returns a list of chapter numbers for a specific book."""
-        chapters = set()
-        for verse in self.verses:
-            verse_ref = VerseReference.from_string(verse)
-            if verse_ref.book == book:
-                chapters.add(verse_ref.chapter)
-        return sorted(list(chapters))
+        return sorted(self._index.get(book, ()))
 
-    @lru_cache(maxsize=2048)
     def get_verse_text(self, book, chapter, verse_num):
         """Returns the text for a specific verse."""
-        verse_key = f"{book} {chapter}:{verse_num}"
-        if verse_key in self.verses:
-            text = self.verses[verse_key]
-            return text.replace("# ", "").replace("[", "").replace("]", "")
-        return None
+        verse_id = self.get_verse_id(book, chapter, verse_num)
+        if verse_id is None:
+            return None
+        return self.get_text_by_id(verse_id)
+
+    def book_ordinal(self, book):
+        """Returns the 1-based canonical position of a book, or None."""
+        return self._book_ordinals.get(book)
+
+    def book_name(self, ordinal):
+        """Returns the name of the book at a 1-based canonical position."""
+        return self._books[ordinal - 1]
+
+    def get_verse_id(self, book, chapter, verse_num):
+        """Returns the packed verse ID for a reference, or None if it doesn't exist."""
+        ordinal = self._book_ordinals.get(book)
+        if ordinal is None or not (0 <= chapter <= 0xFF and 0 <= verse_num <= 0xFF):
+            return None
+        verse_id = make_verse_id(ordinal, chapter, verse_num)
+        return verse_id if verse_id in self._positions else None
+
+    def get_text_by_id(self, verse_id):
+        """Returns the text for a verse ID, or None if it doesn't exist."""
+        position = self._positions.get(verse_id)
+        if position is None:
+            return None
+        return self._text_at(position)
+
+    def get_reference(self, verse_id):
+        """Returns the (book, chapter, verse) tuple for a verse ID."""
+        ordinal, chapter, verse = split_verse_id(verse_id)
+        return self._books[ordinal - 1], chapter, verse
+
+    def format_reference(self, verse_id):
+        """Returns the "Book Chapter:Verse" string for a verse ID."""
+        book, chapter, verse = self.get_reference(verse_id)
+        return f"{book} {chapter}:{verse}"
+
+    def iter_verse_ids(self):
+        """Iterates over all verse IDs in canonical (ascending) order."""
+        for chapters in self._index.values():
+            for verse_ids in chapters.values():
+                yield from verse_ids
+
+    def get_verse_ids_by_book_chapter(self, book, chapter):
+        """Returns the ordered verse IDs for a specific book and chapter."""
+        return list(self._index.get(book, {}).get(chapter, ()))
+
+    def resolve_book(self, name):
+        """Returns the book name in this Bible for a name or abbreviation, or None."""
+        book = resolve_book_name(name, self._book_keys)
+        return book if book in self._book_ordinals else None
+
+    @lru_cache(maxsize=4096)
+    def parse_reference(self, text):
+        """Parses a reference like "Eph 2:8-9, 10" into verse ID spans.
+
+        Returns a tuple of (first_id, last_id) spans (both inclusive), or None if
+        the text is not a reference to verses in this Bible. Whole chapters
+        ("Psalm 23") and chapter ranges ("Genesis 1-3") span every verse;
+        an end past the last verse of its chapter is clamped to it.
+        """
+        groups = parse_locations(text)
+        if groups is None:
+            return None
+
+        spans = []
+        for name, locations in groups:
+            book = self.resolve_book(name)
+            if book is None:
+                return None
+
+            chapters = self._index[book]
+            for c1, v1, c2, v2 in locations:
+                if c1 not in chapters or c2 < c1:
+                    return None
+                c2 = min(c2, max(chapters))
+
+                if v1 is None:
+                    first = chapters[c1][0]
+                else:
+                    first = self.get_verse_id(book, c1, v1)
+                    if first is None:
+                        return None
+
+                last_verses = chapters.get(c2)
+                if last_verses is None:
+                    return None
+                if v2 is None or v2 > last_verses[-1] & 0xFF:
+                    last = last_verses[-1]
+                else:
+                    last = self.get_verse_id(book, c2, v2)
+
+                if last is None or last < first:
+                    return None
+                spans.append((first, last))
+
+        return tuple(spans)
+
+    def get_books_span(self, first_book, last_book=None, first_chapter=None, last_chapter=None):
+        """Returns the (first_id, last_id) span of a run of books, or of chapters in a book.
+
+        Like the spans from parse_reference(), but the ends need not be
+        existing verses. Returns None for an unknown book or a backwards range.
+        """
+        first = self._book_ordinals.get(first_book)
+        last = self._book_ordinals.get(last_book or first_book)
+        if first is None or last is None or first > last:
+            return None
+
+        first_chapter = 0 if first_chapter is None else first_chapter
+        last_chapter = 0xFF if last_chapter is None else last_chapter
+        if not (0 <= first_chapter <= last_chapter <= 0xFF):
+            return None
+        return make_verse_id(first, first_chapter, 0), make_verse_id(last, last_chapter, 0xFF)
+
+    def iter_verse_ids_in_spans(self, spans):
+        """Iterates over the existing verse IDs in (first_id, last_id) spans, in order."""
+        for first, last in spans:
+            book = self._books[(first >> 16) - 1]
+            first_chapter, last_chapter = (first >> 8) & 0xFF, (last >> 8) & 0xFF
+            for chapter, verse_ids in self._index[book].items():
+                if first_chapter <= chapter <= last_chapter:
+                    for verse_id in verse_ids:
+                        if first <= verse_id <= last:
+                            yield verse_id
+
+    def get_raw_verse_text(self, book, chapter, verse_num):
+        """Returns the uncleaned source text for a specific verse.
+
+        Requires the Bible to be loaded with keep_raw=True.
+        """
+        if self.raw_verses is None:
+            raise ValueError("Raw verse text was not kept; load the Bible with keep_raw=True.")
+        return self.raw_verses.get(f"{book} {chapter}:{verse_num}")
 
     @lru_cache(maxsize=1)
     def get_verse_count(self):
@@ -190,8 +399,53 @@ class Bible:
         return len(self.verses)
 
 
-# Create an instance of the Bible class.
-bible = Bible()
+class LazyBible:
+    """A Bible that is only loaded on first use.
+
+    Loading the corpus takes a noticeable part of a cold start, so importing
+    this module must not do it. The first attribute access loads the Bible,
+    or warm_in_background() can start loading it while the server starts up.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._args = args
+        self._kwargs = kwargs
+        self._bible = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def load(self):
+        """Loads the Bible (once) and returns it."""
+        if self._bible is None:
+            with self._lock:
+                if self._bible is None:
+                    self._bible = Bible(*self._args, **self._kwargs)
+                    self._ready.set()
+        return self._bible
+
+    def warm_in_background(self):
+        """Starts loading the Bible in a daemon thread and returns the thread."""
+        thread = threading.Thread(target=self.load, name="bible-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def is_ready(self):
+        """Returns True once the Bible has been loaded."""
+        return self._ready.is_set()
+
+    def wait_until_ready(self, timeout=None):
+        """Blocks until the Bible is loaded; returns False if the timeout expired."""
+        return self._ready.wait(timeout)
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __getitem__(self, verse):
+        return self.load()[verse]
+
+
+# The shared Bible instance; the corpus is loaded on first use.
+bible = LazyBible()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,236 @@
+"""Bible reference parsing: book names, abbreviations, ranges and lists.
+
+Understands references such as:
+
+    John 3:16               a single verse
+    Ephesians 2:8-9         a verse range
+    John 3:16-4:2           a range across chapters
+    Romans 3:23, 6:23       a list (bare numbers after a verse continue the chapter)
+    John 3:16; Rom 5:8      a list across books
+    Psalm 23, 1 Cor 13      whole chapters
+    Jn 3:16, I Cor. 13:4    abbreviations and Roman numeral prefixes
+
+Parsing is split in two: parse_locations() turns the text into book names
+and (chapter, verse) bounds, and Bible.parse_reference() resolves those
+against the corpus into verse ID spans.
+"""
+
+import re
+
+# Canonical book names (as used in the corpus) and their common abbreviations.
+BOOK_ABBREVIATIONS = {
+    "Genesis": ["gen", "ge", "gn"],
+    "Exodus": ["exod", "exo", "ex"],
+    "Leviticus": ["lev", "le", "lv"],
+    "Numbers": ["num", "nu", "nm", "nb"],
+    "Deuteronomy": ["deut", "de", "dt"],
+    "Joshua": ["josh", "jos", "jsh"],
+    "Judges": ["judg", "jdg", "jg", "jdgs"],
+    "Ruth": ["rth", "ru"],
+    "1 Samuel": ["1sam", "1sa", "1sm"],
+    "2 Samuel": ["2sam", "2sa", "2sm"],
+    "1 Kings": ["1kgs", "1ki", "1kin"],
+    "2 Kings": ["2kgs", "2ki", "2kin"],
+    "1 Chronicles": ["1chron", "1chr", "1ch"],
+    "2 Chronicles": ["2chron", "2chr", "2ch"],
+    "Ezra": ["ezr"],
+    "Nehemiah": ["neh", "ne"],
+    "Esther": ["esth", "est", "es"],
+    "Job": ["jb"],
+    "Psalms": ["psalm", "ps", "psa", "psm", "pss"],
+    "Proverbs": ["prov", "pro", "prv", "pr"],
+    "Ecclesiastes": ["eccles", "eccl", "ecc", "ec", "qoh"],
+    "Song of Solomon": ["song", "songofsongs", "sos", "so", "canticles", "cant"],
+    "Isaiah": ["isa", "is"],
+    "Jeremiah": ["jer", "je", "jr"],
+    "Lamentations": ["lam", "la"],
+    "Ezekiel": ["ezek", "eze", "ezk"],
+    "Daniel": ["dan", "da", "dn"],
+    "Hosea": ["hos", "ho"],
+    "Joel": ["jl"],
+    "Amos": ["am"],
+    "Obadiah": ["obad", "ob"],
+    "Jonah": ["jnh", "jon"],
+    "Micah": ["mic", "mc"],
+    "Nahum": ["nah", "na"],
+    "Habakkuk": ["hab", "hb"],
+    "Zephaniah": ["zeph", "zep", "zp"],
+    "Haggai": ["hag", "hg"],
+    "Zechariah": ["zech", "zec", "zc"],
+    "Malachi": ["mal", "ml"],
+    "Matthew": ["matt", "mat", "mt"],
+    "Mark": ["mrk", "mar", "mk", "mr"],
+    "Luke": ["luk", "lk"],
+    "John": ["joh", "jhn", "jn"],
+    "Acts": ["act", "ac"],
+    "Romans": ["rom", "ro", "rm"],
+    "1 Corinthians": ["1cor", "1co"],
+    "2 Corinthians": ["2cor", "2co"],
+    "Galatians": ["gal", "ga"],
+    "Ephesians": ["eph", "ephes"],
+    "Philippians": ["phil", "php", "pp"],
+    "Colossians": ["col", "co"],
+    "1 Thessalonians": ["1thess", "1thes", "1th"],
+    "2 Thessalonians": ["2thess", "2thes", "2th"],
+    "1 Timothy": ["1tim", "1ti"],
+    "2 Timothy": ["2tim", "2ti"],
+    "Titus": ["tit", "ti"],
+    "Philemon": ["philem", "phm", "pm"],
+    "Hebrews": ["heb"],
+    "James": ["jas", "jm"],
+    "1 Peter": ["1pet", "1pe", "1pt", "1p"],
+    "2 Peter": ["2pet", "2pe", "2pt", "2p"],
+    "1 John": ["1jn", "1jhn", "1joh", "1jo"],
+    "2 John": ["2jn", "2jhn", "2joh", "2jo"],
+    "3 John": ["3jn", "3jhn", "3joh", "3jo"],
+    "Jude": ["jud", "jd"],
+    "Revelation": ["rev", "re", "revelations", "theapocalypse", "apocalypse"],
+}
+
+# Book-number prefixes that are written out or in Roman numerals.
+_NUMBER_PREFIX = re.compile(r"^(iii|ii|i|first|second|third|1st|2nd|3rd)\s+")
+_NUMBER_WORDS = {
+    "i": "1", "ii": "2", "iii": "3",
+    "first": "1", "second": "2", "third": "3",
+    "1st": "1", "2nd": "2", "3rd": "3",
+}
+
+# Longer text is not taken for a reference, so a long query is never parsed.
+MAX_REFERENCE_LENGTH = 200
+
+# A book name as written, which may start with a number ("1 Cor", "I Cor"): words
+# joined by spaces or dots ("Song of Solomon", "S. of S."). A word must start
+# with a letter, so where the book ends and a chapter number starts is
+# unambiguous and matching does not backtrack over the spaces between them.
+BOOK_NAME_PATTERN = r"(?:[1-3]|i{1,3}|first|second|third)?\s*[a-z][a-z']*(?:(?:\s*\.\s*|\s+)[a-z][a-z']*)*"
+
+# "<book> <location>".
+REFERENCE_PATTERN = re.compile(
+    r"""
+    ^
+    (?P<book>""" + BOOK_NAME_PATTERN + r""")
+    (?:\s*\.)?\s*
+    (?P<location>\d+(?:\s*[:.]\s*\d+)?(?:\s*[-–]\s*\d+(?:\s*[:.]\s*\d+)?)?)
+    $
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# One location: "3", "3:16", "3:16-18", "3:16-4:2" or "3-4".
+LOCATION_PATTERN = re.compile(
+    r"^(?P<c1>\d+)(?:[:.](?P<v1>\d+))?(?:[-–](?P<c2>\d+)(?:[:.](?P<v2>\d+))?)?$"
+)
+
+# List separators, kept in the split so "," and ";" can be told apart.
+SEPARATOR_PATTERN = re.compile(r"([;,])")
+
+
+def normalize_book_name(name):
+    """Returns the lookup key for a book name: lowercase, no dots or spaces, Arabic prefix."""
+    key = name.strip().lower().replace(".", " ")
+    key = _NUMBER_PREFIX.sub(lambda m: _NUMBER_WORDS[m.group(1)], key)
+    return re.sub(r"[\s']+", "", key)
+
+
+_BOOK_KEYS = {}
+for _book, _abbreviations in BOOK_ABBREVIATIONS.items():
+    _BOOK_KEYS[normalize_book_name(_book)] = _book
+    for _abbreviation in _abbreviations:
+        _BOOK_KEYS.setdefault(_abbreviation, _book)
+
+
+def resolve_book_name(name, books=None):
+    """Returns the canonical book name for a name or abbreviation, or None.
+
+    books, if given, is a {normalized key: book} dict of the corpus' own
+    names, which takes precedence. Unknown names fall back to a unique prefix
+    of a canonical name ("Deut" -> "Deuteronomy").
+    """
+    key = normalize_book_name(name)
+    if not key:
+        return None
+
+    if books and key in books:
+        return books[key]
+    if key in _BOOK_KEYS:
+        return _BOOK_KEYS[key]
+
+    if len(key) >= 3:
+        candidates = {book for book_key, book in _BOOK_KEYS.items() if book_key.startswith(key)}
+        if len(candidates) == 1:
+            return candidates.pop()
+
+    return None
+
+
+def parse_locations(text):
+    """Splits a reference into [(book name, [(c1, v1, c2, v2), ...]), ...].
+
+    The book name is returned as written. Missing verses are None: a whole
+    chapter is (c, None, c, None) and a chapter range is (c1, None, c2, None).
+    Returns None if the text is not a reference (or is longer than
+    MAX_REFERENCE_LENGTH).
+    """
+    if len(text) > MAX_REFERENCE_LENGTH:
+        return None
+
+    groups = []
+    book = None
+    chapter = None  # Set after a "C:V" item, so a bare number after "," is a verse.
+    separator = None
+
+    for piece in SEPARATOR_PATTERN.split(text):
+        piece = piece.strip()
+        if piece in (",", ";"):
+            separator = piece
+            continue
+        if not piece:
+            continue
+
+        match = REFERENCE_PATTERN.match(piece)
+        if match:
+            book = match.group("book").strip()
+            location = match.group("location")
+            chapter = None
+            groups.append((book, []))
+        elif book is not None and piece[0].isdigit():
+            # "Romans 3:23, 6:23" or "John 3:16; 4:2" continue the previous book,
+            # but after ";" a bare number is a chapter again.
+            location = piece
+            if separator == ";":
+                chapter = None
+        else:
+            return None
+
+        span = _parse_location(location, chapter)
+        if span is None:
+            return None
+        groups[-1][1].append(span)
+
+        c1, v1, c2, v2 = span
+        chapter = c2 if v2 is not None else None
+
+    return groups or None
+
+
+def _parse_location(location, chapter):
+    """Parses one location into (c1, v1, c2, v2); chapter is the current chapter, if any."""
+    match = LOCATION_PATTERN.match(re.sub(r"\s+", "", location))
+    if match is None:
+        return None
+
+    c1, v1, c2, v2 = (int(g) if g else None for g in match.group("c1", "v1", "c2", "v2"))
+
+    if v1 is None and chapter is not None:
+        # "Romans 3:23, 25" or "Romans 3:23, 25-26": verses in the current chapter.
+        c1, v1 = chapter, c1
+        if c2 is not None:
+            c2, v2 = chapter, c2
+    elif v1 is not None and c2 is not None and v2 is None:
+        # "Ephesians 2:8-9": a verse range within the chapter.
+        c2, v2 = c1, c2
+
+    if c2 is None:
+        c2, v2 = c1, v1
+
+    return c1, v1, c2, v2
@@ -0,0 +1,835 @@
+"""Full-text search index over the Bible.
+
+The index is built once from the corpus: every verse is tokenized and each
+token maps to a sorted posting list of verse IDs. A query term matches every
+vocabulary word it is a prefix of ("love" matches "loved" and "loveth"),
+and multi-term queries are answered by intersecting posting lists.
+
+Each verse's token sequence is also kept as an array of word numbers (a
+positional index), so quoted phrases ("kingdom of heaven") and proximity
+operators (faith NEAR/3 works) are checked on the candidate verses without
+rescanning their text.
+
+Words are also grouped by their base form when the index is built (see
+stemming.py), so "believeth" finds "believing" as well as "believed".
+
+Query words that match nothing are treated as typos: a trigram index over the
+vocabulary narrows the candidates to words sharing most of their trigrams, and
+only those are checked with a bounded edit distance ("Melchisedek" ->
+"melchisedec").
+
+Query words may contain * and ? wildcards (bless*, b?rn), matched against the
+vocabulary, and a query written as /regex/ is matched against the verse text
+itself: only verses containing the words its literal parts require are
+scanned. Patterns are capped in length, in the number and placement of their
+repeats and in their combinations of alternatives, so matching one verse (or
+highlighting it) backtracks at most polynomially; a time budget, checked
+between verses, bounds the whole scan.
+
+A search can be scoped to (first_id, last_id) verse ID spans, such as a book,
+a run of books or a testament; the rarest posting list is cut down to the
+spans first, so a scoped search does less work than an unscoped one.
+
+Matches are ranked with BM25, from per-word document frequencies, term
+frequencies and verse lengths that are all computed when the index is built.
+"""
+
+import math
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+from .kjv import bible
+from .stemming import normalize_word
+
+# Words, keeping inner apostrophes ("LORD'S" -> "lord's").
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)*")
+
+
+# Quoted phrases, NEAR/n operators and plain words.
+QUERY_PATTERN = re.compile(r'"([^"]*)"?|\bNEAR(?:/(\d+))?\b|([^\s"]+)')
+
+# Words apart allowed by a NEAR without an explicit distance.
+DEFAULT_NEAR_DISTANCE = 5
+
+# BM25 parameters: term frequency saturation and verse length normalization.
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Wildcard query words: * is any number of letters, ? is one letter.
+WILDCARD_TERM_PATTERN = re.compile(r"[a-z0-9'*?]*[*?][a-z0-9'*?]*")
+
+# A regular expression query: /pattern/.
+REGEX_QUERY_PATTERN = re.compile(r"^/(.+)/$", re.DOTALL)
+
+# Limits on /regex/ queries.
+MAX_PATTERN_LENGTH = 100
+MAX_PATTERN_REPEATS = 2
+# Combinations of alternatives and optional parts: "(a|b)c?" has 4. Each
+# variable repeat multiplies the work per verse, so it counts as REPEAT_WAYS.
+MAX_PATTERN_WAYS = 16
+REPEAT_WAYS = 4
+REGEX_TIME_BUDGET = 0.5  # seconds
+
+# Corrections kept for a misspelled query word (the closest, most frequent ones).
+FUZZY_LIMIT = 5
+
+
+def tokenize(text):
+    """Returns the lowercase word tokens of a text."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def max_edits(word):
+    """Returns the number of typos tolerated in a word of this length."""
+    if len(word) < 4:
+        return 0
+    return 1 if len(word) < 8 else 2
+
+
+def trigrams(word):
+    """Returns the set of trigrams of a word, padded to mark its start and end."""
+    padded = f"^{word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Returns the edit distance (with transpositions) of a and b, or limit + 1 if it is more than limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous = None
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        before, previous, row = previous, row, [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            row[j] = min(previous[j] + 1, row[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                row[j] = min(row[j], before[j - 2] + 1)
+        if min(row) > limit:
+            return limit + 1
+    return min(row[-1], limit + 1)
+
+
+class SearchPatternError(ValueError):
+    """A regex or wildcard query that is invalid, too complex or too slow."""
+
+
+def is_wildcard(term):
+    """Returns True if a query term contains * or ? wildcards."""
+    return "*" in term or "?" in term
+
+
+def wildcard_regex(term):
+    """Translates a wildcard term ("b?rn*") into a regex for whole words."""
+    return "".join(
+        "[a-z0-9']*" if c == "*" else "[a-z0-9']" if c == "?" else re.escape(c)
+        for c in term
+    )
+
+
+# A {m}, {m,}, {,n} or {m,n} repeat; any other brace is a literal.
+BRACE_REPEAT_PATTERN = re.compile(r"\{(\d*)(?:(,)(\d*))?\}")
+
+# Escapes that match an empty string at a position, such as a word boundary.
+ZERO_WIDTH_ESCAPES = "bBAZ"
+
+# Escapes followed by a fixed number of hex digits (\x41, \u0041, \U00000041).
+HEX_ESCAPE_DIGITS = {"x": 2, "u": 4, "U": 8}
+
+
+def _pattern_tokens(pattern):
+    r"""Splits a regex into (kind, value) tokens, for checking its structure.
+
+    Kinds are "literal" (one character), "atom" (anything else matching one
+    character: ".", a class or an escape such as \w), "anchor" (zero-width),
+    "open" (value "group" or "lookaround"), "close", "branch" (|) and
+    "repeat" (value (min, max), max None when unbounded). The pattern must
+    already compile. Raises SearchPatternError for backreferences.
+    """
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        i += 1
+
+        if c == "\\":
+            c = pattern[i]
+            i += 1
+            if c in "123456789":
+                raise SearchPatternError("Backreferences are not supported.")
+            if c in ZERO_WIDTH_ESCAPES:
+                yield "anchor", c
+            elif c in HEX_ESCAPE_DIGITS:
+                i += HEX_ESCAPE_DIGITS[c]
+                yield "atom", c
+            elif c == "N":
+                i = pattern.index("}", i) + 1
+                yield "atom", c
+            elif c == "0":
+                # Up to two more octal digits: \0, \07, \012.
+                end = min(i + 2, len(pattern))
+                while i < end and pattern[i] in "01234567":
+                    i += 1
+                yield "atom", c
+            elif c.isalnum():
+                yield "atom", c
+            else:
+                yield "literal", c
+
+        elif c == "[":
+            # A "]" right after "[" or "[^" is part of the class.
+            if pattern[i] == "^":
+                i += 1
+            if pattern[i] == "]":
+                i += 1
+            while pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+            yield "atom", "["
+
+        elif c == "(":
+            if not pattern.startswith("?", i):
+                yield "open", "group"
+            elif pattern.startswith(("?P=", "?("), i):
+                raise SearchPatternError("Backreferences are not supported.")
+            elif pattern.startswith("?#", i):
+                i = pattern.index(")", i) + 1
+            elif pattern.startswith(("?=", "?!"), i):
+                i += 2
+                yield "open", "lookaround"
+            elif pattern.startswith(("?<=", "?<!"), i):
+                i += 3
+                yield "open", "lookaround"
+            else:
+                # Named, atomic and scoped-flag groups, or global flags: (?i).
+                end = i + 1
+                while pattern[end] not in ":)>":
+                    end += 1
+                if pattern[end] == ")":
+                    i = end + 1
+                else:
+                    i = pattern.index(">", i) + 1 if pattern.startswith("?P<", i) else end + 1
+                    yield "open", "group"
+
+        elif c == ")":
+            yield "close", None
+        elif c == "|":
+            yield "branch", None
+        elif c in "^$":
+            yield "anchor", c
+
+        elif c in "*+?{":
+            match = BRACE_REPEAT_PATTERN.match(pattern, i - 1) if c == "{" else None
+            if c == "{" and not (match and (match.group(1) or match.group(2))):
+                yield "literal", c
+                continue
+            if c == "{":
+                low, comma, high = match.groups()
+                i = match.end()
+                low = int(low or 0)
+                high = None if comma and not high else int(high) if comma else low
+            else:
+                low, high = {"*": (0, None), "+": (1, None), "?": (0, 1)}[c]
+            # Lazy (*?) and possessive (*+) forms repeat the same way.
+            if i < len(pattern) and pattern[i] in "?+":
+                i += 1
+            yield "repeat", (low, high)
+
+        elif c == ".":
+            yield "atom", c
+        else:
+            yield "literal", c
+
+
+class _PatternGroup:
+    """What compile_search_regex() tracks about a group (or the whole pattern) while scanning it."""
+
+    def __init__(self, kind, open_repeat):
+        self.kind = kind
+        # open_repeat on entry, and at the end of earlier alternatives.
+        self.entry_open_repeat = open_repeat
+        self.ended_open_repeat = False
+        # Whether it holds repeats (including optional parts) or alternations.
+        self.has_repeat = False
+        self.has_branch = False
+        # Ways to match it: summed over earlier alternatives, and the product
+        # of its items' ways in the current one.
+        self.ways_before = 0
+        self.ways = 1
+
+
+def compile_search_regex(pattern):
+    """Compiles a /regex/ query (case-insensitively) after checking its limits.
+
+    Raises SearchPatternError for patterns that are too long or use
+    backreferences. It also rejects patterns whose matching can backtrack
+    more than polynomially in the verse length: those with more than
+    MAX_PATTERN_REPEATS variable repeats (*, +, {m,n}), two variable repeats
+    with nothing required between them (.*.*), any repeat of a group that
+    holds a repeat or optional part ((a+)+, (?:.?){20}), and those with more
+    than MAX_PATTERN_WAYS combinations of alternatives and optional parts,
+    counting each variable repeat as REPEAT_WAYS.
+    A single verse is matched without interruption, so these limits, not
+    the time budget, are what bound it.
+    """
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise SearchPatternError(f"Patterns are limited to {MAX_PATTERN_LENGTH} characters.")
+    try:
+        regex = re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        raise SearchPatternError(f"Invalid pattern: {e}") from None
+    if regex.flags & re.VERBOSE:
+        raise SearchPatternError("Verbose patterns are not supported.")
+
+    def check_ways(ways):
+        if ways > MAX_PATTERN_WAYS:
+            raise SearchPatternError("The pattern has too many alternatives, optional parts and repetitions.")
+
+    repeats = 0
+    # Whether the pattern can end in a variable repeat at this point, with
+    # nothing required after it.
+    open_repeat = False
+    groups = [_PatternGroup("pattern", False)]
+    # The last item, for a repeat that follows it: open_repeat before it, and
+    # whether it is a group holding repeats or alternations, and its ways.
+    item = None
+
+    for kind, value in _pattern_tokens(pattern):
+        group = groups[-1]
+        if kind in ("literal", "atom"):
+            item = (open_repeat, False, False, 1)
+            open_repeat = False
+        elif kind == "anchor":
+            item = None
+        elif kind == "open":
+            groups.append(_PatternGroup(value, open_repeat))
+            if value == "lookaround":
+                open_repeat = False
+            item = None
+        elif kind == "branch":
+            # The next alternative starts where the group (or pattern) does.
+            group.ended_open_repeat |= open_repeat
+            group.has_branch = True
+            group.ways_before += group.ways
+            group.ways = 1
+            open_repeat = group.entry_open_repeat if group.kind == "group" else False
+            item = None
+        elif kind == "close":
+            groups.pop()
+            parent = groups[-1]
+            ways = group.ways_before + group.ways
+            parent.ways *= ways
+            check_ways(parent.ways)
+            parent.has_repeat |= group.has_repeat
+            parent.has_branch |= group.has_branch
+            if group.kind == "lookaround":
+                # Zero-width: it neither requires text nor ends in a repeat.
+                open_repeat = group.entry_open_repeat
+                item = None
+            else:
+                open_repeat |= group.ended_open_repeat
+                item = (group.entry_open_repeat, group.has_repeat, group.has_branch, ways)
+        elif kind == "repeat":
+            low, high = value
+            if item is None or low == high == 1:
+                continue
+            before, has_repeat, has_branch, ways = item
+            item = None
+            if has_repeat:
+                raise SearchPatternError("Repetitions inside a repetition are not supported.")
+
+            if high == low:
+                # Fixed-count: x{3} matches one way for each way x does.
+                group.ways = group.ways // ways * ways ** low
+                check_ways(group.ways)
+                if low == 0:
+                    open_repeat = before
+            elif high == 1:
+                # Optional: x? adds a way to match, but nothing to require.
+                group.ways = group.ways // ways * (ways + 1)
+                check_ways(group.ways)
+                group.has_repeat = True
+                open_repeat |= before
+            else:
+                if has_branch:
+                    raise SearchPatternError("Alternatives inside a repetition are not supported.")
+                if before:
+                    raise SearchPatternError("Repetitions must be separated by text the pattern requires.")
+                repeats += 1
+                if repeats > MAX_PATTERN_REPEATS:
+                    raise SearchPatternError(f"Patterns are limited to {MAX_PATTERN_REPEATS} repetitions.")
+                group.has_repeat = True
+                open_repeat = True
+
+    check_ways((groups[0].ways_before + groups[0].ways) * REPEAT_WAYS ** repeats)
+    return regex
+
+
+def required_words(pattern):
+    """Returns the word fragments every match of a regex must contain.
+
+    These are the words (of 3 letters or more) in runs of literal characters
+    at the top level of the pattern, not inside groups, alternations or
+    optional parts.
+    """
+    tokens = list(_pattern_tokens(pattern))
+    depth = 0
+    runs = [[]]
+    for kind, value in tokens:
+        if kind == "branch" and depth == 0:
+            return []
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+        elif kind == "literal" and depth == 0:
+            runs[-1].append(value)
+            continue
+        elif kind == "repeat" and depth == 0 and runs[-1]:
+            # The repeated character is not required as written.
+            runs[-1].pop()
+        runs.append([])
+    return [word for run in runs for word in tokenize("".join(run)) if len(word) >= 3]
+
+
+class Operand(NamedTuple):
+    """A query word (matched as a prefix) or a quoted phrase (matched exactly)."""
+
+    words: Tuple[str, ...]
+    phrase: bool
+
+
+class ParsedQuery(NamedTuple):
+    """A search query split into its words, phrases and proximity constraints (or a regex)."""
+
+    operands: List[Operand]
+    near: List[Tuple[Operand, Operand, int]]
+    regex: Optional[re.Pattern] = None
+
+    @property
+    def words(self):
+        """All the words of the query, e.g. for scoring and highlighting."""
+        return [word for operand in self.operands for word in operand.words]
+
+
+def parse_query(query):
+    """Parses a query such as '"kingdom of heaven" faith NEAR/3 works'.
+
+    Every operand must match. "a NEAR/n b" also requires a and b to be at
+    most n words apart (in either order). A query written as /pattern/ is a
+    regular expression; an invalid or too complex one raises
+    SearchPatternError.
+    """
+    regex = REGEX_QUERY_PATTERN.match(query.strip())
+    if regex:
+        return ParsedQuery([], [], compile_search_regex(regex.group(1)))
+
+    operands = []
+    near = []
+    near_distance = None
+
+    for match in QUERY_PATTERN.finditer(query):
+        phrase, distance, word = match.groups()
+
+        if phrase is None and word is None:
+            # A NEAR operator links the previous operand to the next one.
+            if operands:
+                near_distance = int(distance) if distance else DEFAULT_NEAR_DISTANCE
+            continue
+
+        if phrase is None and WILDCARD_TERM_PATTERN.fullmatch(word.lower()):
+            # Wildcard words need at least one letter ("*" alone would match everything).
+            words = (word.lower(),) if TOKEN_PATTERN.search(word.lower()) else ()
+        else:
+            words = tuple(tokenize(phrase if phrase is not None else word))
+        if not words:
+            continue
+
+        operand = Operand(words, phrase is not None or len(words) > 1)
+        if near_distance is not None:
+            near.append((operands[-1], operand, near_distance))
+            near_distance = None
+        operands.append(operand)
+
+    return ParsedQuery(operands, near)
+
+
+def _intersect(a, b):
+    """Intersects two sorted verse ID sequences into a sorted list."""
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return []
+
+    # Probing the longer list is cheaper when the shorter one is much shorter.
+    if len(a) * 8 < len(b):
+        result = []
+        lo, hi = 0, len(b)
+        for verse_id in a:
+            lo = bisect_left(b, verse_id, lo, hi)
+            if lo == hi:
+                break
+            if b[lo] == verse_id:
+                result.append(verse_id)
+        return result
+
+    return sorted(set(a).intersection(b))
+
+
+def restrict_to_spans(verse_ids, spans):
+    """Returns the sorted verse IDs that fall in sorted, disjoint (first_id, last_id) spans."""
+    result = []
+    for first, last in spans:
+        start = bisect_left(verse_ids, first)
+        end = bisect_right(verse_ids, last, start)
+        result.extend(verse_ids[start:end])
+    return result
+
+
+def intersect_spans(a, b):
+    """Intersects two lists of sorted, disjoint (first_id, last_id) spans."""
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        first, last = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+        if first <= last:
+            result.append((first, last))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+class SearchIndex:
+    """An inverted index of the words in a Bible."""
+
+    def __init__(self, bible):
+        self.bible = bible
+
+        postings = {}
+        frequencies = {}
+        verse_tokens = {}
+        for record in bible.iter_verse_records():
+            tokens = tokenize(record.text)
+            verse_tokens[record.verse_id] = tokens
+
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+
+            for token, count in counts.items():
+                ids = postings.get(token)
+                if ids is None:
+                    ids = postings[token] = array("I")
+                    frequencies[token] = array("B")
+                # Verses are visited in ID order, so every list stays sorted.
+                ids.append(record.verse_id)
+                frequencies[token].append(min(count, 0xFF))
+
+        self.postings = postings
+        self.verse_ids = array("I", verse_tokens)
+        # Term frequencies, parallel to the posting lists.
+        self.frequencies = frequencies
+        self.vocabulary = sorted(postings)
+
+        # Collection statistics for BM25.
+        self.verse_count = len(verse_tokens)
+        self.average_length = sum(map(len, verse_tokens.values())) / max(self.verse_count, 1)
+
+        # Positional index: each verse as the packed bytes of an array of word
+        # numbers, so a phrase can be found with one bytes.find().
+        self.word_numbers = {word: number for number, word in enumerate(self.vocabulary)}
+        self.typecode = "H" if len(self.vocabulary) <= 0xFFFF else "I"
+        self.itemsize = array(self.typecode).itemsize
+        self.verse_words = {
+            verse_id: array(self.typecode, [self.word_numbers[token] for token in tokens]).tobytes()
+            for verse_id, tokens in verse_tokens.items()
+        }
+
+        # Inflections of each base form ("love" -> love, loved, loveth, loving, ...).
+        self.forms = {}
+        for word in self.vocabulary:
+            self.forms.setdefault(normalize_word(word, self.word_numbers), []).append(word)
+
+        # Trigram index over the vocabulary, for typo-tolerant matching.
+        self.trigrams = {}
+        for number, word in enumerate(self.vocabulary):
+            for gram in trigrams(word):
+                self.trigrams.setdefault(gram, array("I")).append(number)
+
+    def expand_prefix(self, prefix):
+        """Returns the vocabulary words that start with prefix."""
+        start = bisect_left(self.vocabulary, prefix)
+        end = bisect_left(self.vocabulary, prefix + "\uffff", start)
+        return self.vocabulary[start:end]
+
+    @lru_cache(maxsize=1024)
+    def fuzzy_words(self, word):
+        """Returns the closest vocabulary words to a misspelled word, most frequent first."""
+        limit = max_edits(word)
+        if not limit:
+            return ()
+
+        # An edit changes at most 4 trigrams, so closer words share the rest.
+        grams = trigrams(word)
+        counts = Counter()
+        for gram in grams:
+            counts.update(self.trigrams.get(gram, ()))
+        threshold = max(len(grams) - 4 * limit, 1)
+
+        matches = []
+        for number, count in counts.items():
+            if count < threshold:
+                continue
+            candidate = self.vocabulary[number]
+            distance = edit_distance(word, candidate, limit)
+            if distance <= limit:
+                matches.append((distance, -len(self.postings[candidate]), candidate))
+
+        if not matches:
+            return ()
+        closest = min(matches)[0]
+        return tuple(candidate for distance, _, candidate in sorted(matches) if distance == closest)[:FUZZY_LIMIT]
+
+    def word_forms(self, word):
+        """Returns the vocabulary words with the same base form as word."""
+        return self.forms.get(normalize_word(word, self.word_numbers), ())
+
+    @lru_cache(maxsize=1024)
+    def matching_words(self, term):
+        """Returns the vocabulary words a query term matches.
+
+        These are the words it is a prefix of and the other forms of the same
+        word, or else (for a misspelled term) its closest corrections. A
+        wildcard term matches the words that fit it.
+        """
+        if is_wildcard(term):
+            # Only words starting with the part before the first wildcard can fit.
+            prefix = term[:min(i for i in (term.find("*"), term.find("?")) if i != -1)]
+            pattern = re.compile(wildcard_regex(term))
+            return [word for word in self.expand_prefix(prefix) if pattern.fullmatch(word)]
+
+        words = self.expand_prefix(term)
+        forms = [word for word in self.word_forms(term) if not word.startswith(term)]
+        return words + forms or list(self.fuzzy_words(term))
+
+    def highlight_pattern(self, query):
+        """Compiles what a ParsedQuery matches into one case-insensitive regex, or None.
+
+        Phrases come first in the alternation, so a phrase is marked as a
+        whole rather than word by word; every alternative matches whole words
+        only, so one pass over a verse never marks a term inside another.
+        """
+        if query.regex is not None:
+            return query.regex
+
+        phrases = []
+        words = []
+        for operand in query.operands:
+            if operand.phrase:
+                phrases.append(r"\W+".join(map(re.escape, operand.words)))
+                continue
+
+            # Prefix expansions as a pattern, other forms and corrections as words.
+            term = operand.words[0]
+            if is_wildcard(term):
+                words.append(wildcard_regex(term))
+            elif self.expand_prefix(term):
+                words.append(re.escape(term) + r"[a-z0-9]*(?:'[a-z0-9]+)*")
+            words.extend(re.escape(word) for word in self.matching_words(term) if not word.startswith(term))
+
+        if not (phrases or words):
+            return None
+        return re.compile(r"\b(?:" + "|".join(phrases + words) + r")(?![a-z0-9])", re.IGNORECASE)
+
+    def term_postings(self, term):
+        """Returns the sorted verse IDs of verses with a word term matches."""
+        return self.term_stats(term)[0]
+
+    @lru_cache(maxsize=1024)
+    def term_stats(self, term):
+        """Returns (verse IDs, term frequencies) for the words term matches."""
+        words = self.matching_words(term)
+        if len(words) == 1:
+            return self.postings[words[0]], self.frequencies[words[0]]
+
+        merged = {}
+        for word in words:
+            for verse_id, count in zip(self.postings[word], self.frequencies[word]):
+                merged[verse_id] = merged.get(verse_id, 0) + count
+
+        verse_ids = sorted(merged)
+        return array("I", verse_ids), array("B", [min(merged[verse_id], 0xFF) for verse_id in verse_ids])
+
+    def word_stats(self, word):
+        """Returns (verse IDs, term frequencies) for exactly one word."""
+        return self.postings.get(word, ()), self.frequencies.get(word, ())
+
+    def verse_length(self, verse_id):
+        """Returns the number of words in a verse."""
+        return len(self.verse_words[verse_id]) // self.itemsize
+
+    def score_matches(self, query, verse_ids):
+        """Yields (BM25 score, verse_id) for each matching verse ID."""
+        # Per-term statistics are looked up once per query, not per verse.
+        terms = []
+        for operand in query.operands:
+            if operand.phrase:
+                stats = [self.word_stats(word) for word in operand.words]
+            else:
+                stats = [self.term_stats(operand.words[0])]
+            for ids, counts in stats:
+                df = len(ids)
+                idf = math.log(1 + (self.verse_count - df + 0.5) / (df + 0.5))
+                terms.append((ids, counts, idf))
+
+        k1 = BM25_K1
+        for verse_id in verse_ids:
+            norm = k1 * (1 - BM25_B + BM25_B * self.verse_length(verse_id) / self.average_length)
+            score = 0.0
+            for ids, counts, idf in terms:
+                i = bisect_left(ids, verse_id)
+                if i < len(ids) and ids[i] == verse_id:
+                    tf = counts[i]
+                    score += idf * tf * (k1 + 1) / (tf + norm)
+            yield score, verse_id
+
+    @lru_cache(maxsize=1024)
+    def term_word_numbers(self, term):
+        """Returns the word numbers of the vocabulary words term matches."""
+        return frozenset(self.word_numbers[word] for word in self.matching_words(term))
+
+    def search_query(self, query, scope=None):
+        """Returns the sorted verse IDs of verses that match a ParsedQuery.
+
+        scope, if given, is a list of sorted, disjoint (first_id, last_id)
+        spans the verses must fall in.
+        """
+        if query.regex is not None:
+            return self.search_regex(query.regex, scope)
+        if not query.operands:
+            return []
+
+        # Candidates contain every word: phrase words exactly, others as prefixes.
+        lists = []
+        for operand in query.operands:
+            if operand.phrase:
+                lists.extend(self.postings.get(word, ()) for word in operand.words)
+            else:
+                lists.append(self.term_postings(operand.words[0]))
+        lists.sort(key=len)
+
+        result = lists[0]
+        if scope is not None:
+            result = restrict_to_spans(result, scope)
+        for postings in lists[1:]:
+            if not result:
+                break
+            result = _intersect(result, postings)
+
+        # Then check word order and distances on the positional index.
+        phrases = [operand for operand in query.operands if operand.phrase]
+        if not (phrases or query.near):
+            return list(result)
+
+        return [
+            verse_id for verse_id in result
+            if all(self._spans(verse_id, phrase) for phrase in phrases)
+            and all(self._near(verse_id, a, b, distance) for a, b, distance in query.near)
+        ]
+
+    def search_regex(self, regex, scope=None, time_budget=REGEX_TIME_BUDGET):
+        """Returns the sorted verse IDs of verses (in scope) whose text matches a compiled regex.
+
+        Only verses that contain a vocabulary word with each of the regex's
+        required words in it are scanned. Raises SearchPatternError if the
+        scan takes longer than time_budget seconds; the budget is checked
+        between verses, so it relies on compile_search_regex() to bound the
+        time spent on each one.
+        """
+        candidates = None
+        for fragment in required_words(regex.pattern):
+            postings = self.substring_postings(fragment)
+            candidates = postings if candidates is None else _intersect(candidates, postings)
+        if candidates is None:
+            candidates = self.verse_ids
+        if scope is not None:
+            candidates = restrict_to_spans(candidates, scope)
+
+        deadline = time.monotonic() + time_budget
+        matches = []
+        for verse_id in candidates:
+            if regex.search(self.bible.get_text_by_id(verse_id)):
+                matches.append(verse_id)
+            if time.monotonic() > deadline:
+                raise SearchPatternError("The pattern took too long to search; try a more specific one.")
+        return matches
+
+    @lru_cache(maxsize=256)
+    def substring_postings(self, fragment):
+        """Returns the sorted verse IDs of verses with a word containing fragment."""
+        merged = set()
+        for word in self.vocabulary:
+            if fragment in word:
+                merged.update(self.postings[word])
+        return array("I", sorted(merged))
+
+    def _spans(self, verse_id, operand):
+        """Returns the (first, last) word positions where an operand occurs in a verse."""
+        words = self.verse_words[verse_id]
+
+        if not operand.phrase:
+            numbers = self.term_word_numbers(operand.words[0])
+            return [(i, i) for i, number in enumerate(memoryview(words).cast(self.typecode)) if number in numbers]
+
+        pattern = self.phrase_pattern(operand.words)
+        if pattern is None:
+            return []
+
+        itemsize = self.itemsize
+        size = len(operand.words)
+        spans = []
+        offset = words.find(pattern)
+        while offset != -1:
+            # Only matches on word boundaries count.
+            if offset % itemsize == 0:
+                spans.append((offset // itemsize, offset // itemsize + size - 1))
+            offset = words.find(pattern, offset + 1)
+        return spans
+
+    @lru_cache(maxsize=1024)
+    def phrase_pattern(self, words):
+        """Returns the packed word numbers of a phrase, or None if a word is unknown."""
+        numbers = [self.word_numbers.get(word) for word in words]
+        if None in numbers:
+            return None
+        return array(self.typecode, numbers).tobytes()
+
+    def _near(self, verse_id, a, b, distance):
+        """Returns True if operands a and b occur at most distance words apart."""
+        b_spans = self._spans(verse_id, b)
+        for a_first, a_last in self._spans(verse_id, a):
+            for b_first, b_last in b_spans:
+                if max(b_first - a_last, a_first - b_last) <= distance:
+                    return True
+        return False
+
+
+_search_index = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index():
+    """Returns the shared search index, building it (once) on first use."""
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                _search_index = SearchIndex(bible)
+    return _search_index
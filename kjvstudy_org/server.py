@@ -1,19 +1,33 @@
 import hashlib
+import heapq
 import json
+import os
 import re
 import random
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional
+from urllib.parse import urlencode
 
-from fastapi import FastAPI, HTTPException, Request, Query
+from fastapi import Depends, FastAPI, HTTPException, Request, Query
 from fastapi.exception_handlers import http_exception_handler
-from fastapi.responses import HTMLResponse, Response, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from .kjv import bible, VerseReference
+from .cache import LRUCache
+from .commentary import get_curated_commentary, get_precomputed_commentary
+from .keywords import KeywordMatcher
+from .kjv import bible, split_verse_id
+from .search import SearchPatternError, get_search_index, intersect_spans, parse_query, restrict_to_spans
+from .suggest import DEFAULT_SUGGESTION_LIMIT, get_suggestion_index
 
 try:
     from ged4py import GedcomReader
@@ -82,7 +96,7 @@ def get_chapter_popularity_score(book: str, chapter: int) -> int:
         default_score += 1
 
     # Small boost for shorter books (more likely to be read in full)
-    total_chapters = len([ch for bk, ch in bible.iter_chapters() if bk == book])
+    total_chapters = len(bible.get_chapters_for_book(book))
     if total_chapters <= 5:
         default_score += 1
 
@@ -245,140 +259,308 @@ def get_chapter_popularity_explanation(book: str, chapter: int) -> str:
         return f"Part of {book} - explore this chapter to discover its significance"
 
 
-def is_verse_reference(query: str) -> bool:
-    """Check if query looks like a verse reference"""
-    # Pattern for verse references like "John 3:16", "1 John 4:8", "Genesis 1:1", "I Corinthians 13:4", etc.
-    verse_pattern = r'^(I{1,3}|1|2|3)?\s*[A-Za-z]+(\s+[A-Za-z]+)?\s+\d+:\d+$'
-    return bool(re.match(verse_pattern, query.strip()))
+def verse_reference_result(verse_id: int) -> Dict:
+    """Build a search result for a verse that was looked up by reference"""
+    book, chapter, verse = bible.get_reference(verse_id)
+    verse_text = bible.get_text_by_id(verse_id)
+    return {
+        "verse_id": verse_id,
+        "book": book,
+        "chapter": chapter,
+        "verse": verse,
+        "text": verse_text,
+        "reference": f"{book} {chapter}:{verse}",
+        "url": f"/book/{book}/chapter/{chapter}#verse-{verse}",
+        "score": 100.0,  # High score for exact verse matches
+        "highlighted_text": verse_text
+    }
 
-def parse_verse_reference(query: str) -> Optional[Dict]:
-    """Parse a verse reference string and return verse info if found"""
-    try:
-        # Clean up the query
-        cleaned_query = query.strip()
-
-        # Handle common variations in book names
-        # The KJV data uses "1", "2", "3" format, not Roman numerals
-        # No need to convert here since the data already uses this format
-
-        # Try to parse using the existing VerseReference.from_string method
-        verse_ref = VerseReference.from_string(cleaned_query)
-
-        # Get the actual verse text
-        verse_text = bible.get_verse_text(verse_ref.book, verse_ref.chapter, verse_ref.verse)
-
-        if verse_text:
-            return {
-                "book": verse_ref.book,
-                "chapter": verse_ref.chapter,
-                "verse": verse_ref.verse,
-                "text": verse_text,
-                "reference": f"{verse_ref.book} {verse_ref.chapter}:{verse_ref.verse}",
-                "url": f"/book/{verse_ref.book}/chapter/{verse_ref.chapter}#verse-{verse_ref.verse}",
-                "score": 100.0,  # High score for exact verse matches
-                "highlighted_text": verse_text
-            }
+def reference_verse_ids(query: str, scope: Optional[List] = None) -> Optional[List[int]]:
+    """Return the verse IDs (in scope) a reference like "Eph 2:8-9" points to, in reference order, or None for other queries"""
+    spans = bible.parse_reference(query.strip())
+    if not spans:
+        return None
 
-    except Exception as e:
-        print(f"Error parsing verse reference '{query}': {e}")
+    verse_ids = list(bible.iter_verse_ids_in_spans(spans))
+    if scope is not None:
+        # A reference may list verses out of canonical order ("John 3:16; Gen 1:1")
+        in_scope = set(restrict_to_spans(sorted(verse_ids), scope))
+        verse_ids = [verse_id for verse_id in verse_ids if verse_id in in_scope]
+    return verse_ids
 
-    # If we reach here, either parsing failed or verse_text was None
-    # Try alternative book name formats (Roman numerals to numbers)
-    try:
-        # First try simple Roman numeral to Arabic numeral conversion
-        alternative_query = query.strip()
-
-        # Replace Roman numerals at the beginning of the string
-        alternative_query = re.sub(r'^I\s+', '1 ', alternative_query)
-        alternative_query = re.sub(r'^II\s+', '2 ', alternative_query)
-        alternative_query = re.sub(r'^III\s+', '3 ', alternative_query)
-
-        if alternative_query != query.strip():
-            verse_ref = VerseReference.from_string(alternative_query)
-            verse_text = bible.get_verse_text(verse_ref.book, verse_ref.chapter, verse_ref.verse)
-
-            if verse_text:
-                return {
-                    "book": verse_ref.book,
-                    "chapter": verse_ref.chapter,
-                    "verse": verse_ref.verse,
-                    "text": verse_text,
-                    "reference": f"{verse_ref.book} {verse_ref.chapter}:{verse_ref.verse}",
-                    "url": f"/book/{verse_ref.book}/chapter/{verse_ref.chapter}#verse-{verse_ref.verse}",
-                    "score": 100.0,
-                    "highlighted_text": verse_text
-                }
-    except Exception as e2:
-        print(f"Alternative parsing also failed for '{query}': {e2}")
+# Number of results per page on the search page (further pages load incrementally)
+SEARCH_PAGE_SIZE = 50
+
+# Most results /api/search returns in one page
+MAX_SEARCH_PAGE_SIZE = 200
+
+# Longest query text accepted by the search and suggestion endpoints
+MAX_QUERY_LENGTH = 200
 
-    return None
+# Ranked results of popular text queries, shared by /search and /api/search;
+# bounded by the total number of verse IDs held (about 12 bytes each)
+SEARCH_CACHE_MAX_VERSES = 1_000_000
+SEARCH_CACHE_TTL = 60 * 60
+search_cache = LRUCache(SEARCH_CACHE_MAX_VERSES, ttl=SEARCH_CACHE_TTL, sizeof=lambda ranked: len(ranked.verse_ids))
 
-def perform_full_text_search(query: str, limit: Optional[int] = None) -> List[Dict]:
-    """Perform full text search across all Bible verses or find specific verse references"""
-    results = []
+# Query log (one query per line, most popular first) to warm the search cache with at startup
+SEARCH_QUERY_LOG = os.environ.get("KJV_SEARCH_QUERY_LOG")
+SEARCH_CACHE_WARM_LIMIT = 1000
 
-    # First, check if this looks like a verse reference
-    if is_verse_reference(query):
-        verse_result = parse_verse_reference(query)
-        if verse_result:
-            return [verse_result]
+
+def encode_search_cursor(score: float, position: int) -> str:
+    """Encode the rank key of the last result on a page as an opaque cursor"""
+    return f"{score!r}_{position}"
+
+
+def decode_search_cursor(cursor: Optional[str]):
+    """Decode a search cursor into a (score, position) rank key, or None"""
+    if not cursor:
+        return None
+    try:
+        score, position = cursor.rsplit("_", 1)
+        return float(score), int(position)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid search cursor")
+
+
+# Names accepted for the testament= search filter
+TESTAMENT_NAMES = {
+    "old": "Old Testament", "ot": "Old Testament", "old testament": "Old Testament",
+    "new": "New Testament", "nt": "New Testament", "new testament": "New Testament",
+}
+
+
+def search_filters(
+    book: Optional[str] = Query(None, description="Only search this book"),
+    testament: Optional[str] = Query(None, description="Only search the old or new testament"),
+    from_book: Optional[str] = Query(None, alias="from", description="First book of a range to search"),
+    to_book: Optional[str] = Query(None, alias="to", description="Last book of a range to search"),
+    chapters: Optional[str] = Query(None, description="Chapter or chapter range (e.g. 3-5) in a single book"),
+) -> Dict[str, str]:
+    """Collect the search filter query parameters that were given"""
+    filters = {"book": book, "testament": testament, "from": from_book, "to": to_book, "chapters": chapters}
+    return {name: value.strip() for name, value in filters.items() if value and value.strip()}
+
+
+@lru_cache(maxsize=2)
+def testament_spans(testament: str) -> tuple:
+    """Verse ID spans of a testament's books, with neighbouring books merged"""
+    spans = []
+    for book in bible.get_books():
+        if get_testament_for_book(book) != testament:
+            continue
+        first, last = bible.get_books_span(book)
+        if spans and spans[-1][1] + 1 == first:
+            spans[-1] = (spans[-1][0], last)
+        else:
+            spans.append((first, last))
+    return tuple(spans)
+
+
+def search_scope(filters: Dict[str, str]) -> Optional[List]:
+    """Turn search filters into the sorted verse ID spans to search, or None for the whole Bible"""
+    if not filters:
+        return None
+
+    def resolve(name):
+        book = bible.resolve_book(name)
+        if book is None:
+            raise HTTPException(status_code=400, detail=f"Unknown book: {name}")
+        return book
+
+    books = bible.get_books()
+    scope = [bible.get_books_span(books[0], books[-1])]
+
+    if "book" in filters or "from" in filters or "to" in filters:
+        first = resolve(filters.get("book") or filters.get("from") or books[0])
+        last = resolve(filters.get("book") or filters.get("to") or books[-1])
+        span = bible.get_books_span(first, last)
+        if span is None:
+            raise HTTPException(status_code=400, detail=f"{first} comes after {last}")
+        scope = intersect_spans(scope, [span])
+
+        if "chapters" in filters:
+            if first != last:
+                raise HTTPException(status_code=400, detail="A chapter range needs a single book")
+            match = re.fullmatch(r"(\d+)(?:\s*-\s*(\d+))?", filters["chapters"])
+            span = match and bible.get_books_span(first, first, int(match.group(1)), int(match.group(2) or match.group(1)))
+            if not span:
+                raise HTTPException(status_code=400, detail=f"Invalid chapter range: {filters['chapters']}")
+            scope = intersect_spans(scope, [span])
+    elif "chapters" in filters:
+        raise HTTPException(status_code=400, detail="A chapter range needs a single book")
+
+    if "testament" in filters:
+        testament = TESTAMENT_NAMES.get(filters["testament"].lower())
+        if testament is None:
+            raise HTTPException(status_code=400, detail=f"Unknown testament: {filters['testament']}")
+        scope = intersect_spans(scope, testament_spans(testament))
+
+    return scope
+
+
+def paginated_search(
+    query: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    scope: Optional[List] = None
+) -> Dict:
+    """Search for a page of results.
+
+    Results are ranked by score, then canonical order. A page starts after the
+    cursor (the rank key of the previous page's last result), skipping offset
+    results. Returns the page with the total number of matches, which comes
+    from the matching verse IDs without building their results. A scope
+    (from search_scope) limits the search to some verse ID spans.
+    """
+    after = decode_search_cursor(cursor)
+
+    # First, check if this is a verse reference; those results keep reference order
+    verse_ids = reference_verse_ids(query, scope)
+    if verse_ids is not None:
+        start = (after[1] + 1 if after else 0) + offset
+        end = len(verse_ids) if limit is None else start + limit
+        page = [verse_reference_result(verse_id) for verse_id in verse_ids[start:end]]
+        return {
+            "results": page,
+            "total": len(verse_ids),
+            "next_cursor": encode_search_cursor(100.0, end - 1) if page and end < len(verse_ids) else None,
+        }
 
     # If not a verse reference or verse not found, perform regular text search
-    search_terms = query.lower().split()
-
-    # Search through all verses using the iter_verses method
-    for verse in bible.iter_verses():
-        verse_text = verse.text.lower()
-
-        # Check if all search terms are in the verse
-        if all(term in verse_text for term in search_terms):
-            # Calculate relevance score
-            score = calculate_relevance_score(verse.text, search_terms)
-
-            results.append({
-                "book": verse.book,
-                "chapter": verse.chapter,
-                "verse": verse.verse,
-                "text": verse.text,
-                "reference": f"{verse.book} {verse.chapter}:{verse.verse}",
-                "url": f"/book/{verse.book}/chapter/{verse.chapter}#verse-{verse.verse}",
-                "score": score,
-                "highlighted_text": highlight_search_terms(verse.text, search_terms)
-            })
+    # (with "quoted phrases", NEAR/n proximity operators, wild*cards and
+    # /regex/ patterns; misspelled words match their closest corrections)
+    search_index = get_search_index()
+    try:
+        parsed_query = parse_query(query)
+    except SearchPatternError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Rankings are cached by the parsed query, so "Love", " love " and "love"
+    # share an entry; a cached ranking may only hold the top results, and is
+    # re-ranked deeper when a later page needs more of it
+    cache_key = (
+        tuple(parsed_query.operands), tuple(parsed_query.near), parsed_query.regex,
+        tuple(scope) if scope is not None else None,
+    )
+    ranked = search_cache.get(cache_key)
+    while True:
+        if ranked is not None:
+            start = 0 if after is None else ranked.position_after(after)
+            end = ranked.total if limit is None else min(start + offset + limit, ranked.total)
+            if ranked.is_complete or end <= len(ranked.verse_ids):
+                break
+            depth = None if limit is None else max(end, 2 * len(ranked.verse_ids))
+        else:
+            depth = None if limit is None else offset + limit
+        try:
+            ranked = rank_search_results(search_index, parsed_query, depth, scope)
+        except SearchPatternError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        search_cache.set(cache_key, ranked)
+
+    # Only the returned results are formatted and highlighted
+    highlight_pattern = search_index.highlight_pattern(parsed_query)
+    page = range(min(start + offset, end), end)
+    return {
+        "results": [
+            text_search_result(ranked.verse_ids[i], ranked.scores[i], highlight_pattern) for i in page
+        ],
+        "total": ranked.total,
+        "next_cursor": (
+            encode_search_cursor(ranked.scores[end - 1], ranked.verse_ids[end - 1])
+            if page and end < ranked.total else None
+        ),
+    }
 
-    # Sort by relevance score (higher is better)
-    results.sort(key=lambda x: x["score"], reverse=True)
 
-    # Limit results if specified
-    if limit is not None:
-        return results[:limit]
-    return results
+class RankedResults(NamedTuple):
+    """The top of a text query's ranking (or all of it), and its total number of matches"""
+    verse_ids: array
+    scores: array
+    total: int
 
+    @property
+    def is_complete(self) -> bool:
+        return len(self.verse_ids) == self.total
 
-def calculate_relevance_score(text: str, search_terms: List[str]) -> float:
-    """Calculate relevance score for search results"""
-    text_lower = text.lower()
-    score = 0.0
+    def position_after(self, after) -> int:
+        """Position in the ranking just after a cursor's (score, verse_id) rank key"""
+        after_key = (-after[0], after[1])
+        return bisect_right(
+            range(len(self.verse_ids)), after_key,
+            key=lambda i: (-self.scores[i], self.verse_ids[i])
+        )
 
-    for term in search_terms:
-        # Count occurrences of each term
-        count = text_lower.count(term.lower())
-        score += count
 
-        # Bonus for exact word matches
-        if f" {term.lower()} " in f" {text_lower} ":
-            score += 0.5
+def rank_search_results(search_index, parsed_query, depth: Optional[int] = None, scope: Optional[List] = None) -> RankedResults:
+    """Rank the verses matching a parsed query, keeping only the top depth results if given"""
+    # Look up the verses that match the query in the index (within the scope),
+    # scoring them lazily (BM25) as (score, verse_id) pairs
+    verse_ids = search_index.search_query(parsed_query, scope)
+    scored = search_index.score_matches(parsed_query, verse_ids)
 
-    return score
+    # Rank by relevance score (higher is better), then canonical order;
+    # with a depth, only keep the top results in a bounded heap
+    def rank_key(item):
+        return -item[0], item[1]
 
+    if depth is None or depth >= len(verse_ids):
+        ranked = sorted(scored, key=rank_key)
+    else:
+        ranked = heapq.nsmallest(depth, scored, key=rank_key)
 
-def highlight_search_terms(text: str, search_terms: List[str]) -> str:
-    """Highlight search terms in text"""
-    highlighted = text
-    for term in search_terms:
-        # Simple highlighting (could be improved)
-        highlighted = highlighted.replace(term, f"<mark>{term}</mark>")
-    return highlighted
+    return RankedResults(
+        array("I", (verse_id for _, verse_id in ranked)),
+        array("d", (score for score, _ in ranked)),
+        len(verse_ids),
+    )
+
+
+def warm_search_cache(path) -> int:
+    """Rank the queries in a query log (one per line, most popular first) into the search cache"""
+    warmed = 0
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                query = line.strip()
+                if len(query) < 2 or query.startswith("#"):
+                    continue
+                paginated_search(query, SEARCH_PAGE_SIZE)
+                get_suggestion_index().suggest(query)
+                warmed += 1
+                if warmed >= SEARCH_CACHE_WARM_LIMIT:
+                    break
+    except OSError as e:
+        print(f"Error reading search query log {path}: {e}")
+    return warmed
+
+
+def text_search_result(verse_id: int, score: float, highlight_pattern: Optional[re.Pattern]) -> Dict:
+    """Build a search result for a verse that matched a text query"""
+    book, chapter, verse = bible.get_reference(verse_id)
+    verse_text = bible.get_text_by_id(verse_id)
+    return {
+        "verse_id": verse_id,
+        "book": book,
+        "chapter": chapter,
+        "verse": verse,
+        "text": verse_text,
+        "reference": f"{book} {chapter}:{verse}",
+        "url": f"/book/{book}/chapter/{chapter}#verse-{verse}",
+        "score": score,
+        "highlighted_text": highlight_search_terms(verse_text, highlight_pattern)
+    }
+
+
+def highlight_search_terms(text: str, highlight_pattern: Optional[re.Pattern]) -> str:
+    """Highlight search terms in text, in a single pass of the compiled query pattern"""
+    if highlight_pattern is None:
+        return text
+    # (a /regex/ query's pattern may also match empty strings, which are left alone)
+    return highlight_pattern.sub(lambda m: f"<mark>{m.group()}</mark>" if m.group() else "", text)
 
 
 def get_verse_text(book, chapter, verse):
@@ -392,10 +574,26 @@ def get_verse_text(book, chapter, verse):
         return f"{book} {chapter}:{verse}"
 
 
+def warm_search():
+    """Build the search and suggestion indexes, then warm the search cache from the query log (if any)"""
+    get_suggestion_index()
+    if SEARCH_QUERY_LOG:
+        print(f"Warmed the search cache with {warm_search_cache(SEARCH_QUERY_LOG)} queries")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start loading the Bible and search index without delaying the server from accepting connections"""
+    bible.warm_in_background()
+    threading.Thread(target=warm_search, name="search-index-warmup", daemon=True).start()
+    yield
+
+
 app = FastAPI(
     title="KJV Study - Bible Commentary Platform",
     description="Study the King James Bible with AI-powered commentary and insights",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Set up Jinja2 templates and static files
@@ -426,16 +624,34 @@ async def custom_http_exception_handler(request: Request, exc: StarletteHTTPExce
 
 
 @app.get("/search", response_class=HTMLResponse)
-def search_page(request: Request, q: str = Query(None, description="Search query")):
-    """Search page with results"""
+def search_page(
+    request: Request,
+    q: str = Query(None, description="Search query"),
+    filters: Dict[str, str] = Depends(search_filters)
+):
+    """Search page with the first page of results (further pages load from the API)"""
     books = list(bible.iter_books())
     search_results = []
+    total_results = 0
+    next_cursor = None
     is_direct_verse = False
-
-    if q and len(q.strip()) >= 2:
-        search_results = perform_full_text_search(q.strip())
+    search_error = None
+
+    if q and len(q) > MAX_QUERY_LENGTH:
+        search_error = f"Queries are limited to {MAX_QUERY_LENGTH} characters."
+    elif q and len(q.strip()) >= 2:
+        try:
+            page = paginated_search(q.strip(), SEARCH_PAGE_SIZE, scope=search_scope(filters))
+        except HTTPException as e:
+            if e.status_code != 400:
+                raise
+            search_error = e.detail
+            page = {"results": [], "total": 0, "next_cursor": None}
+        search_results = page["results"]
+        total_results = page["total"]
+        next_cursor = page["next_cursor"]
         # Check if this was a direct verse reference match
-        if search_results and len(search_results) == 1 and search_results[0].get("score") == 100.0:
+        if total_results == 1 and search_results[0].get("score") == 100.0:
             is_direct_verse = True
 
     return templates.TemplateResponse(
@@ -445,31 +661,56 @@ def search_page(request: Request, q: str = Query(None, description="Search query
             "query": q or "",
             "results": search_results,
             "books": books,
-            "total_results": len(search_results),
-            "is_direct_verse": is_direct_verse
+            "total_results": total_results,
+            "next_cursor": next_cursor,
+            "page_size": SEARCH_PAGE_SIZE,
+            "is_direct_verse": is_direct_verse,
+            "search_error": search_error,
+            "filters": filters,
+            "filter_query": urlencode(filters)
         }
     )
 
 @app.get("/api/search")
-def search_api(q: str = Query(..., description="Search query"), limit: Optional[int] = Query(None, description="Max results")):
+def search_api(
+    q: str = Query(..., max_length=MAX_QUERY_LENGTH, description="Search query"),
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=MAX_SEARCH_PAGE_SIZE, description="Max results"),
+    offset: int = Query(0, ge=0, description="Results to skip (after the cursor, if given)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    filters: Dict[str, str] = Depends(search_filters)
+):
     """JSON API endpoint for search"""
     if not q or len(q.strip()) < 2:
-        return {"query": q, "results": [], "total": 0}
+        return {"query": q, "results": [], "total": 0, "count": 0, "next_cursor": None}
 
-    search_results = perform_full_text_search(q.strip(), limit)
+    page = paginated_search(q.strip(), limit, offset, cursor, search_scope(filters))
+    search_results = page["results"]
     is_direct_verse = False
 
     # Check if this was a direct verse reference match
-    if search_results and len(search_results) == 1 and search_results[0].get("score") == 100.0:
+    if page["total"] == 1 and search_results and search_results[0].get("score") == 100.0:
         is_direct_verse = True
 
     return {
         "query": q,
         "results": search_results,
-        "total": len(search_results),
-        "is_direct_verse": is_direct_verse
+        "total": page["total"],
+        "count": len(search_results),
+        "next_cursor": page["next_cursor"],
+        "is_direct_verse": is_direct_verse,
+        "filters": filters
     }
 
+@app.get("/api/suggest")
+def suggest_api(
+    q: str = Query(..., max_length=MAX_QUERY_LENGTH, description="Partially typed query"),
+    limit: int = Query(DEFAULT_SUGGESTION_LIMIT, ge=1, le=20, description="Max suggestions")
+):
+    """Autocomplete book names, verse references and words for the search box"""
+    if not q.strip():
+        return {"query": q, "suggestions": []}
+    return {"query": q, "suggestions": get_suggestion_index().suggest(q.strip(), limit)}
+
 @app.get("/study-guides", response_class=HTMLResponse)
 def study_guides_page(request: Request):
     """Study guides main page"""
@@ -755,40 +996,31 @@ def study_guide_detail(request: Request, slug: str):
     for section in guide["sections"]:
         verse_texts = []
         for verse_ref in section["verses"]:
-            try:
-                # Parse verse reference (simplified)
-                parts = verse_ref.split(" ")
-                if len(parts) >= 2:
-                    book = " ".join(parts[:-1])
-                    chapter_verse = parts[-1]
-                    if ":" in chapter_verse:
-                        if "-" in chapter_verse:
-                            # Handle verse ranges like "8-9"
-                            chapter, verse_range = chapter_verse.split(":")
-                            start_verse, end_verse = verse_range.split("-")
-                            verse_text = ""
-                            for v in range(int(start_verse), int(end_verse) + 1):
-                                text = bible.get_verse_text(book, int(chapter), v)
-                                if text:
-                                    verse_text += f"[{v}] {text} "
-                        else:
-                            chapter, verse = chapter_verse.split(":")
-                            verse_text = bible.get_verse_text(book, int(chapter), int(verse))
-                    else:
-                        # Just chapter
-                        chapter = int(chapter_verse)
-                        verse_text = f"(See {book} {chapter})"
-
-                    if verse_text:
-                        verse_texts.append({
-                            "reference": verse_ref,
-                            "text": verse_text
-                        })
-            except:
+            spans = bible.parse_reference(verse_ref)
+            if not spans:
                 verse_texts.append({
                     "reference": verse_ref,
                     "text": "Text not found"
                 })
+                continue
+
+            if ":" not in verse_ref:
+                # Just chapter
+                verse_text = f"(See {verse_ref})"
+            else:
+                verse_ids = list(bible.iter_verse_ids_in_spans(spans))
+                if len(verse_ids) == 1:
+                    verse_text = bible.get_text_by_id(verse_ids[0])
+                else:
+                    # Number each verse of a range like "8-9"
+                    verse_text = "".join(
+                        f"[{split_verse_id(verse_id)[2]}] {bible.get_text_by_id(verse_id)} " for verse_id in verse_ids
+                    )
+
+            verse_texts.append({
+                "reference": verse_ref,
+                "text": verse_text
+            })
 
         section["verse_texts"] = verse_texts
 
@@ -1601,7 +1833,7 @@ def sitemap():
 """
 
         # Add all chapter URLs for each book
-        chapters = [ch for bk, ch in bible.iter_chapters() if bk == book]
+        chapters = bible.get_chapters_for_book(book)
         for chapter in chapters:
             sitemap_xml += f"""    <url>
         <loc>{base_url}/book/{book}/chapter/{chapter}</loc>
@@ -1629,7 +1861,7 @@ def read_root(request: Request):
 @app.get("/book/{book}", response_class=HTMLResponse)
 def read_book(request: Request, book: str):
     books = list(bible.iter_books())
-    chapters = [ch for bk, ch in bible.iter_chapters() if bk == book]
+    chapters = bible.get_chapters_for_book(book)
 
     if not chapters:
         raise HTTPException(
@@ -1666,7 +1898,7 @@ def book_commentary(request: Request, book: str):
     """Generate comprehensive commentary for an entire book"""
     try:
         books = list(bible.iter_books())
-        chapters = [ch for bk, ch in bible.iter_chapters() if bk == book]
+        chapters = bible.get_chapters_for_book(book)
 
         if not chapters:
             raise HTTPException(
@@ -1714,8 +1946,8 @@ def redirect_chapter_legacy(book: str, chapter: int):
 @app.get("/book/{book}/chapter/{chapter}", response_class=HTMLResponse)
 def read_chapter(request: Request, book: str, chapter: int):
     books = list(bible.iter_books())
-    verses = [v for v in bible.iter_verses() if v.book == book and v.chapter == chapter]
-    chapters = [ch for bk, ch in bible.iter_chapters() if bk == book]
+    verses = bible.get_verses_by_book_chapter(book, chapter)
+    chapters = bible.get_chapters_for_book(book)
 
     if not verses:
         # Check if the book exists first
@@ -1732,13 +1964,8 @@ def read_chapter(request: Request, book: str, chapter: int):
 
 
 
-    # Generate AI commentary for the chapter
-    commentaries = {}
-    for verse in verses:
-        commentaries[verse.verse] = generate_commentary(book, chapter, verse)
-
-    # Generate chapter overview
-    chapter_overview = generate_chapter_overview(book, chapter, verses)
+    # Generate AI commentary for the chapter (cached per chapter)
+    commentaries, chapter_overview = get_chapter_commentary(book, chapter, verses)
 
     return templates.TemplateResponse(
         "chapter.html",
@@ -1759,8 +1986,8 @@ def read_chapter(request: Request, book: str, chapter: int):
 def commentary(request: Request, book: str, chapter: int):
     """Generate AI-powered commentary for a specific chapter"""
     books = list(bible.iter_books())
-    verses = [v for v in bible.iter_verses() if v.book == book and v.chapter == chapter]
-    chapters = [ch for bk, ch in bible.iter_chapters() if bk == book]
+    verses = bible.get_verses_by_book_chapter(book, chapter)
+    chapters = bible.get_chapters_for_book(book)
 
     if not verses:
         # Check if the book exists first
@@ -1775,13 +2002,8 @@ def commentary(request: Request, book: str, chapter: int):
                 detail=f"Chapter {chapter} of {book} was not found. This book has {len(chapters)} chapters."
             )
 
-    # Generate AI commentary for each verse
-    commentaries = {}
-    for verse in verses:
-        commentaries[verse.verse] = generate_commentary(book, chapter, verse)
-
-    # Generate chapter overview
-    chapter_overview = generate_chapter_overview(book, chapter, verses)
+    # Generate AI commentary for each verse (cached per chapter)
+    commentaries, chapter_overview = get_chapter_commentary(book, chapter, verses)
 
     return templates.TemplateResponse(
         "commentary.html",
@@ -1817,385 +2039,82 @@ def escape_jinja2_syntax(text):
     
     return text
 
+# Generated commentary is seeded per reference, so a page renders the same on
+# every request and can be cached. Change the seed to vary the wording.
+COMMENTARY_SEED = os.environ.get("KJV_COMMENTARY_SEED", "")
+
+
+def commentary_rng(*key):
+    """Return a random number generator seeded from key and COMMENTARY_SEED"""
+    return random.Random(repr((COMMENTARY_SEED, *key)))
+
+
+# Assembled commentary of recently viewed chapters, shared by the chapter and
+# commentary pages; bounded by the approximate memory it holds
+CHAPTER_CACHE_MAX_BYTES = int(os.environ.get("KJV_CHAPTER_CACHE_MB", "64")) * 1024 * 1024
+
+
+class ChapterCommentary(NamedTuple):
+    """The commentary for every verse of a chapter, by verse number, and the chapter overview"""
+    commentaries: Dict[int, dict]
+    overview: str
+
+
+def chapter_commentary_size(chapter_commentary: ChapterCommentary) -> int:
+    """Approximate number of bytes held by a chapter's commentary strings"""
+    size = sys.getsizeof(chapter_commentary.overview)
+    for commentary in chapter_commentary.commentaries.values():
+        size += sys.getsizeof(commentary["analysis"]) + sys.getsizeof(commentary["historical"])
+        size += sum(sys.getsizeof(question) for question in commentary["questions"])
+        size += sum(sys.getsizeof(value) for reference in commentary["cross_references"] for value in reference.values())
+    return size
+
+
+chapter_cache = LRUCache(CHAPTER_CACHE_MAX_BYTES, sizeof=chapter_commentary_size)
+
+
+def get_chapter_commentary(book, chapter, verses) -> ChapterCommentary:
+    """Return the commentary and overview for a chapter, assembling them on a cache miss"""
+    key = (book, chapter)
+    chapter_commentary = chapter_cache.get(key)
+    if chapter_commentary is None:
+        chapter_commentary = ChapterCommentary(
+            {verse.verse: get_verse_commentary(book, chapter, verse) for verse in verses},
+            generate_chapter_overview(book, chapter, verses),
+        )
+        chapter_cache.set(key, chapter_commentary)
+    return chapter_commentary
+
+
+def get_verse_commentary(book, chapter, verse):
+    """Return the precomputed commentary for a verse, generating it if there is none"""
+    commentary = get_precomputed_commentary(book, chapter, verse.verse, COMMENTARY_SEED)
+    if commentary is None:
+        commentary = generate_commentary(book, chapter, verse)
+    return commentary
+
+
 def generate_commentary(book, chapter, verse):
     """Generate AI-powered commentary for a specific verse"""
-    # Enhanced commentary database for major chapters
-    enhanced_commentary = {
-        "Genesis": {
-            1: {
-                1: {
-                    "analysis": """<strong>In the beginning God created the heaven and the earth.</strong> This majestic opening declares the fundamental truth of biblical theology: God is the sovereign Creator of all that exists. The Hebrew word <em>bereshit</em> (בְּרֵאשִׁית) means "in beginning" without the definite article, suggesting not merely a temporal starting point but the absolute origin of all created reality.<br><br>The verb <em>bara</em> (בָּרָא, "created") appears exclusively with God as its subject in Scripture, denoting divine creative activity that brings something entirely new into existence. This distinguishes biblical creation from ancient Near Eastern myths where gods merely reshape pre-existing matter. The phrase "the heaven and the earth" (<em>hashamayim ve'et ha'aretz</em>) is a Hebrew merism expressing the totality of creation—all realms, visible and invisible.<br><br>Theologically, this verse establishes: (1) God's transcendence—He exists before and apart from creation; (2) God's omnipotence—He speaks reality into being; (3) the contingency of creation—all depends on God for existence; and (4) the purposefulness of creation—it originates from divine will, not chance or necessity.""",
-                    "historical": """Genesis 1:1 stands in stark contrast to ancient Near Eastern creation accounts like the Babylonian <em>Enuma Elish</em> or the Egyptian creation myths. While these portrayed creation as resulting from conflicts between deities, Genesis presents a sovereign God who creates effortlessly by divine decree. This would have been revolutionary to ancient readers accustomed to polytheistic cosmogonies.<br><br>The Hebrew text's literary structure suggests careful composition rather than primitive mythology. The absence of theogony (origin of gods) and theomachy (conflict between gods) distinguishes Genesis from its contemporary literature. Archaeological discoveries of creation tablets from Mesopotamia (dating to 2000-1500 BCE) reveal that Genesis addresses similar questions but provides radically different answers about the nature of God, humanity, and the cosmos.<br><br>For the Israelites emerging from Egyptian bondage, this truth that their God created everything would have been profoundly liberating—the gods of Egypt were mere creations, not creators.""",
-                    "questions": [
-                        "How does the doctrine of creation ex nihilo (from nothing) shape our understanding of God's relationship to the universe?",
-                        "What are the implications of God creating by His word alone for our understanding of the power of divine speech throughout Scripture?",
-                        "How does Genesis 1:1 provide the foundation for a biblical worldview distinct from both ancient mythology and modern materialism?"
-                    ]
-                },
-                26: {
-                    "analysis": """<strong>Let us make man in our image, after our likeness.</strong> This pivotal verse introduces humanity's creation with striking theological significance. The plural "Let us" has generated extensive theological discussion. While some see this as a plural of majesty (royal we), the most compelling interpretation recognizes an intra-Trinitarian conversation, especially given New Testament revelation (John 1:1-3, Colossians 1:16).<br><br>The Hebrew words <em>tselem</em> (צֶלֶם, "image") and <em>demuth</em> (דְּמוּת, "likeness") are essentially synonymous, together emphasizing humanity's unique status as God's representatives. This image encompasses: (1) rational and moral capacities, (2) relational nature, (3) creative abilities, (4) dominion over creation, and (5) spiritual dimension. Importantly, the image of God is not something humans possess but something they <em>are</em>.<br><br>The immediate context links the image to dominion—humans are God's vice-regents on earth. This establishes human dignity, purpose, and responsibility. Every human bears this image, making human life sacred and murder heinous (Genesis 9:6). The fall damages but does not eliminate this image (James 3:9).""",
-                    "historical": """The concept of humans as divine images was revolutionary in the ancient Near East. While other cultures depicted only kings as divine images, Genesis democratizes this honor—all humans bear God's image regardless of social status. In Egypt, the Pharaoh was considered the living image of the gods, while in Mesopotamia, only kings were called divine images. Genesis radically declares that every human, from the greatest to the least, shares this extraordinary dignity.<br><br>Ancient creation accounts typically portrayed humans as afterthoughts or slaves to the gods. The Babylonian <em>Atrahasis Epic</em> describes humans created to relieve the gods of burdensome labor. By contrast, Genesis presents humans as the crown of creation, specially crafted by God's own hands and breath. This would have been profoundly counter-cultural to ancient readers familiar with their insignificance in other religious systems.""",
-                    "questions": [
-                        "How does the image of God distinguish humans from animals and what implications does this have for bioethics?",
-                        "In what ways does understanding humans as God's image-bearers shape our view of human rights and social justice?",
-                        "How should the doctrine of imago Dei influence our approach to race relations, disability, and the value of human life at all stages?"
-                    ]
-                }
-            }
-        },
-        "John": {
-            3: {
-                16: {
-                    "analysis": """<strong>For God so loved the world, that he gave his only begotten Son, that whosoever believeth in him should not perish, but have everlasting life.</strong> This verse, often called the "Gospel in miniature," encapsulates the entire biblical narrative of redemption. The Greek construction emphasizes the manner and extent of God's love: <em>houtōs</em> (οὕτως, "so" or "in this way") points not merely to degree but to the specific manner—through sacrificial giving.<br><br>The phrase "only begotten" (<em>monogenēs</em>, μονογενής) literally means "one of a kind" or "unique," emphasizing Christ's distinctive relationship to the Father rather than necessarily temporal generation. This word appears five times in John's writings (John 1:14, 18; 3:16, 18; 1 John 4:9), always highlighting Christ's unique divine sonship.<br><br>"The world" (<em>kosmos</em>, κόσμος) in John's Gospel typically refers to fallen humanity in rebellion against God (John 1:10; 15:18-19). That God loves <em>this</em> world—hostile, rebellious, and alienated—demonstrates the radical nature of divine grace. The purpose clause reveals God's desire: not condemnation but salvation, not death but eternal life.""",
-                    "historical": """Jesus spoke these words to Nicodemus, a Pharisee and member of the Sanhedrin, during a nighttime conversation that reveals the tension surrounding Jesus' ministry. Nicodemus represented the religious elite who struggled to understand Jesus' revolutionary teachings about spiritual rebirth and salvation.<br><br>The context of Jesus' statement connects to the bronze serpent incident (Numbers 21:4-9), which Jesus had just referenced. In the wilderness, when venomous serpents bit the Israelites, God commanded Moses to make a bronze serpent and lift it up on a pole. Anyone who looked upon it would live. This historical parallel illustrates how Christ, lifted up on the cross, becomes the means of salvation for all who look to Him in faith.<br><br>For first-century Jews, the concept of God's love extending to "the world" (including Gentiles) was revolutionary. Jewish thought generally emphasized God's special love for Israel, making this universal scope of divine love a radical departure that would later become central to Paul's Gentile mission.""",
-                    "questions": [
-                        "How does the phrase 'God so loved the world' challenge both ancient Jewish particularism and modern religious exclusivism?",
-                        "What does it mean that God 'gave' His Son, and how does this relate to theories of atonement and sacrifice?",
-                        "How should we understand 'eternal life' not just as quantity but quality of existence, beginning now rather than only in the future?"
-                    ]
-                }
-            }
-        },
-        "Romans": {
-            8: {
-                28: {
-                    "analysis": """<strong>And we know that all things work together for good to them that love God, to them who are the called according to his purpose.</strong> This beloved verse provides profound comfort while requiring careful theological understanding. The verb "work together" (<em>synergei</em>, συνεργεῖ) suggests a divine orchestration where even disparate events collaborate toward God's ultimate purpose.<br><br>The phrase "all things" (πάντα) is comprehensive yet must be understood within context. Paul doesn't claim all things are inherently good, but that God sovereignly works through all circumstances—including suffering, persecution, and even human sin—to accomplish His redemptive purposes for His people. The "good" (<em>agathon</em>, ἀγαθόν) here refers to conformity to Christ's image (v.29), not necessarily temporal comfort or prosperity.<br><br>The verse contains two crucial qualifications: (1) "to them that love God"—demonstrating genuine saving faith, and (2) "the called according to his purpose"—referring to God's eternal elective purpose. These aren't two different groups but describe the same people from human (love) and divine (calling) perspectives.""",
-                    "historical": """Romans 8:28 appears within Paul's exposition of Christian suffering and hope. The Roman church, composed of both Jewish and Gentile believers, faced mounting persecution under Nero's increasingly hostile policies toward Christians. Paul wrote Romans around 57 CE, just a few years before Nero's great persecution that would claim many Christian lives.<br><br>The broader context of Romans 8 addresses the tension between present suffering and future glory (vv. 18-30). Early Christians needed assurance that their current tribulations served God's redemptive purposes rather than indicating divine abandonment. This verse would have provided crucial comfort to believers facing social ostracism, economic hardship, and physical persecution for their faith.""",
-                    "questions": [
-                        "How do we reconcile God's sovereignty in 'working all things together for good' with human responsibility and the reality of evil?",
-                        "What practical difference should this verse make in how Christians respond to suffering, disappointment, and apparent setbacks?",
-                        "How does understanding our identity as 'called according to his purpose' provide security and hope in uncertain circumstances?"
-                    ]
-                }
-            }
-        },
-        "Psalms": {
-            23: {
-                1: {
-                    "analysis": """<strong>The Lord is my shepherd; I shall not want.</strong> This opening declaration establishes both the fundamental relationship (Lord as shepherd, believer as sheep) and its primary consequence (complete sufficiency). The Hebrew word for "Lord" here is <em>Yahweh</em> (יהוה), the covenant name of God, emphasizing not just divine power but divine faithfulness to His promises.<br><br>The metaphor of God as shepherd was deeply rooted in Hebrew thought and ancient Near Eastern royal ideology. Kings were often called shepherds of their people (Ezekiel 34:1-10). David, himself a shepherd before becoming king, understood both the tender care and protective authority required. The verb "shepherd" (<em>ra'ah</em>, רעה) implies not passive watching but active guidance, protection, and provision.<br><br>The phrase "I shall not want" (<em>lo echsar</em>, לא אחסר) uses a strong Hebrew negative, meaning "I shall certainly not lack." This isn't a promise of luxury but of sufficiency—every true need will be met. The psalmist's confidence rests not in circumstances but in the character and commitment of his divine Shepherd.""",
-                    "historical": """Psalm 23 likely originates from David's experience as both shepherd and king. Archaeological evidence reveals that shepherding in ancient Palestine required constant vigilance against predators (lions, bears, wolves) and environmental dangers (cliffs, sudden storms, poisonous plants). Shepherds risked their lives for their flocks, often sleeping in caves or under stars to guard against night attacks.<br><br>The psalm's imagery would have resonated powerfully with David's original audience, many of whom lived in pastoral settings. The metaphor also connected to Israel's understanding of God's relationship with the nation—He had shepherded them out of Egypt, through the wilderness, and into the Promised Land. Royal psalms often used shepherd imagery to describe ideal kingship (Psalm 78:70-72).<br><br>For exiled or oppressed Israelites in later periods, this psalm provided comfort by affirming God's continued care despite apparent abandonment. The shepherd metaphor assured them that their divine King remained attentive to their needs even in foreign lands.""",
-                    "questions": [
-                        "How does understanding God as our shepherd change our perspective on guidance, protection, and provision in daily life?",
-                        "What does it mean practically to 'not want' when we clearly experience desires and needs that seem unmet?",
-                        "How does the personal, intimate nature of this psalm ('my shepherd') balance with understanding God's universal sovereignty?"
-                    ]
-                }
-            }
-        },
-        "1 Corinthians": {
-            13: {
-                4: {
-                    "analysis": """<strong>Charity suffereth long, and is kind; charity envieth not; charity vaunteth not itself, is not puffed up.</strong> Paul begins his poetic description of love with two positive qualities followed by four negative ones. The Greek word <em>agape</em> (ἀγάπη), translated "charity" in the KJV, represents divine love characterized by self-sacrificial commitment rather than emotional feeling or romantic attraction.<br><br>"Suffereth long" (<em>makrothymei</em>, μακροθυμεῖ) literally means "long-tempered" or "slow to anger," describing patience with people rather than circumstances. This patience isn't passive endurance but active forbearance that continues loving despite provocation. "Is kind" (<em>chresteuetai</em>, χρηστεύεται) appears only here in the New Testament, emphasizing active benevolence that seeks others' welfare.<br><br>The four negatives reveal what love never does: it doesn't envy (<em>ou zeloi</em>), doesn't boast (<em>ou perpereuetai</em>), doesn't act arrogantly (<em>ou physioutai</em>), and doesn't behave inappropriately. These contrasts address specific problems Paul observed in Corinth: jealousy over spiritual gifts, boasting about wisdom or status, and prideful behavior that disrupted fellowship.""",
-                    "historical": """The Corinthian church was deeply divided by issues of status, spiritual gifts, and personal preferences. Wealthy members looked down on poorer believers, different factions claimed superiority based on their favorite teachers (Paul, Apollos, Cephas), and some boasted about having more impressive spiritual gifts like tongues or prophecy.<br><br>First-century Corinth was a cosmopolitan commercial center where social status, rhetorical skill, and impressive displays of wisdom or power determined social standing. The Roman patronage system created obvious hierarchies, and Greek philosophical schools competed for intellectual supremacy. Into this context, Paul introduces a radically different value system based on self-sacrificial love rather than self-promotion.<br><br>Paul's description of love directly challenges Corinthian culture: instead of self-assertion, love seeks others' good; instead of competing for honor, love rejoices in others' success; instead of demanding rights, love willingly suffers inconvenience for others' benefit.""",
-                    "questions": [
-                        "How does Paul's definition of love challenge modern cultural understandings of love as primarily emotional or romantic?",
-                        "Which of these characteristics of love do you find most challenging to practice consistently, and why?",
-                        "How might the church today address conflicts and divisions by applying these principles of love?"
-                    ]
-                }
-            }
-        },
-        "Matthew": {
-            5: {
-                3: {
-                    "analysis": """<strong>Blessed are the poor in spirit: for theirs is the kingdom of heaven.</strong> This opening beatitude establishes the fundamental character of kingdom citizens. The Greek <em>makarios</em> (μακάριος, "blessed") denotes not temporary happiness but objective divine favor and ultimate well-being. The "poor in spirit" (<em>ptōchoi tō pneumati</em>, πτωχοὶ τῷ πνεύματι) describes those who recognize their spiritual bankruptcy before God.<br><br>The word <em>ptōchoi</em> refers to abject poverty—those who must beg to survive. Spiritually, it describes complete dependence on God's mercy rather than self-righteousness or merit. This poverty of spirit stands opposite to Pharisaic pride and self-sufficiency. The present tense "theirs is" indicates immediate possession of the kingdom, not just future hope.<br><br>Jesus radically reverses worldly values: those the world considers unsuccessful (the spiritually poor) are declared blessed by God. This beatitude forms the foundation for all others, as spiritual poverty is the prerequisite for receiving God's grace.""",
-                    "historical": """The Sermon on the Mount was delivered to Jesus' disciples with crowds listening (Matthew 5:1-2). In first-century Palestine, poverty was widespread, and religious leaders often taught that prosperity indicated divine blessing while poverty suggested divine disfavor. The Pharisees emphasized righteous works and religious achievement as means of gaining God's approval.<br><br>Jesus' audience would have included many literally poor people who struggled under Roman taxation and religious obligations. The concept of being "poor in spirit" would have resonated with those who felt spiritually inadequate compared to the religious elite. This teaching directly challenged the prevailing theology that equated material and spiritual prosperity with divine favor.<br><br>The beatitudes as a whole present kingdom ethics that contrast sharply with both Roman imperial values (strength, conquest, honor) and Jewish religious expectations (law-keeping, prosperity, national restoration).""",
-                    "questions": [
-                        "How does recognizing our spiritual poverty before God change our approach to righteousness and religious achievement?",
-                        "What practical steps can believers take to maintain a 'poor in spirit' attitude in a culture that promotes self-sufficiency?",
-                        "How does this beatitude challenge both religious pride and secular humanism's emphasis on human potential?"
-                    ]
-                },
-                8: {
-                    "analysis": """<strong>Blessed are the pure in heart: for they shall see God.</strong> This beatitude addresses the inner nature that God requires for relationship with Him. The Greek <em>katharos</em> (καθαρός, "pure") originally meant clean from dirt or unmixed, like pure metals without alloy. Applied to the heart (<em>kardia</em>, καρδία), it describes undivided loyalty and moral integrity—a heart free from duplicity, hypocrisy, and mixed motives.<br><br>Purity of heart encompasses both moral cleanness and single-minded devotion to God. It's not sinless perfection but sincere, undivided commitment without hidden agendas or secret sins. The "heart" in Hebrew thought represents the center of personality—intellect, emotions, and will united in purpose.<br><br>The promise "they shall see God" (<em>theon opsontai</em>, θεὸν ὄψονται) refers to both present spiritual vision and future beatific vision. Only the pure in heart can truly perceive God's nature and works. Sin creates spiritual cataracts that prevent clear vision of divine truth and beauty.""",
-                    "historical": """Jewish purity laws emphasized external ceremonial cleanness through ritual washings, dietary restrictions, and avoidance of ceremonial defilement. The Pharisees had developed elaborate systems for maintaining ritual purity while often neglecting inner spiritual condition. Jesus consistently emphasized that external religious observance without internal transformation was insufficient.<br><br>The concept of "seeing God" was particularly significant to first-century Jews who believed that no one could see God and live (Exodus 33:20). Yet the Old Testament promised that the pure would see God (Psalm 24:3-4), creating tension between divine transcendence and the possibility of intimate knowledge of God.<br><br>This beatitude would have shocked Jesus' audience by suggesting that moral and spiritual purity, rather than ritual observance, determines one's ability to perceive and commune with God.""",
-                    "questions": [
-                        "How does Jesus' emphasis on purity of heart challenge both legalistic religion and antinomian attitudes toward holiness?",
-                        "What are the barriers to purity of heart in contemporary culture, and how can believers cultivate undivided devotion to God?",
-                        "How does the promise of 'seeing God' provide motivation for pursuing holiness and moral integrity?"
-                    ]
-                }
-            },
-            6: {
-                9: {
-                    "analysis": """<strong>Our Father which art in heaven, Hallowed be thy name.</strong> This opening address establishes the fundamental relationship and priority in prayer. "Our Father" (<em>Pater hēmōn</em>, Πάτερ ἡμῶν) was revolutionary in its intimacy—while Jews acknowledged God as Father of the nation, Jesus taught individual believers to approach God with filial confidence. The Aramaic <em>Abba</em> behind this Greek reflects intimate family relationship.<br><br>"Which art in heaven" (<em>ho en tois ouranois</em>, ὁ ἐν τοῖς οὐρανοῖς) balances intimacy with reverence, acknowledging God's transcendence and sovereign authority. This phrase prevents presumptuous familiarity while maintaining relational warmth.<br><br>"Hallowed be thy name" (<em>hagiasthētō to onoma sou</em>, ἁγιασθήτω τὸ ὄνομά σου) uses the passive voice, recognizing that ultimately God hallows His own name through His actions. The aorist imperative suggests both an ongoing desire and an eschatological hope for universal recognition of God's holiness.""",
-                    "historical": """Jewish prayer in the first century typically began with elaborate titles acknowledging God's transcendence and holiness. The most common address was "Blessed art Thou, O Lord our God, King of the universe." Jesus' use of "Father" would have been startling in its simplicity and intimacy, though some Jewish prayers did refer to God as Father of Israel.<br><br>The Kaddish prayer, central to Jewish liturgy, included the petition "May His great name be sanctified and hallowed," showing that the concept of hallowing God's name was familiar to Jewish worshipers. However, Jesus places this petition in the context of individual, intimate prayer rather than formal liturgy.<br><br>The family structure in ancient Mediterranean culture made the father the source of honor, provision, and protection for the household. Jesus' teaching that believers could approach the sovereign God as "Father" implied both tremendous privilege and serious responsibility.""",
-                    "questions": [
-                        "How does understanding God as 'our Father' change the way we approach prayer, worship, and obedience?",
-                        "What does it mean practically to 'hallow' God's name in contemporary culture, and how do our lives contribute to this?",
-                        "How does the balance between intimacy ('Father') and reverence ('in heaven') inform healthy Christian spirituality?"
-                    ]
-                },
-                11: {
-                    "analysis": """<strong>Give us this day our daily bread.</strong> This petition addresses humanity's fundamental dependence on God for sustenance. The Greek <em>artos</em> (ἄρτος, "bread") represents basic nourishment, standing for all necessities of life. The qualifier <em>epiousios</em> (ἐπιούσιος, "daily") is rare in ancient literature, possibly meaning "sufficient for today," "for the coming day," or "necessary for existence."<br><br>This request acknowledges human dependence while modeling contentment with basic provisions rather than luxury or excess. The petition follows immediately after seeking God's kingdom and righteousness, suggesting that material needs, while legitimate, are secondary to spiritual priorities.<br><br>The present imperative "give" (<em>dos</em>, δός) indicates ongoing dependence rather than one-time provision. The plural "us" emphasizes communal concern—followers of Jesus pray not just for personal needs but for the community's welfare.""",
-                    "historical": """In ancient Palestine, daily bread was literally a daily concern for most people. Laborers were typically paid at the end of each workday (Leviticus 19:13), and families often lived from day to day without significant food storage. Bread was the staple food, representing up to 70% of caloric intake for ordinary people.<br><br>The wilderness wandering provided the theological background for this petition, where Israel learned to depend on God for daily manna (Exodus 16). They could not hoard manna—it spoiled if kept overnight (except on the Sabbath), teaching complete dependence on God's daily provision.<br><br>Jewish blessings over bread acknowledged God as the source of provision: "Blessed art Thou, O Lord our God, King of the universe, who bringest forth bread from the earth." Jesus' prayer reflects this understanding while emphasizing ongoing dependence rather than accumulated wealth.""",
-                    "questions": [
-                        "How does praying for 'daily bread' challenge consumer culture's emphasis on accumulation and security through material wealth?",
-                        "What does it mean to depend on God for daily provision in developed economies where food security seems guaranteed?",
-                        "How should the plural 'us' in this petition influence Christian attitudes toward global hunger and economic inequality?"
-                    ]
-                }
-            },
-            28: {
-                19: {
-                    "analysis": """<strong>Go ye therefore, and teach all nations, baptizing them in the name of the Father, and of the Son, and of the Holy Ghost.</strong> The Great Commission establishes the church's universal mission. "Go ye therefore" (<em>poreuthentes oun</em>, πορευθέντες οὖν) connects this command to Jesus' declaration of universal authority (v.18). The participle suggests "as you go" or "going," indicating that evangelism occurs through normal life activities, not just formal missions.<br><br>"Teach all nations" more literally reads "make disciples of all nations" (<em>mathēteusate panta ta ethnē</em>, μαθητεύσατε πάντα τὰ ἔθνη). The term <em>ethnē</em> refers to people groups, not just political entities. This universality breaks down Jewish-Gentile barriers and extends salvation to every cultural and ethnic group.<br><br>The Trinitarian baptismal formula "in the name of the Father, and of the Son, and of the Holy Ghost" uses the singular "name" (<em>onoma</em>, ὄνομα), suggesting the unity of the three persons in one divine essence. This represents the clearest Trinitarian statement in the Gospels.""",
-                    "historical": """This commission was given to the eleven disciples on a mountain in Galilee (Matthew 28:16), fulfilling Jesus' promise to meet them there (26:32, 28:10). The mountain setting echoes other significant biblical revelations and commissions, particularly Moses receiving the law on Mount Sinai.<br><br>At this time, Jewish understanding generally limited God's full salvation to Israel, though they acknowledged righteous Gentiles could be saved. Jesus' command to make disciples of "all nations" would have been revolutionary, expanding the scope of salvation beyond ethnic and religious boundaries that had defined Jewish identity for centuries.<br><br>The early church initially struggled with this universal mandate, as seen in Peter's vision (Acts 10) and the Jerusalem Council (Acts 15). The inclusion of Gentiles without requiring circumcision and law-keeping represented a fundamental shift in understanding God's redemptive purposes.""",
-                    "questions": [
-                        "How does the Great Commission challenge both religious exclusivism and cultural relativism in contemporary missions?",
-                        "What does 'making disciples' involve beyond initial evangelism, and how should this shape church ministry strategies?",
-                        "How does the Trinitarian baptismal formula inform our understanding of conversion as incorporation into the divine community?"
-                    ]
-                }
-            }
-        },
-        "Luke": {
-            2: {
-                14: {
-                    "analysis": """<strong>Glory to God in the highest, and on earth peace, good will toward men.</strong> The angelic proclamation announces the cosmic significance of Christ's birth. "Glory to God in the highest" (<em>doxa en hypsistois theō</em>, δόξα ἐν ὑψίστοις θεῷ) declares that Christ's incarnation supremely manifests God's glory—His character, power, and purposes. The superlative "highest" emphasizes the ultimate nature of this glorification.<br><br>"Peace on earth" (<em>epi gēs eirēnē</em>, ἐπὶ γῆς εἰρήνη) refers to the comprehensive well-being that Messiah brings—not mere absence of conflict but wholeness, harmony, and reconciliation between God and humanity. This peace fulfills prophetic promises of the Prince of Peace (Isaiah 9:6) who would establish everlasting peace.<br><br>"Good will toward men" (<em>en anthrōpois eudokia</em>, ἐν ἀνθρώποις εὐδοκία) better translates as "among people with whom [God] is pleased" or "people of [God's] good pleasure." This emphasizes divine initiative in salvation rather than general human goodwill.""",
-                    "historical": """The angelic announcement came to shepherds keeping watch over their flocks by night, likely during lambing season when shepherds maintained constant vigilance. Shepherds were generally despised in first-century Jewish society, considered ceremonially unclean due to their work and unable to maintain ritual purity. Yet God chose them as the first recipients of the Messiah's birth announcement.<br><br>The proclamation echoes imperial Roman announcements of the emperor's birth or victories, which were called "gospel" (<em>euangelion</em>) and promised peace throughout the empire. The angels' message presents Jesus as the true king whose birth brings authentic peace, contrasting with Pax Romana maintained through military force.<br><br>Bethlehem's significance as David's birthplace would have been profound for Jewish hearers, as Messianic expectations focused on the Davidic covenant and promises of an eternal kingdom. The humble circumstances of Jesus' birth would have seemed paradoxical given royal expectations.""",
-                    "questions": [
-                        "How does God's choice to announce the Messiah's birth to shepherds challenge human concepts of status and importance?",
-                        "What is the relationship between the 'glory to God' and 'peace on earth' announced by the angels, and how are these connected through Christ?",
-                        "How does the biblical concept of peace differ from contemporary secular understandings of peace and conflict resolution?"
-                    ]
-                }
-            },
-            15: {
-                11: {
-                    "analysis": """<strong>A certain man had two sons.</strong> This simple opening to the parable of the prodigal son establishes the family context that drives the entire narrative. The "certain man" represents God the Father, whose character is revealed through his treatment of both sons. The "two sons" represent two fundamentally different approaches to relationship with God—one openly rebellious, the other outwardly compliant but inwardly resentful.<br><br>The parable structure follows the classic pattern of Jesus' teaching stories: a realistic scenario that suddenly takes an unexpected turn, challenging conventional wisdom and revealing kingdom values. The father's response to both sons defies cultural expectations and reveals the radical nature of divine grace.<br><br>This introduction sets up the central tension of the parable: how divine love responds to both flagrant sin and self-righteous legalism. Both sons are alienated from the father despite their different behaviors, suggesting that external conformity without heart transformation is as problematic as open rebellion.""",
-                    "historical": """The parable was told in response to Pharisees and scribes criticizing Jesus for eating with tax collectors and sinners (Luke 15:1-2). In first-century Jewish culture, table fellowship implied acceptance and approval, making Jesus' behavior scandalous to religious leaders who maintained strict separation from the ceremonially unclean.<br><br>The family dynamics described would have been familiar to Jesus' audience. Younger sons typically received one-third of the inheritance, while the eldest received a double portion. Requesting inheritance while the father lived was culturally unthinkable—equivalent to wishing the father dead. The father's granting this request would have shocked listeners.<br><br>The parable addresses the fundamental Jewish struggle with Gentile inclusion in God's kingdom. The religious leaders (represented by the elder son) resented God's acceptance of sinners without requiring full proselyte conversion and law observance.""",
-                    "questions": [
-                        "How do both sons in the parable represent different forms of alienation from the father, and what does this teach about human relationship with God?",
-                        "What does the father's character in this parable reveal about God's nature that challenges both legalistic and antinomian approaches to faith?",
-                        "How should this parable shape Christian attitudes toward both open sinners and self-righteous religious people?"
-                    ]
-                }
-            }
-        },
-        "Ephesians": {
-            2: {
-                8: {
-                    "analysis": """<strong>For by grace are ye saved through faith; and that not of yourselves: it is the gift of God.</strong> This verse provides the theological foundation of Protestant soteriology. "By grace" (<em>tē chariti</em>, τῇ χάριτι) emphasizes the instrumental cause of salvation—God's unmerited favor is the means by which salvation occurs. Grace is not merely divine attitude but active divine power working salvation.<br><br>"Through faith" (<em>dia pisteōs</em>, διὰ πίστεως) identifies faith as the channel through which grace is received. Faith is not a work that earns salvation but the empty hand that receives God's gift. The prepositions distinguish grace as the efficient cause and faith as the instrumental cause of salvation.<br><br>"Not of yourselves" (<em>ouk ex hymōn</em>, οὐκ ἐξ ὑμῶν) explicitly denies human contribution to salvation. The pronoun "that" (<em>touto</em>, τοῦτο) likely refers to the entire salvation process, not just faith, emphasizing that salvation in its entirety—including the faith to receive it—originates from God.""",
-                    "historical": """Paul wrote Ephesians during his Roman imprisonment (c. 60-62 CE) to address Gentile Christians who had been brought into the covenant community alongside Jewish believers. The letter addresses the theological implications of Jew-Gentile unity in the church and the foundation of this new community in God's grace rather than ethnic identity or law-keeping.<br><br>The emphasis on salvation by grace alone would have been particularly significant for Gentile converts who might have felt pressure to adopt Jewish customs or might have wondered about their standing before God without adherence to the Mosaic law. This passage provides assurance that their salvation rests on divine grace alone.<br><br>The concept of grace as divine gift contrasts with Greco-Roman reciprocal gift-giving, where gifts created obligations and expectations of return. Paul emphasizes that God's grace creates no obligation because it cannot be repaid—it is pure gift motivated by divine love.""",
-                    "questions": [
-                        "How does understanding salvation as entirely God's gift affect human pride and the tendency toward spiritual self-righteousness?",
-                        "What is the relationship between faith and works if salvation is by grace alone, and how does this understanding shape Christian living?",
-                        "How should the doctrine of salvation by grace alone influence evangelism and the church's approach to social action?"
-                    ]
-                }
-            },
-            6: {
-                10: {
-                    "analysis": """<strong>Finally, my brethren, be strong in the Lord, and in the power of his might.</strong> This verse introduces Paul's teaching on spiritual warfare with an emphasis on divine empowerment. "Be strong" (<em>endunamousthe</em>, ἐνδυναμοῦσθε) is a present passive imperative, indicating ongoing empowerment that comes from God rather than human effort. The passive voice emphasizes that strength comes from outside ourselves.<br><br>"In the Lord" (<em>en kyriō</em>, ἐν κυρίῳ) identifies the sphere and source of strength—union with Christ provides access to divine power. This prepositional phrase indicates not just help from God but participation in divine life and power through spiritual union.<br><br>"The power of his might" (<em>tō kratei tēs ischyos autou</em>, τῷ κράτει τῆς ἰσχύος αὐτοῦ) uses two Greek words for power, emphasizing the overwhelming nature of God's strength. <em>Kratos</em> refers to dominion and rule, while <em>ischys</em> refers to inherent strength and ability.""",
-                    "historical": """Paul writes from Roman imprisonment, where he would have observed the military equipment and discipline of Roman soldiers daily. His use of military metaphors draws from this immediate context to describe spiritual realities. Roman soldiers were renowned for their discipline, training, and equipment that made them nearly invincible in battle.<br><br>The Ephesian Christians lived in a city dominated by magical practices, occult arts, and pagan spirituality. Acts 19 describes how many converted Christians burned their magic books publicly. In this context, Paul's teaching about spiritual warfare would have been particularly relevant as new believers faced real spiritual opposition.<br><br>The emphasis on divine strength rather than human ability would have resonated with converts from both Jewish and pagan backgrounds, who might have been tempted to rely on their own religious practices, moral efforts, or spiritual techniques rather than on God's power.""",
-                    "questions": [
-                        "How does understanding spiritual strength as coming 'in the Lord' change approaches to Christian discipline and spiritual growth?",
-                        "What are the practical implications of relying on 'the power of his might' rather than human willpower in spiritual battles?",
-                        "How should awareness of spiritual warfare influence daily Christian living and decision-making?"
-                    ]
-                }
-            }
-        },
-        "Philippians": {
-            4: {
-                13: {
-                    "analysis": """<strong>I can do all things through Christ which strengtheneth me.</strong> This beloved verse is often misunderstood when separated from its context of contentment in various circumstances. "I can do all things" (<em>panta ischyō</em>, πάντα ἰσχύω) refers specifically to Paul's ability to be content in any situation—abundance or need, plenty or hunger. The "all things" refers to all circumstances, not all tasks or ambitions.<br><br>"Through Christ" (<em>en tō endunamounti me</em>, ἐν τῷ ἐνδυναμοῦντι με) literally reads "in the one strengthening me." The present participle indicates ongoing, continuous empowerment. Christ doesn't merely help Paul but provides the very strength and ability to respond appropriately to life's varied circumstances.<br><br>The context emphasizes supernatural contentment that transcends natural human responses to hardship or prosperity. This strength enables believers to maintain spiritual equilibrium regardless of external conditions, finding sufficiency in Christ rather than circumstances.""",
-                    "historical": """Paul wrote Philippians from Roman imprisonment, likely the house arrest described in Acts 28. Despite uncertain prospects and physical limitations, Paul demonstrates the contentment he describes. The Philippian church had sent financial support through Epaphroditus, prompting Paul's discussion of contentment and gratitude.<br><br>Ancient Stoic philosophy emphasized contentment and emotional equilibrium, but achieved through human reason and willpower. Paul presents a fundamentally different approach—contentment through divine empowerment rather than philosophical detachment. This would have been a striking contrast for readers familiar with Stoic teaching.<br><br>The historical context of imprisonment, where Paul lacked control over his circumstances, provides the perfect backdrop for demonstrating that true strength and contentment come from spiritual resources rather than favorable external conditions.""",
-                    "questions": [
-                        "How does understanding this verse in the context of contentment change its application from achieving goals to accepting circumstances?",
-                        "What is the difference between Stoic self-sufficiency and Christian contentment through Christ's strength?",
-                        "How can believers cultivate the kind of contentment Paul describes while still pursuing legitimate goals and improvements?"
-                    ]
-                }
-            }
-        },
-        "Hebrews": {
-            11: {
-                1: {
-                    "analysis": """<strong>Now faith is the substance of things hoped for, the evidence of things not seen.</strong> This verse provides the classic biblical definition of faith, describing both its nature and function. "Substance" (<em>hypostasis</em>, ὑπόστασις) literally means "that which stands under" or foundation, indicating that faith provides objective reality to hoped-for things, not merely subjective confidence. Faith gives substance to future promises, making them present realities in the believer's experience.<br><br>"Evidence" (<em>elegchos</em>, ἔλεγχος) refers to proof or conviction that establishes truth. Faith provides convincing evidence of invisible spiritual realities, functioning like a divine radar that detects what natural senses cannot perceive. This evidence is not emotional feeling but objective spiritual perception.<br><br>The verse establishes faith as the bridge between visible and invisible realms, enabling believers to live based on divine promises rather than immediate circumstances. Faith makes the future present and the invisible visible, providing the foundation for the life of obedience described in the following examples.""",
-                    "historical": """Hebrews was written to Jewish Christians facing persecution and temptation to return to Judaism. The recipients were wavering in their commitment to Christ, discouraged by suffering and the apparent delay of promised blessings. In this context, the definition of faith addresses their need for perseverance based on unseen realities.<br><br>The concept of faith as "substance" would have resonated with readers familiar with both Greek philosophical concepts and Hebrew understanding of God's covenant faithfulness. The author uses sophisticated Greek terminology to explain Hebrew concepts of trust and faithfulness to God.<br><br>Chapter 11 follows this definition with examples from Jewish history, demonstrating that faith has always been the operating principle for God's people. These examples would have encouraged wavering Jewish Christians by showing that their ancestors also lived by faith in God's promises rather than visible fulfillment.""",
-                    "questions": [
-                        "How does faith as 'substance' and 'evidence' differ from mere wishful thinking or blind belief?",
-                        "What role should faith play in decision-making when circumstances seem to contradict God's promises?",
-                        "How can believers develop the kind of faith that makes unseen realities more real than visible circumstances?"
-                    ]
-                }
-            },
-            12: {
-                1: {
-                    "analysis": """<strong>Wherefore seeing we also are compassed about with so great a cloud of witnesses, let us lay aside every weight, and the sin which doth so easily beset us, and let us run with patience the race that is set before us.</strong> This verse applies the examples of faith from chapter 11 to encourage perseverance. The "cloud of witnesses" (<em>nephos martyrōn</em>, νέφος μαρτύρων) refers to the heroes of faith who provide testimony to God's faithfulness, not spectators watching our performance. Their lives bear witness to the reliability of faith.<br><br>"Lay aside every weight" (<em>apothemenoi ogan</em>, ἀποθέμενοι ὄγκον) uses athletic imagery of runners removing unnecessary clothing and weights. "Weight" refers to anything that hinders spiritual progress—not necessarily sin but anything that slows spiritual advancement. The definite article before "sin" (<em>tēn hamartian</em>, τὴν ἁμαρτίαν) may refer to a specific besetting sin or the principle of sin itself.<br><br>"Run with patience" (<em>di' hypomonēs trechōmen</em>, δι' ὑπομονῆς τρέχωμεν) combines active effort with patient endurance. The Christian life requires both sustained effort and patient persistence, like a long-distance race rather than a sprint.""",
-                    "historical": """The athletic imagery would have been familiar to first-century readers who knew Greek Olympic games and local athletic competitions. Athletes trained rigorously, maintained strict diets, and competed naked to avoid any hindrance. This imagery emphasized the dedication and focus required for Christian living.<br><br>The original recipients faced mounting persecution and social pressure to abandon their Christian faith. Some were wavering, discouraged by suffering and the apparent delay of Christ's return. The author uses the metaphor of a race to encourage persistence despite difficulties.""",
-                    "questions": [
-                        "How do the 'witnesses' from Hebrews 11 provide encouragement for contemporary believers facing spiritual challenges?",
-                        "What specific 'weights' and 'sins' might hinder spiritual progress in modern Christian living?",
-                        "How does understanding the Christian life as a long-distance race change approaches to spiritual discipline and perseverance?"
-                    ]
-                }
-            }
-        },
-        "Isaiah": {
-            53: {
-                5: {
-                    "analysis": """<strong>But he was wounded for our transgressions, he was bruised for our iniquities: the chastisement of our peace was upon him; and with his stripes we are healed.</strong> This verse stands at the heart of the Suffering Servant song, providing the clearest Old Testament prophecy of substitutionary atonement. The four Hebrew verbs describe the Servant's suffering: "wounded" (<em>mecholal</em>, מְחֹלָל) from piercing, "bruised" (<em>medukka</em>, מְדֻכָּא) from crushing, bearing "chastisement" (<em>musar</em>, מוּסָר), and providing healing through "stripes" (<em>chaburah</em>, חַבּוּרָה).<br><br>The preposition "for" (<em>min</em>, מִן) indicates substitution—the Servant suffers in place of others. "Our transgressions" and "our iniquities" emphasize that the suffering is vicarious, not for the Servant's own sins. The parallel structure reinforces that the Servant's suffering directly addresses human sin and its consequences.<br><br>"The chastisement of our peace" indicates that the punishment necessary for reconciliation fell upon the Servant rather than the guilty parties. The word "peace" (<em>shalom</em>, שָׁלוֹם) encompasses complete well-being and restoration of relationship with God.""",
-                    "historical": """Isaiah prophesied during the 8th century BCE, addressing Judah's spiritual crisis and the threat of Assyrian invasion. The Suffering Servant songs (Isaiah 42, 49, 50, 52-53) present a figure who would accomplish what Israel failed to do—be a light to the nations and bring salvation to the ends of the earth.<br><br>Ancient Near Eastern cultures understood vicarious suffering and substitutionary rituals, but typically involved animals or slaves substituting for the guilty. The concept of a righteous individual voluntarily suffering for others' sins was unprecedented in scope and significance.<br><br>Jewish interpretation historically applied this passage to the nation of Israel or to righteous individuals within Israel. However, the New Testament writers consistently identified Jesus as the fulfillment of this prophecy, seeing in His crucifixion the precise fulfillment of Isaiah's description.""",
-                    "questions": [
-                        "How does Isaiah 53:5 explain the mechanism by which Christ's suffering accomplishes human salvation?",
-                        "What does the emphasis on 'our' transgressions and iniquities reveal about human responsibility and divine grace?",
-                        "How should understanding Christ as the Suffering Servant shape Christian responses to persecution and suffering?"
-                    ]
-                }
-            }
-        },
-        "Jeremiah": {
-            29: {
-                11: {
-                    "analysis": """<strong>For I know the thoughts that I think toward you, saith the Lord, thoughts of peace, and not of evil, to give you an expected end.</strong> This beloved promise reveals God's benevolent intentions toward His people during their darkest hour. "I know" (<em>yadati</em>, יָדַעְתִּי) indicates intimate, personal knowledge—God is fully aware of His plans and their ultimate purpose. The Hebrew word for "thoughts" (<em>machashavot</em>, מַחֲשָׁבוֹת) can mean plans, intentions, or purposes, emphasizing divine deliberation and planning.<br><br>"Thoughts of peace" (<em>machshevot shalom</em>, מַחְשְׁבוֹת שָׁלוֹם) uses <em>shalom</em> in its fullest sense—not mere absence of conflict but comprehensive well-being, prosperity, and harmonious relationship with God. This directly contrasts with the "evil" (<em>ra'ah</em>, רָעָה) or calamity that the people were experiencing in exile.<br><br>"An expected end" (<em>acharit vetikvah</em>, אַחֲרִית וְתִקְוָה) literally means "a future and a hope." This phrase promises both temporal restoration and ultimate eschatological fulfillment, giving hope beyond immediate circumstances.""",
-                    "historical": """Jeremiah spoke these words to the Jewish exiles in Babylon around 597-586 BCE, during one of the darkest periods in Jewish history. The temple had been destroyed, Jerusalem lay in ruins, and the covenant people found themselves in pagan lands, wondering if God had abandoned His promises.<br><br>False prophets in Babylon were promising immediate return and quick restoration, creating false hope and preventing the exiles from settling and building productive lives. Jeremiah's message required them to accept their situation while trusting God's long-term purposes—a difficult but necessary perspective.<br><br>The 70-year exile period mentioned in the broader context (v.10) corresponded to the sabbath years Israel had failed to observe (2 Chronicles 36:21), showing that even judgment served God's righteous purposes and would ultimately lead to restoration.""",
-                    "questions": [
-                        "How should believers understand God's 'plans for peace' when experiencing difficult circumstances or apparent setbacks?",
-                        "What is the relationship between trusting God's ultimate purposes and taking practical action in challenging situations?",
-                        "How does this promise apply to individual believers versus the corporate people of God, and what are the implications for personal application?"
-                    ]
-                }
-            }
-        },
-        "Proverbs": {
-            3: {
-                5: {
-                    "analysis": """<strong>Trust in the Lord with all thine heart; and lean not unto thine own understanding.</strong> This foundational proverb establishes the proper relationship between human reason and divine revelation. "Trust" (<em>batach</em>, בָּטַח) means to feel secure, confident, or safe—not mere intellectual assent but complete reliance. The phrase "with all thine heart" (<em>bekhol libbekha</em>, בְּכָל־לִבֶּךָ) demands total commitment, engaging the entire personality rather than partial allegiance.<br><br>"The Lord" uses the covenant name <em>Yahweh</em> (יהוה), emphasizing relationship with the God who has revealed Himself and proven faithful to His promises. This trust is not blind faith but confidence based on God's character and past faithfulness.<br><br>"Lean not unto thine own understanding" (<em>al tishaen</em>, אַל־תִּשָּׁעֵן) literally means "do not support yourself upon" human wisdom. This doesn't eliminate human reason but subordinates it to divine revelation. The contrast between "all your heart" and "your own understanding" emphasizes comprehensive trust versus limited human perspective.""",
-                    "historical": """Proverbs 3 forms part of Solomon's wisdom literature, written during Israel's golden age when wisdom and learning flourished. The historical Solomon gathered wisdom from various sources while maintaining that true wisdom begins with fear of the Lord (Proverbs 1:7).<br><br>Ancient Near Eastern wisdom literature typically emphasized human observation and practical experience as the source of wisdom. While Proverbs incorporates practical wisdom, it uniquely subordinates human understanding to divine revelation, setting Hebrew wisdom apart from contemporary cultures.<br><br>The proverb addresses the perpetual human tendency to rely on limited understanding rather than trusting divine guidance. This would have been particularly relevant for a young king like Solomon, who needed wisdom beyond human capability to govern God's people effectively.""",
-                    "questions": [
-                        "How do believers balance using God-given rational abilities while trusting God rather than human understanding?",
-                        "What are the practical implications of trusting God 'with all your heart' in decision-making and life planning?",
-                        "How does this proverb address the contemporary tension between secular education and biblical faith?"
-                    ]
-                }
-            }
-        },
-        "James": {
-            1: {
-                2: {
-                    "analysis": """<strong>My brethren, count it all joy when ye fall into divers temptations.</strong> This counterintuitive command challenges natural human responses to difficulty. "Count it" (<em>hēgēsasthe</em>, ἡγήσασθε) means to consider, regard, or evaluate—a deliberate mental process rather than emotional feeling. The aorist imperative suggests a decisive choice to view trials from God's perspective.<br><br>"All joy" (<em>pasan charan</em>, πᾶσαν χαράν) doesn't mean partial happiness but complete joy. This joy isn't based on the trials themselves but on their ultimate purpose and results. The joy comes from understanding God's purposes in allowing difficulties.<br><br>"When ye fall into" (<em>hotan peripesēte</em>, ὅταν περιπέσητε) uses a verb meaning to fall around or encounter unexpectedly. "Divers temptations" (<em>peirasmois poikilois</em>, πειρασμοῖς ποικίλοις) refers to various trials or tests—circumstances that reveal and develop character rather than enticements to sin.""",
-                    "historical": """James wrote to Jewish Christians scattered throughout the Roman Empire, likely during the persecution following Stephen's martyrdom (Acts 8:1). These believers faced both external persecution for their faith and internal struggles with favoritism, worldliness, and spiritual immaturity.<br><br>The recipients would have been familiar with Jewish understanding that suffering could serve divine purposes. The Old Testament taught that God tested His people to refine their faith (Deuteronomy 8:2-3), but James applies this principle to the new covenant community.<br><br>The early church's experience of persecution created a practical need for understanding how to respond to trials. James provides theological framework for viewing suffering as beneficial rather than merely enduring it passively.""",
-                    "questions": [
-                        "How can believers cultivate joy in trials without minimizing real pain or adopting superficial optimism?",
-                        "What is the difference between trials that test faith and temptations that lead to sin, and how should responses differ?",
-                        "How does understanding trials as having divine purpose change practical responses to unexpected difficulties?"
-                    ]
-                }
-            }
-        }
-    }
-
-    # Check for enhanced commentary first
-    if book in enhanced_commentary and chapter in enhanced_commentary[book] and verse.verse in enhanced_commentary[book][chapter]:
-        commentary_data = enhanced_commentary[book][chapter][verse.verse]
+    rng = commentary_rng(book, chapter, verse.verse)
+
+    # Curated commentary for key verses
+    commentary_data = get_curated_commentary(book, chapter, verse.verse)
+    if commentary_data is not None:
+        cross_references = commentary_data.get("cross_references")
+        if cross_references is None:
+            cross_references = generate_cross_references(book, chapter, verse.verse, verse.text, rng)
         return {
             "analysis": commentary_data["analysis"],
             "historical": commentary_data["historical"],
             "questions": commentary_data["questions"],
-            "cross_references": generate_cross_references(book, chapter, verse.verse, verse.text)
+            "cross_references": cross_references
         }
 
     # Special case for Revelation 1
     if book == "Revelation" and chapter == 1:
-        # Dictionary of specialized commentary for Revelation 1
-        revelation1_commentary = {
-            1: {
-                "analysis": """This opening verse establishes the divine origin of the Apocalypse (from Greek ἀποκάλυψις/<em>apokalypsis</em>, meaning "unveiling" or "revelation"). The chain of revelation is significant: from God, to Christ, to angel, to John, to the churches—establishing divine authority and authenticity. The phrase "things which must shortly come to pass" (ἃ δεῖ γενέσθαι ἐν τάχει) indicates both urgency and certainty, though not necessarily immediacy in human time scales. The Greek term ἐν τάχει can indicate rapidity of execution once something begins rather than imminence.<br><br>The phrase "signified it by his angel" uses the Greek ἐσήμανεν (from σημαίνω/<em>sēmainō</em>), literally meaning "to show by signs," hinting at the symbolic nature of the visions to follow. This carefully constructed introduction establishes: divine origin, Christological mediation, angelic communication, apostolic witness, and ecclesiastical destination.""",
-                "historical": """During the reign of Emperor Domitian (81-96 CE), imperial cult worship intensified throughout the Roman Empire. Domitian demanded to be addressed as "Lord and God" (<em>dominus et deus noster</em>), and erected statues of himself for veneration. Christians who refused to burn incense to the emperor or participate in imperial festivals faced economic sanctions, social ostracism, and sometimes execution.<br><br>Patmos, where John received this revelation, was a small, rocky island about 37 miles southwest of Miletus in the Aegean Sea. Roman authorities used such islands as places of exile for political prisoners. John identifies himself as there "for the word of God, and for the testimony of Jesus Christ" (v.9), indicating his exile was punishment for his Christian witness.<br><br>The seven churches addressed were located along a Roman postal route in the province of Asia (western Turkey), each facing unique local challenges while sharing the broader imperial context of Roman domination and pressure to compromise.""",
-                "questions": [
-                    "How does the concept of divine revelation through a chain of transmission (God→Christ→angel→John→churches) shape your understanding of biblical authority?",
-                    "In what ways does the description of Jesus 'signifying' the revelation suggest an approach to interpreting the symbolic language throughout the book?",
-                    "How should we understand the timeframe indicated by 'shortly come to pass' given that nearly 2,000 years have passed? What different interpretive approaches address this apparent tension?",
-                    "How might John's emphasis on the divine origin of this revelation have strengthened the resolve of persecuted believers in Asia Minor?"
-                ],
-                "cross_references": [
-                    {"text": "Daniel 2:28-29", "url": "/book/Daniel/chapter/2#verse-28", "context": "Things revealed about the latter days"},
-                    {"text": "John 15:15", "url": "/book/John/chapter/15#verse-15", "context": "Christ revealing the Father's will"},
-                    {"text": "Amos 3:7", "url": "/book/Amos/chapter/3#verse-7", "context": "God revealing secrets to prophets"},
-                    {"text": "2 Peter 1:20-21", "url": "/book/2 Peter/chapter/1#verse-20", "context": "Divine origin of prophecy"}
-                ]
-            },
-            4: {
-                "analysis": """This verse begins the formal epistolary greeting to the seven churches of Asia Minor. The trinitarian formula is striking and unique: the eternal Father ("who is, who was, and who is to come"), the sevenfold Spirit "before his throne," and Jesus Christ (fully described in v.5).<br><br>The description of God as "who is, who was, and who is to come" (ὁ ὢν καὶ ὁ ἦν καὶ ὁ ἐρχόμενος) forms a deliberate adaptation of God's self-revelation in Exodus 3:14. While Greek would normally render the divine name with "who was, who is, and who will be," John alters the final element to emphasize not just God's future existence but His active coming to establish His kingdom.<br><br>The "seven Spirits before his throne" has been interpreted in several ways: (1) the sevenfold manifestation of the Holy Spirit based on Isaiah 11:2-3, (2) the seven archangels of Jewish apocalyptic tradition, or (3) the perfection and completeness of the Holy Spirit. The context strongly suggests this refers to the Holy Spirit in His perfect fullness, as this forms part of the trinitarian greeting. The number seven appears 54 times in Revelation, consistently symbolizing divine completeness and perfection.""",
-                "historical": """The seven churches addressed—Ephesus, Smyrna, Pergamum, Thyatira, Sardis, Philadelphia, and Laodicea—were actual congregations in Asia Minor (modern western Turkey). They existed along a natural circular mail route approximately 100 miles in diameter.<br><br>Each city had distinctive characteristics:<br>• <strong>Ephesus</strong>: A major commercial center with the Temple of Artemis (one of the Seven Wonders of the ancient world)<br>• <strong>Smyrna</strong>: A beautiful port city known for emperor worship and fierce loyalty to Rome<br>• <strong>Pergamum</strong>: The provincial capital with an enormous altar to Zeus and a temple to Asclepius (god of healing)<br>• <strong>Thyatira</strong>: Known for trade guilds that posed idolatry challenges for Christians<br>• <strong>Sardis</strong>: Former capital of Lydia, known for wealth and textile industry<br>• <strong>Philadelphia</strong>: The youngest and smallest city, subject to earthquakes<br>• <strong>Laodicea</strong>: A banking center known for eye medicine and black wool<br><br>These churches represented the spectrum of faith communities, facing various challenges: persecution, false teaching, moral compromise, spiritual apathy, and economic pressure to participate in trade guild idolatry. Though historically specific, they also represent the complete church throughout history (seven symbolizing completeness).""",
-                "questions": [
-                    "What does the description of God as 'who is, who was, and who is to come' reveal about divine nature and how does this differ from Greek philosophical conceptions of deity?",
-                    "How does John's adaptation of the divine name from Exodus 3:14 emphasize God's active involvement in human history?",
-                    "What theological significance might the order of the Trinity in this greeting have (Father, Spirit, Son) compared to more common formulations?",
-                    "How might the believers in these seven diverse churches have found comfort in being addressed collectively under divine blessing?",
-                    "What might the image of the 'seven Spirits before his throne' suggest about the Holy Spirit's relationship to both the Father and the churches?"
-                ],
-                "cross_references": [
-                    {"text": "Exodus 3:14", "url": "/book/Exodus/chapter/3#verse-14", "context": "God as the 'I AM'"},
-                    {"text": "Isaiah 11:2-3", "url": "/book/Isaiah/chapter/11#verse-2", "context": "Seven aspects of the Spirit"},
-                    {"text": "Zechariah 4:2-10", "url": "/book/Zechariah/chapter/4#verse-2", "context": "Seven lamps as the eyes of the LORD"},
-                    {"text": "2 Corinthians 13:14", "url": "/book/2 Corinthians/chapter/13#verse-14", "context": "Trinitarian blessing"}
-                ]
-            },
-            7: {
-                "analysis": """This powerful verse serves as the central proclamation of Christ's eschatological return, combining two profound Old Testament prophecies in a remarkable synthesis: Daniel 7:13 ("coming with clouds") and Zechariah 12:10 ("they shall look upon me whom they have pierced").<br><br>The declaration begins dramatically with "Behold" (Ἰδού/<em>idou</em>), demanding attention to this climactic event. The "clouds" (νεφελῶν/<em>nephelōn</em>) evoke both the Old Testament theophany tradition where clouds symbolize divine presence (Exodus 13:21, 19:9) and Daniel's vision of the Son of Man coming with clouds to receive dominion and glory.<br><br>The universal witness to Christ's return ("every eye shall see him") emphasizes its public, unmistakable nature, contrasting with His first coming in relative obscurity. The specific mention of "they which pierced him" (ἐξεκέντησαν/<em>exekentēsan</em>, a direct reference to the crucifixion) and the mourning of "all kindreds of the earth" introduces a tension between judgment and potential repentance.<br><br>The verse concludes with divine affirmation—"Even so, Amen"—combining Greek (ναί/<em>nai</em>) and Hebrew (ἀμήν/<em>amēn</em>) expressions of certainty, emphasizing this event's absolute inevitability across all cultures.""",
-                "historical": """For Christians facing persecution under Domitian (81-96 CE), this proclamation of Christ's return as cosmic Lord would provide profound hope and perspective. Roman imperial ideology presented the emperor as divine ruler whose reign brought global peace (<em>pax Romana</em>). Imperial propaganda celebrated the emperor's <em>parousia</em> (arrival) to cities with elaborate ceremonies.<br><br>This verse subverts those imperial claims by declaring Jesus—not Caesar—as the true cosmic sovereign whose <em>parousia</em> will bring history to its climax. The language of "tribes of the earth mourning" (πᾶσαι αἱ φυλαὶ τῆς γῆς) echoes Roman triumphal processions where conquered peoples mourned as the victorious emperor processed through Rome.<br><br>For Jewish readers, the combination of Daniel 7:13 and Zechariah 12:10 was especially significant. While first-century Judaism typically separated the Messiah's coming from Yahweh's coming, John merges these, presenting Jesus as fulfilling both messianic hope and divine visitation. This would be both challenging and transformative for Jewish believers.<br><br>Archaeological evidence from the seven cities addressed shows extensive emperor worship installations. In Pergamum stood a massive temple to Augustus; in Ephesus was the Temple of Domitian with a 23-foot statue of the emperor. Against these claims of imperial divinity, the vision of Christ's return asserted true divine sovereignty.""",
-                "questions": [
-                    "How does the merging of Daniel 7:13 and Zechariah 12:10 transform our understanding of both prophecies, and what does this tell us about Christ's identity?",
-                    "What is the significance of the universal nature of Christ's return—that 'every eye shall see him'—in contrast to claims of secret or localized appearances?",
-                    "How might the phrase 'all kindreds of the earth shall wail because of him' be understood—is this solely judgment, or might it include elements of repentance and recognition?",
-                    "In what ways does the certainty of Christ's return as cosmic Lord challenge contemporary 'empires' and power structures?",
-                    "How should the tension between Christ's first coming in humility and His second coming in glory shape our understanding of God's redemptive work?"
-                ],
-                "cross_references": [
-                    {"text": "Daniel 7:13-14", "url": "/book/Daniel/chapter/7#verse-13", "context": "Son of Man coming with clouds"},
-                    {"text": "Zechariah 12:10-14", "url": "/book/Zechariah/chapter/12#verse-10", "context": "Looking on him whom they pierced"},
-                    {"text": "Matthew 24:30-31", "url": "/book/Matthew/chapter/24#verse-30", "context": "Christ's return with clouds and angels"},
-                    {"text": "1 Thessalonians 4:16-17", "url": "/book/1 Thessalonians/chapter/4#verse-16", "context": "The Lord's descent from heaven"},
-                    {"text": "John 19:34-37", "url": "/book/John/chapter/19#verse-34", "context": "Christ pierced on the cross"}
-                ]
-            },
-            13: {
-                "analysis": """This verse begins the extraordinary Christophany—the vision of the glorified Christ among the lampstands. The description combines elements of royal, priestly, prophetic, and divine imagery in a stunning portrait of Christ's transcendent glory.<br><br>The phrase "one like unto the Son of man" (ὅμοιον υἱὸν ἀνθρώπου) deliberately echoes Daniel 7:13-14, where the "Son of Man" comes with clouds and receives everlasting dominion. This title, Jesus' favorite self-designation in the Gospels, here takes on its full apocalyptic significance.<br><br>The clothing described has dual significance: the "garment down to the foot" (ποδήρη/<em>podērē</em>) recalls the high priest's robe (Exodus 28:4, 39:29) while the "golden girdle" or sash around the chest rather than waist suggests royal dignity. In combining these images, Christ is presented as both King and High Priest in the order of Melchizedek (Hebrews 7).<br><br>His position "in the midst of the seven lampstands" is theologically significant, showing Christ's immediate presence with and authority over the churches. The lampstands (later identified as the seven churches) allude to both the tabernacle menorah (Exodus 25:31-40) and Zechariah's vision (Zechariah 4:2-10), suggesting the churches' function as light-bearers in the world under Christ's oversight.""",
-                "historical": """In the Greco-Roman world of the late first century, this vision would have provided a stunning contrast to imperial imagery. Roman emperors were typically portrayed in statuary and coinage with idealized, youthful features, wearing the purple toga of authority, and often with radiate crowns suggesting solar divinity.<br><br>Domitian particularly promoted his divine status, having himself addressed as <em>dominus et deus noster</em> ("our lord and god"). In the provincial capital Pergamum (one of the seven churches addressed), a massive temple complex dedicated to emperor worship dominated the acropolis, visible throughout the city.<br><br>The Jewish community would have recognized multiple elements from prophetic tradition. The figure combines features from Ezekiel's vision of God's glory (Ezekiel 1:26-28), Daniel's "Ancient of Days" and "Son of Man" (Daniel 7:9-14, 10:5-6), and various theophany accounts. This deliberate merging of divine imagery with the human "Son of Man" figure creates one of the New Testament's most explicit presentations of Christ's deity.<br><br>Archaeological excavations at Ephesus (another of the seven churches) have uncovered a 23-foot statue of Emperor Domitian that once stood in his temple. John's vision provides the ultimate counter-imperial image: Christ as the true divine sovereign standing among His churches, outshining all imperial pretensions.""",
-                "questions": [
-                    "How does this vision of the glorified Christ compare with other portraits in Scripture, such as the transfiguration (Matthew 17:1-8) or Isaiah's throne room vision (Isaiah 6:1-5)?",
-                    "What theological significance does Christ's position 'in the midst of the seven lampstands' have for our understanding of His relationship to the church?",
-                    "How does the combination of royal, priestly, and divine imagery shape our understanding of Christ's multifaceted identity and work?",
-                    "In what ways might this vision of Christ have challenged first-century believers' perspectives and provided comfort during persecution?",
-                    "How should this majestic portrayal of Christ influence our worship and daily discipleship today?"
-                ],
-                "cross_references": [
-                    {"text": "Daniel 7:13-14", "url": "/book/Daniel/chapter/7#verse-13", "context": "Son of Man vision"},
-                    {"text": "Ezekiel 1:26-28", "url": "/book/Ezekiel/chapter/1#verse-26", "context": "Throne vision of divine glory"},
-                    {"text": "Exodus 28:4, 39:29", "url": "/book/Exodus/chapter/28#verse-4", "context": "High priestly garments"},
-                    {"text": "Hebrews 4:14-16", "url": "/book/Hebrews/chapter/4#verse-14", "context": "Christ as High Priest"},
-                    {"text": "Zechariah 4:2-10", "url": "/book/Zechariah/chapter/4#verse-2", "context": "Vision of the lampstand"}
-                ]
-            },
-            18: {
-                "analysis": """This triumphant declaration by the risen Christ contains some of the most profound Christological statements in Scripture. The opening "I am" (ἐγώ εἰμι/<em>egō eimi</em>) echoes God's self-revelation to Moses (Exodus 3:14) and continues John's high Christology throughout Revelation.<br><br>The phrase "he that liveth, and was dead" encapsulates the central paradox of Christian faith—Christ's death and resurrection. The Greek construction (ὁ ζῶν, καὶ ἐγενόμην νεκρὸς) emphasizes the contrast between His eternal living nature and the historical fact of His death. The perfect tense of "am alive" (ζῶν εἰμι) indicates a past action with continuing results—He lives now because He conquered death.<br><br>The declaration "I am alive forevermore" (ζῶν εἰμι εἰς τοὺς αἰῶνας τῶν αἰώνων) asserts Christ's eternal existence, while "Amen" provides divine self-affirmation.<br><br>The climactic statement about possessing "the keys of hell and of death" (τὰς κλεῖς τοῦ θανάτου καὶ τοῦ ᾅδου) draws on ancient imagery where keys symbolize authority and control. In Jewish apocalyptic literature, these keys belonged exclusively to God. Christ now claims this divine prerogative, declaring His absolute sovereignty over mortality and the afterlife—the ultimate source of human fear.""",
-                "historical": """For Christians facing potential martyrdom under Domitian's persecution, this verse would provide extraordinary comfort and courage. The Roman Empire's ultimate weapon against dissidents was death, but Christ's declaration neutralizes this threat by asserting His authority over death itself.<br><br>In Greco-Roman culture, Hades (ᾅδης, translated as "hell" in KJV) was understood as the realm of the dead, ruled by the god of the same name. Various mystery religions promised initiates privileged treatment in the afterlife, while imperial propaganda sometimes suggested the emperor controlled the destiny of subjects even after death.<br><br>Archaeological findings from the period show funerary inscriptions often expressing hopelessness regarding death. A common epitaph read "I was not, I became, I am not, I care not." Against this cultural backdrop of either fear or nihilism toward death, Christ's claim to hold death's keys would be revolutionary.<br><br>In Jewish tradition, Isaiah 22:22 presents God giving the "key of the house of David" to Eliakim, symbolizing transferred authority. The early church would understand Christ's possession of death's keys as fulfillment of His promise to Peter about the "keys of the kingdom" (Matthew 16:19)—but here magnified to cosmic proportions.<br><br>For the seven churches receiving this revelation—some already experiencing martyrdom (like Antipas in Pergamum, 2:13)—this verse transformed their understanding of persecution. Death was no longer defeat but transition into the realm still under Christ's authority.""",
-                "questions": [
-                    "How does Christ's claim to possess 'the keys of hell and of death' transform our understanding of mortality and the afterlife?",
-                    "In what ways does the paradox of Christ who died yet lives forever challenge both ancient and modern conceptions of divine nature?",
-                    "How might believers facing persecution or martyrdom throughout history have drawn strength from this verse?",
-                    "What practical implications does Christ's victory over death have for disciples facing suffering, bereavement, or their own mortality?",
-                    "How does this verse relate to Paul's teaching that 'the last enemy to be destroyed is death' (1 Corinthians 15:26)?"
-                ],
-                "cross_references": [
-                    {"text": "Isaiah 22:22", "url": "/book/Isaiah/chapter/22#verse-22", "context": "The key of David symbolizing authority"},
-                    {"text": "Romans 6:9-10", "url": "/book/Romans/chapter/6#verse-9", "context": "Christ dies no more, death has no dominion"},
-                    {"text": "1 Corinthians 15:54-57", "url": "/book/1 Corinthians/chapter/15#verse-54", "context": "Death is swallowed up in victory"},
-                    {"text": "Hebrews 2:14-15", "url": "/book/Hebrews/chapter/2#verse-14", "context": "Christ destroys death and delivers from its fear"},
-                    {"text": "Hosea 13:14", "url": "/book/Hosea/chapter/13#verse-14", "context": "Prophecy of ransom from death and redemption from the grave"}
-                ]
-            }
-        }
-
-        # If we have special commentary for this verse, use it
-        if verse.verse in revelation1_commentary:
-            return revelation1_commentary[verse.verse]
-
         # For other verses in Revelation 1, use enhanced but generalized commentary
-        analysis = f"This verse is part of John's apocalyptic vision of the glorified Christ. The symbolism connects to Old Testament prophetic tradition, particularly from Daniel and Ezekiel, while revealing Christ's divine nature and authority. The imagery of {get_key_phrase(verse.text.lower())} contributes to the overall majestic portrayal."
+        analysis = f"This verse is part of John's apocalyptic vision of the glorified Christ. The symbolism connects to Old Testament prophetic tradition, particularly from Daniel and Ezekiel, while revealing Christ's divine nature and authority. The imagery of {get_key_phrase(verse.text.lower(), rng)} contributes to the overall majestic portrayal."
 
         historical = f"Written during a time of imperial persecution under Domitian, this vision would have encouraged believers to remain faithful despite opposition. The apocalyptic imagery draws on Jewish prophetic traditions while speaking to the specific challenges faced by first-century Christians in Asia Minor."
 
@@ -2216,7 +2135,7 @@ def generate_commentary(book, chapter, verse):
         return {
             "analysis": analysis,
             "historical": historical,
-            "questions": random.sample(questions, 3),
+            "questions": rng.sample(questions, 3),
             "cross_references": cross_refs[:2]  # Limit to 2 references
         }
 
@@ -2262,44 +2181,80 @@ def generate_commentary(book, chapter, verse):
 
     # Return a dictionary with enhanced commentary components
     return {
-        "analysis": random.choice(analysis_templates),
-        "historical": random.choice(historical_templates),
-        "questions": random.sample(question_templates, 3),
+        "analysis": rng.choice(analysis_templates),
+        "historical": rng.choice(historical_templates),
+        "questions": rng.sample(question_templates, 3),
         "cross_references": cross_refs
     }
 
 
-def get_enhanced_theological_theme(verse_text, book):
-    """Extract primary theological theme from verse text considering book context"""
-    themes = {
-        # Core theological themes
-        "salvation": ["save", "redeem", "deliver", "rescue", "forgive", "justify", "sanctify"],
-        "covenant": ["covenant", "promise", "faithful", "oath", "testament", "pledge"],
-        "kingdom of God": ["kingdom", "reign", "rule", "throne", "dominion", "authority"],
-        "divine love": ["love", "mercy", "compassion", "grace", "kindness", "tender"],
-        "faith and obedience": ["faith", "believe", "trust", "obey", "follow", "serve"],
-        "judgment and justice": ["judge", "justice", "righteous", "condemn", "punish", "wrath"],
-        "worship and praise": ["worship", "praise", "glory", "honor", "magnify", "exalt"],
-        "suffering and persecution": ["suffer", "afflict", "persecute", "trial", "tribulation"],
-        "hope and restoration": ["hope", "restore", "renew", "heal", "comfort", "peace"],
-        "wisdom and understanding": ["wise", "wisdom", "understand", "knowledge", "discern"],
-        "creation and providence": ["create", "made", "form", "establish", "sustain", "provide"],
-        "sin and rebellion": ["sin", "transgress", "rebel", "iniquity", "evil", "wicked"]
-    }
+# Keywords that mark each theological theme in a verse
+THEOLOGICAL_THEMES = {
+    # Core theological themes
+    "salvation": ["save", "redeem", "deliver", "rescue", "forgive", "justify", "sanctify"],
+    "covenant": ["covenant", "promise", "faithful", "oath", "testament", "pledge"],
+    "kingdom of God": ["kingdom", "reign", "rule", "throne", "dominion", "authority"],
+    "divine love": ["love", "mercy", "compassion", "grace", "kindness", "tender"],
+    "faith and obedience": ["faith", "believe", "trust", "obey", "follow", "serve"],
+    "judgment and justice": ["judge", "justice", "righteous", "condemn", "punish", "wrath"],
+    "worship and praise": ["worship", "praise", "glory", "honor", "magnify", "exalt"],
+    "suffering and persecution": ["suffer", "afflict", "persecute", "trial", "tribulation"],
+    "hope and restoration": ["hope", "restore", "renew", "heal", "comfort", "peace"],
+    "wisdom and understanding": ["wise", "wisdom", "understand", "knowledge", "discern"],
+    "creation and providence": ["create", "made", "form", "establish", "sustain", "provide"],
+    "sin and rebellion": ["sin", "transgress", "rebel", "iniquity", "evil", "wicked"]
+}
+
+# Book-specific theme adjustments
+BOOK_THEMES = {
+    "Genesis": ["creation and providence", "covenant", "divine love"],
+    "Psalms": ["worship and praise", "divine love", "suffering and persecution"],
+    "Romans": ["salvation", "faith and obedience", "judgment and justice"],
+    "John": ["divine love", "salvation", "faith and obedience"],
+    "Revelation": ["kingdom of God", "judgment and justice", "hope and restoration"]
+}
+
+THEOLOGICAL_CONCEPTS = ["grace", "faith", "love", "righteousness", "salvation", "redemption",
+                        "covenant", "kingdom", "glory", "peace", "wisdom", "truth", "life",
+                        "hope", "mercy", "justice", "holiness", "forgiveness", "eternal life"]
+
+LINGUISTIC_INSIGHTS = {
+    "lord": "the covenant name Yahweh, emphasizing God's faithfulness to His promises",
+    "love": "agape in Greek contexts or hesed in Hebrew, indicating covenantal loyalty",
+    "faith": "pistis in Greek, encompassing both belief and faithfulness",
+    "salvation": "soteria in Greek or yeshua in Hebrew, indicating deliverance and wholeness",
+    "grace": "charis in Greek or hen in Hebrew, emphasizing unmerited divine favor"
+}
+
+COMMENTARY_THEMES = [
+    "redemption", "salvation", "faith", "obedience", "love",
+    "judgment", "mercy", "grace", "wisdom", "creation",
+    "covenant", "holiness", "righteousness", "truth", "hope",
+    "sacrifice", "worship", "prayer", "discipleship", "fellowship"
+]
+
+# Every keyword the helpers below look for, matched against a verse in one pass
+verse_keywords = KeywordMatcher([
+    *(word for words in THEOLOGICAL_THEMES.values() for word in words),
+    *THEOLOGICAL_CONCEPTS, *LINGUISTIC_INSIGHTS, *COMMENTARY_THEMES,
+    "lord", "god", "people", "nation", "love", "mercy", "grace",
+    "like", "as", "all", "every", "none", "nothing", "?",
+])
+
+
+@lru_cache(maxsize=1024)
+def find_verse_keywords(verse_text):
+    """Return the set of keywords that occur in a (lowercase) verse text"""
+    return verse_keywords.find(verse_text)
 
-    # Book-specific theme adjustments
-    book_themes = {
-        "Genesis": ["creation and providence", "covenant", "divine love"],
-        "Psalms": ["worship and praise", "divine love", "suffering and persecution"],
-        "Romans": ["salvation", "faith and obedience", "judgment and justice"],
-        "John": ["divine love", "salvation", "faith and obedience"],
-        "Revelation": ["kingdom of God", "judgment and justice", "hope and restoration"]
-    }
 
-    primary_themes = book_themes.get(book, list(themes.keys())[:3])
+def get_enhanced_theological_theme(verse_text, book):
+    """Extract primary theological theme from verse text considering book context"""
+    keywords = find_verse_keywords(verse_text)
+    primary_themes = BOOK_THEMES.get(book, list(THEOLOGICAL_THEMES)[:3])
 
     for theme in primary_themes:
-        if any(word in verse_text for word in themes[theme]):
+        if not keywords.isdisjoint(THEOLOGICAL_THEMES[theme]):
             return theme
 
     # Fallback to most common theme for the book
@@ -2307,18 +2262,16 @@ def get_enhanced_theological_theme(verse_text, book):
 
 def extract_theological_concept(verse_text, book):
     """Extract key theological concept from verse"""
-    concepts = ["grace", "faith", "love", "righteousness", "salvation", "redemption",
-               "covenant", "kingdom", "glory", "peace", "wisdom", "truth", "life",
-               "hope", "mercy", "justice", "holiness", "forgiveness", "eternal life"]
+    keywords = find_verse_keywords(verse_text)
 
-    for concept in concepts:
-        if concept in verse_text:
+    for concept in THEOLOGICAL_CONCEPTS:
+        if concept in keywords:
             return concept
 
     # Extract meaningful phrases if no single concept found
-    if "lord" in verse_text or "god" in verse_text:
+    if "lord" in keywords or "god" in keywords:
         return "divine sovereignty"
-    elif "people" in verse_text or "nation" in verse_text:
+    elif "people" in keywords or "nation" in keywords:
         return "covenant community"
     else:
         return "divine revelation"
@@ -2378,35 +2331,31 @@ def get_enhanced_cross_references(book, chapter, verse_number, verse_text, theme
 
 def get_literary_analysis(verse_text, book, literary_context):
     """Provide literary analysis of the verse within its context"""
-    if "lord" in verse_text or "god" in verse_text:
+    keywords = find_verse_keywords(verse_text)
+    if "lord" in keywords or "god" in keywords:
         return f"The divine name or title here functions within {literary_context} to establish theological authority and covenantal relationship."
-    elif any(word in verse_text for word in ["love", "mercy", "grace"]):
+    elif not keywords.isdisjoint(["love", "mercy", "grace"]):
         return f"The emotional and relational language employed here is characteristic of {literary_context}, emphasizing the personal nature of divine-human relationship."
     else:
         return f"The literary structure and word choice here contribute to {literary_context}, advancing the author's theological argument."
 
 def get_linguistic_insight(verse_text, book):
     """Provide insight into original language significance"""
-    insights = {
-        "lord": "the covenant name Yahweh, emphasizing God's faithfulness to His promises",
-        "love": "agape in Greek contexts or hesed in Hebrew, indicating covenantal loyalty",
-        "faith": "pistis in Greek, encompassing both belief and faithfulness",
-        "salvation": "soteria in Greek or yeshua in Hebrew, indicating deliverance and wholeness",
-        "grace": "charis in Greek or hen in Hebrew, emphasizing unmerited divine favor"
-    }
+    keywords = find_verse_keywords(verse_text)
 
-    for word, insight in insights.items():
-        if word in verse_text:
+    for word, insight in LINGUISTIC_INSIGHTS.items():
+        if word in keywords:
             return insight
     return "careful word choice that would have carried specific theological weight for the original audience"
 
 def get_rhetorical_device(verse_text):
     """Identify rhetorical or literary devices in the verse"""
-    if "like" in verse_text or "as" in verse_text:
+    keywords = find_verse_keywords(verse_text)
+    if "like" in keywords or "as" in keywords:
         return "simile or metaphorical language"
-    elif any(word in verse_text for word in ["all", "every", "none", "nothing"]):
+    elif not keywords.isdisjoint(["all", "every", "none", "nothing"]):
         return "universal language and absolute statements"
-    elif "?" in verse_text:
+    elif "?" in keywords:
         return "rhetorical questioning that engages the reader"
     else:
         return "declarative statements that establish theological truth"
@@ -2609,396 +2558,11 @@ def get_contemporary_theological_challenge(theme):
 
 def generate_chapter_overview(book, chapter, verses):
     """Generate an AI-powered overview of the entire chapter"""
-    # Special case for Revelation 1
-    if book == "Revelation" and chapter == 1:
-        return """
-    <p><strong>Revelation 1</strong> is the magnificent apocalyptic introduction to the final book of the Bible, often called the <em>Apocalypse</em> (from the Greek ἀποκάλυψις, meaning "unveiling" or "revelation"). Written during the reign of Emperor Domitian (c. 95 CE) when imperial persecution was intensifying, this chapter presents John's vision of the glorified Christ and establishes the divine authority behind the revelations that follow.</p>
-
-    <p>The author identifies himself as "John" (verse 1:1, 1:4, 1:9), traditionally understood to be the Apostle John, though some scholars propose it may be another John known as "John the Elder." He was exiled to Patmos, a small rocky island in the Aegean Sea about 37 miles southwest of Miletus, "for the word of God, and for the testimony of Jesus Christ" (verse 9).</p>
-
-    <h4 style="color: var(--primary-color); margin-top: 1.5rem;">Literary Structure and Context</h4>
-
-    <p>Revelation belongs to the apocalyptic genre, characterized by symbolic visions, supernatural beings, cosmic conflict, and the ultimate triumph of good over evil. This literary form was especially meaningful during times of persecution, offering hope through coded imagery that conveyed God's sovereignty over earthly powers.</p>
-
-    <p>This chapter establishes several literary patterns that will repeat throughout the book:</p>
-    <ul>
-        <li>The <strong>number seven</strong> (7 churches, 7 spirits, 7 golden lampstands, 7 stars) symbolizing divine completeness and perfection</li>
-        <li><strong>Divine titles</strong> expressing eternal nature ("Alpha and Omega," "First and Last," "Beginning and End")</li>
-        <li><strong>Old Testament allusions</strong>, particularly to Daniel, Ezekiel, and Isaiah</li>
-        <li><strong>Paradoxical imagery</strong> ("a Lamb as it had been slain" appears later but is foreshadowed by Christ who died yet lives)</li>
-    </ul>
-
-    <h4 style="color: var(--primary-color); margin-top: 1.5rem;">Chapter Structure</h4>
-
-    <ol>
-        <li><strong>Prologue (Verses 1-3)</strong>: Establishes the divine source and purpose of the revelation, promising blessing to those who read, hear, and keep these prophecies. The phrase "the time is at hand" creates eschatological urgency.</li>
-
-        <li><strong>Epistolary Greeting (Verses 4-8)</strong>: John addresses the seven churches of Asia Minor with a trinitarian blessing. This section contains the first of seven beatitudes in Revelation (verse 3) and introduces Christ with titles emphasizing His eternal nature, redemptive work, and future return.</li>
-
-        <li><strong>John's Commissioning Vision (Verses 9-16)</strong>: The exiled apostle receives his commission on "the Lord's day" (the first Christian use of this term in literature). Christ appears in transcendent glory among seven golden lampstands, with imagery drawing heavily from Daniel 7:13-14, Daniel 10:5-6, and Ezekiel 1:24-28. Each symbolic element (white hair, flaming eyes, bronze feet, thunderous voice) reveals an aspect of Christ's divine nature and authority.</li>
-
-        <li><strong>Christ's Self-Revelation and Command (Verses 17-20)</strong>: After John falls "as dead" before the vision (compare with Isaiah 6:5, Ezekiel 1:28, Daniel 10:8-9), Christ identifies Himself as the eternal living one who conquered death. He commands John to write what he sees, explaining the mystery of the seven stars (angels/messengers of the churches) and seven lampstands (the churches themselves).</li>
-    </ol>
-
-    <h4 style="color: var(--primary-color); margin-top: 1.5rem;">Historical Context</h4>
-
-    <p>Emperor Domitian (reigned 81-96 CE) intensified emperor worship throughout the Roman Empire, demanding to be addressed as "Lord and God" (<em>dominus et deus</em>). Christians who refused to participate in imperial cult rituals faced economic marginalization (foreshadowing the "mark of the beast"), social ostracism, and sometimes execution.</p>
-
-    <p>The seven churches addressed were located on a Roman postal route in Asia Minor (modern Turkey), each facing unique challenges:</p>
-    <ul>
-        <li><strong>Ephesus</strong>: A major commercial center with the Temple of Artemis</li>
-        <li><strong>Smyrna</strong>: Known for intense emperor worship and Jewish opposition to Christians</li>
-        <li><strong>Pergamum</strong>: Center of emperor worship with a large altar to Zeus</li>
-        <li><strong>Thyatira</strong>: Known for trade guilds that posed idolatry challenges</li>
-        <li><strong>Sardis</strong>: Former capital of Lydia, known for complacency</li>
-        <li><strong>Philadelphia</strong>: Smallest city, facing Jewish opposition</li>
-        <li><strong>Laodicea</strong>: Wealthy banking center known for lukewarm water supply</li>
-    </ul>
-
-    <h4 style="color: var(--primary-color); margin-top: 1.5rem;">Theological Significance</h4>
-
-    <p>Revelation 1 establishes several profound theological truths:</p>
-
-    <ol>
-        <li><strong>High Christology</strong>: Christ is portrayed with divine attributes and titles previously reserved for Yahweh in the Old Testament. This establishes one of the earliest and clearest presentations of Christ's deity in Christian literature.</li>
-
-        <li><strong>Divine Sovereignty</strong>: Despite the apparent triumph of evil powers (Roman persecution), God remains enthroned and history moves toward His predetermined conclusion.</li>
-
-        <li><strong>Trinitarian Framework</strong>: The greeting in verses 4-5 includes all three persons of the Trinity, with the unusual description of the Holy Spirit as "the seven spirits before his throne" (possibly referring to Isaiah 11:2-3 or Zechariah 4:1-10).</li>
-
-        <li><strong>Church Identity</strong>: The churches are represented as lampstands with Christ moving among them, suggesting both their mission to bear light and Christ's evaluative presence.</li>
-
-        <li><strong>Victory Through Suffering</strong>: John, a "companion in tribulation" (verse 9), writes from exile, establishing that God's revelation comes in the midst of, not despite, suffering. Christ is identified as one who "loved us, and washed us from our sins in his own blood" (verse 5), linking redemption to sacrificial suffering.</li>
-    </ol>
-
-    <p>When studying Revelation 1, it's essential to approach the text with awareness of its apocalyptic genre, historical context, and symbolic language. The chapter forms the foundation for understanding the entire book, introducing themes, symbols, and theological concepts that will be developed throughout the subsequent visions.</p>
-
-    <p>For believers under persecution, whether in the first century or today, this chapter offers the profound assurance that Christ – the Alpha and Omega, the First and Last – remains sovereign over history and present with His church through all tribulations.</p>
-    """
-
-    # Simulated chapter overview for other chapters
-    themes = [get_theme(v.text.lower()) for v in verses[:5]]  # Sample themes from the first few verses
-    unique_themes = list(set(themes))[:3]  # Get up to 3 unique themes
-
-    chapter_type = get_chapter_type(book, chapter)
-    time_period = get_time_period(book)
-    historical_context = get_historical_context(book)
-
-    overview = f"""
-    <p><strong>{book} {chapter}</strong> is a {chapter_type} chapter in the {get_testament_for_book(book)} that explores themes of {', '.join(unique_themes)}.
-    Written during {time_period}, this chapter should be understood within its historical context: {historical_context}</p>
-
-    <p>The chapter can be divided into several sections:</p>
-
-    <ol>
-        <li><strong>Verses 1-{min(5, len(verses))}</strong>: Introduction and setting the context</li>
-        {'<li><strong>Verses 6-' + str(min(12, len(verses))) + '</strong>: Development of key themes</li>' if len(verses) > 5 else ''}
-        {'<li><strong>Verses 13-' + str(min(20, len(verses))) + '</strong>: Central message and teachings</li>' if len(verses) > 12 else ''}
-        {'<li><strong>Verses ' + str(min(21, len(verses))) + '-' + str(len(verses)) + '</strong>: Conclusion and application</li>' if len(verses) > 20 else ''}
-    </ol>
-
-    <p>This chapter is significant because it {get_chapter_significance(book, chapter)}.
-    When studying this passage, it's important to consider both its immediate context within {book}
-    and its broader place in the scriptural canon.</p>
-    """
+    rng = commentary_rng(book, chapter)
 
-    return overview
-
-
-def generate_cross_references(book, chapter, verse, verse_text):
-    """Generate simulated cross-references for a verse"""
-    # Dictionary of sample cross-references by theme with actual verse texts
-    theme_references = {
-        "salvation": [
-            {"book": "John", "chapter": 3, "verse": 16, "context": "God's love and salvation", "verse_text": "For God so loved the world, that he gave his only begotten Son, that whosoever believeth in him should not perish, but have everlasting life."},
-            {"book": "Romans", "chapter": 10, "verse": 9, "context": "Confession and belief for salvation", "verse_text": "That if thou shalt confess with thy mouth the Lord Jesus, and shalt believe in thine heart that God hath raised him from the dead, thou shalt be saved."},
-            {"book": "Ephesians", "chapter": 2, "verse": 8, "context": "Salvation by grace through faith", "verse_text": "For by grace are ye saved through faith; and that not of yourselves: it is the gift of God:"}
-        ],
-        "faith": [
-            {"book": "Hebrews", "chapter": 11, "verse": 1, "context": "Definition of faith", "verse_text": "Now faith is the substance of things hoped for, the evidence of things not seen."},
-            {"book": "James", "chapter": 2, "verse": 17, "context": "Faith and works", "verse_text": "Even so faith, if it hath not works, is dead, being alone."},
-            {"book": "Romans", "chapter": 1, "verse": 17, "context": "The righteous shall live by faith", "verse_text": "For therein is the righteousness of God revealed from faith to faith: as it is written, The just shall live by faith."}
-        ],
-        "love": [
-            {"book": "1 Corinthians", "chapter": 13, "verse": 4, "context": "Characteristics of love", "verse_text": "Charity suffereth long, and is kind; charity envieth not; charity vaunteth not itself, is not puffed up,"},
-            {"book": "1 John", "chapter": 4, "verse": 8, "context": "God is love", "verse_text": "He that loveth not knoweth not God; for God is love."},
-            {"book": "John", "chapter": 15, "verse": 13, "context": "Greatest form of love", "verse_text": "Greater love hath no man than this, that a man lay down his life for his friends."}
-        ],
-        "judgment": [
-            {"book": "Matthew", "chapter": 25, "verse": 31, "context": "Final judgment", "verse_text": "When the Son of man shall come in his glory, and all the holy angels with him, then shall he sit upon the throne of his glory:"},
-            {"book": "Romans", "chapter": 2, "verse": 1, "context": "Judging others", "verse_text": "Therefore thou art inexcusable, O man, whosoever thou art that judgest: for wherein thou judgest another, thou condemnest thyself; for thou that judgest doest the same things."},
-            {"book": "Revelation", "chapter": 20, "verse": 12, "context": "Judgment according to deeds", "verse_text": "And I saw the dead, small and great, stand before God; and the books were opened: and another book was opened, which is the book of life: and the dead were judged out of those things which were written in the books, according to their works."}
-        ],
-        "creation": [
-            {"book": "Genesis", "chapter": 1, "verse": 1, "context": "Creation of heavens and earth", "verse_text": "In the beginning God created the heaven and the earth."},
-            {"book": "Psalm", "chapter": 19, "verse": 1, "context": "Heavens declare God's glory", "verse_text": "The heavens declare the glory of God; and the firmament sheweth his handywork."},
-            {"book": "Colossians", "chapter": 1, "verse": 16, "context": "All things created through Christ", "verse_text": "For by him were all things created, that are in heaven, and that are in earth, visible and invisible, whether they be thrones, or dominions, or principalities, or powers: all things were created by him, and for him:"}
-        ],
-        "prayer": [
-            {"book": "Matthew", "chapter": 6, "verse": 9, "context": "The Lord's Prayer", "verse_text": "After this manner therefore pray ye: Our Father which art in heaven, Hallowed be thy name."},
-            {"book": "1 Thessalonians", "chapter": 5, "verse": 17, "context": "Pray without ceasing", "verse_text": "Pray without ceasing."},
-            {"book": "James", "chapter": 5, "verse": 16, "context": "Prayer of the righteous", "verse_text": "Confess your faults one to another, and pray one for another, that ye may be healed. The effectual fervent prayer of a righteous man availeth much."}
-        ],
-        "wisdom": [
-            {"book": "Proverbs", "chapter": 9, "verse": 10, "context": "Beginning of wisdom", "verse_text": "The fear of the Lord is the beginning of wisdom: and the knowledge of the holy is understanding."},
-            {"book": "James", "chapter": 1, "verse": 5, "context": "Ask God for wisdom", "verse_text": "If any of you lack wisdom, let him ask of God, that giveth to all men liberally, and upbraideth not; and it shall be given him."},
-            {"book": "1 Corinthians", "chapter": 1, "verse": 25, "context": "God's wisdom vs man's", "verse_text": "Because the foolishness of God is wiser than men; and the weakness of God is stronger than men."}
-        ],
-        "hope": [
-            {"book": "Romans", "chapter": 15, "verse": 13, "context": "God of hope", "verse_text": "Now the God of hope fill you with all joy and peace in believing, that ye may abound in hope, through the power of the Holy Ghost."},
-            {"book": "Hebrews", "chapter": 6, "verse": 19, "context": "Hope as anchor", "verse_text": "Which hope we have as an anchor of the soul, both sure and stedfast, and which entereth into that within the veil;"},
-            {"book": "1 Peter", "chapter": 1, "verse": 3, "context": "Living hope", "verse_text": "Blessed be the God and Father of our Lord Jesus Christ, which according to his abundant mercy hath begotten us again unto a lively hope by the resurrection of Jesus Christ from the dead,"}
-        ],
-        "peace": [
-            {"book": "John", "chapter": 14, "verse": 27, "context": "Christ's peace", "verse_text": "Peace I leave with you, my peace I give unto you: not as the world giveth, give I unto you. Let not your heart be troubled, neither let it be afraid."},
-            {"book": "Philippians", "chapter": 4, "verse": 7, "context": "Peace that passes understanding", "verse_text": "And the peace of God, which passeth all understanding, shall keep your hearts and minds through Christ Jesus."},
-            {"book": "Isaiah", "chapter": 26, "verse": 3, "context": "Perfect peace", "verse_text": "Thou wilt keep him in perfect peace, whose mind is stayed on thee: because he trusteth in thee."}
-        ]
-    }
-
-    # Identify themes in the verse text
-    verse_themes = []
-    for theme in theme_references.keys():
-        if theme in verse_text or random.random() < 0.2:  # Randomly include some themes
-            verse_themes.append(theme)
-
-    # If no themes match, pick a random theme
-    if not verse_themes:
-        verse_themes = [random.choice(list(theme_references.keys()))]
-
-    # Get references for identified themes
-    references = []
-    for theme in verse_themes[:2]:  # Limit to two themes
-        theme_refs = theme_references[theme]
-        for ref in random.sample(theme_refs, min(2, len(theme_refs))):
-            # Skip self-references
-            if ref["book"] == book and ref["chapter"] == chapter and ref["verse"] == verse:
-                continue
-
-            references.append({
-                "text": f"{ref['book']} {ref['chapter']}:{ref['verse']}",
-                "url": f"/book/{ref['book']}/chapter/{ref['chapter']}#verse-{ref['verse']}",
-                "context": ref["context"],
-                "verse_text": ref["verse_text"]
-            })
-
-    # Ensure we have at least one reference
-    if not references:
-        references.append({
-            "text": "John 1:1",
-            "url": "/book/John/chapter/1#verse-1",
-            "context": "Related teaching",
-            "verse_text": "In the beginning was the Word, and the Word was with God, and the Word was God."
-        })
-
-    return references
-
-
-def get_theme(text):
-    """Extract a thematic element from text"""
-    themes = [
-        "redemption", "salvation", "faith", "obedience", "love",
-        "judgment", "mercy", "grace", "wisdom", "creation",
-        "covenant", "holiness", "righteousness", "truth", "hope",
-        "sacrifice", "worship", "prayer", "discipleship", "fellowship"
-    ]
-
-    # First check if any themes appear directly in the text
-    for theme in themes:
-        if theme in text:
-            return theme
-
-    # Otherwise return a random theme
-    return random.choice(themes)
-
-
-def get_key_phrase(text):
-    """Extract a key phrase from the text"""
-    # Split the text into phrases
-    phrases = text.replace(".", ". ").replace(";", "; ").replace(":", ": ").split()
-
-    # Select a phrase of 3-5 words if the text is long enough
-    if len(phrases) > 5:
-        start = random.randint(0, len(phrases) - 5)
-        length = random.randint(3, min(5, len(phrases) - start))
-        return " ".join(phrases[start:start+length])
-    else:
-        # If text is short, just return a portion of it
-        return text[:min(len(text), 30)]
-
-
-def get_language_feature(text):
-    """Identify a language feature"""
-    features = [
-        "metaphorical language", "symbolic imagery", "parallelism",
-        "rhetorical questioning", "imperative form", "poetic structure",
-        "narrative technique", "prophetic language", "didactic teaching",
-        "pastoral guidance", "theological explanation", "eschatological reference"
-    ]
-    return random.choice(features)
-
-
-def get_literary_device(text):
-    """Identify a literary device"""
-    devices = [
-        "metaphor", "simile", "allusion", "personification", "hyperbole",
-        "chiasm", "merism", "synecdoche", "parallelism", "inclusio",
-        "rhetorical question", "allegory", "symbolic language", "irony"
-    ]
-
-    # Special case for Revelation text which is highly symbolic
-    if "throne" in text.lower() or "lamb" in text.lower() or "seal" in text.lower():
-        return "apocalyptic symbolism"
-
-    return random.choice(devices)
-
-
-def get_concept(text):
-    """Identify a theological concept"""
-    concepts = [
-        "divine sovereignty", "human responsibility", "covenant faithfulness",
-        "sacrificial atonement", "spiritual renewal", "moral obligation",
-        "divine justice", "eschatological hope", "messianic expectation",
-        "communal worship", "spiritual discipline", "ethical living",
-        "divine revelation", "prophetic fulfillment", "kingdom ethics"
-    ]
-    return random.choice(concepts)
-
-
-def get_cultural_element(text):
-    """Identify a cultural element"""
-    elements = [
-        "religious practice", "social custom", "cultural tradition",
-        "political structure", "economic system", "family relationship",
-        "legal requirement", "worship ritual", "purity regulation",
-        "agricultural reference", "military imagery", "architectural feature"
-    ]
-    return random.choice(elements)
-
-
-
-
-def get_chapter_type(book, chapter):
-    """Identify the type of chapter"""
-    # Simplified mapping of books to primary genre
-    book_genres = {
-        # Torah
-        "Genesis": "narrative",
-        "Exodus": "narrative with legal sections",
-        "Leviticus": "legal and ritual",
-        "Numbers": "mixed narrative and legal",
-        "Deuteronomy": "sermonic and legal",
-
-        # Historical
-        "Joshua": "historical narrative",
-        "Judges": "cyclical narrative",
-        "Ruth": "historical narrative",
-        "1 Samuel": "biographical narrative",
-        "2 Samuel": "biographical narrative",
-        "1 Kings": "historical narrative",
-        "2 Kings": "historical narrative",
-        "1 Chronicles": "historical and genealogical",
-        "2 Chronicles": "historical narrative",
-        "Ezra": "historical narrative",
-        "Nehemiah": "historical memoir",
-        "Esther": "historical narrative",
-
-        # Wisdom
-        "Job": "wisdom dialogue",
-        "Psalms": "poetic and liturgical",
-        "Proverbs": "wisdom sayings",
-        "Ecclesiastes": "philosophical reflection",
-        "Song of Solomon": "poetic love song",
-
-        # Prophetic
-        "Isaiah": "prophetic oracle",
-        "Jeremiah": "prophetic oracle",
-        "Lamentations": "funeral dirge",
-        "Ezekiel": "prophetic vision",
-        "Daniel": "apocalyptic and narrative",
-        "Hosea": "prophetic oracle",
-        "Joel": "prophetic oracle",
-        "Amos": "prophetic oracle",
-        "Obadiah": "prophetic oracle",
-        "Jonah": "prophetic narrative",
-        "Micah": "prophetic oracle",
-        "Nahum": "prophetic oracle",
-        "Habakkuk": "prophetic dialogue",
-        "Zephaniah": "prophetic oracle",
-        "Haggai": "prophetic oracle",
-        "Zechariah": "prophetic vision",
-        "Malachi": "prophetic disputation",
-
-        # Gospels
-        "Matthew": "biographical gospel",
-        "Mark": "action-oriented gospel",
-        "Luke": "historical gospel",
-        "John": "theological gospel",
-
-        # Acts
-        "Acts": "historical narrative",
-
-        # Epistles
-        "Romans": "theological epistle",
-        "1 Corinthians": "pastoral epistle",
-        "2 Corinthians": "apologetic epistle",
-        "Galatians": "polemical epistle",
-        "Ephesians": "theological epistle",
-        "Philippians": "friendship epistle",
-        "Colossians": "christological epistle",
-        "1 Thessalonians": "eschatological epistle",
-        "2 Thessalonians": "eschatological epistle",
-        "1 Timothy": "pastoral epistle",
-        "2 Timothy": "pastoral epistle",
-        "Titus": "pastoral epistle",
-        "Philemon": "personal epistle",
-        "Hebrews": "homiletical epistle",
-        "James": "wisdom epistle",
-        "1 Peter": "pastoral epistle",
-        "2 Peter": "polemical epistle",
-        "1 John": "theological epistle",
-        "2 John": "pastoral epistle",
-        "3 John": "personal epistle",
-        "Jude": "polemical epistle",
-
-        # Apocalyptic
-        "Revelation": "apocalyptic vision"
-    }
-
-    # Special cases for specific chapters
-    special_chapters = {
-        ("Genesis", 1): "creation account",
-        ("Genesis", 3): "fall narrative",
-        ("Exodus", 20): "legal covenant",
-        ("Leviticus", 16): "ritual instruction",
-        ("Deuteronomy", 28): "covenant blessing and curse",
-        ("Joshua", 1): "commissioning narrative",
-        ("Judges", 2): "paradigmatic narrative",
-        ("1 Samuel", 16): "anointing narrative",
-        ("2 Samuel", 7): "covenant narrative",
-        ("Psalms", 1): "wisdom psalm",
-        ("Psalms", 22): "lament psalm",
-        ("Psalms", 23): "shepherd psalm",
-        ("Psalms", 24): "royal psalm",
-        ("Psalms", 25): "prayer psalm",
-        ("Psalms", 26): "trust psalm",
-        ("Psalms", 27): "hope psalm",
-        ("Psalms", 28): "deliverance psalm",
-        ("Psalms", 29): "praise psalm",
-        ("Psalms", 30): "joy psalm",
-        ("Psalms", 31): "suffering psalm",
-        ("Psalms", 32): "wisdom psalm",
-        ("Psalms", 33): "praise psalm",
-        ("Psalms", 34): "praise psalm",
-        ("Psalms", 35): "praise psalm",
-        ("Psalms", 36): "praise psalm"
-    }
-
-def generate_chapter_overview(book, chapter, verses):
-    """Generate an AI-powered overview of the entire chapter"""
     # Simulated chapter overview
-    themes = [get_theme(v.text.lower()) for v in verses[:5]]  # Sample themes from the first few verses
-    unique_themes = list(set(themes))[:3]  # Get up to 3 unique themes
+    themes = [get_theme(v.text.lower(), rng) for v in verses[:5]]  # Sample themes from the first few verses
+    unique_themes = list(dict.fromkeys(themes))[:3]  # Get up to 3 unique themes
 
     chapter_type = get_chapter_type(book, chapter)
     time_period = get_time_period(book)
@@ -3017,7 +2581,7 @@ def generate_chapter_overview(book, chapter, verses):
         {'<li><strong>Verses ' + str(min(21, len(verses))) + '-' + str(len(verses)) + '</strong>: Conclusion and application</li>' if len(verses) > 20 else ''}
     </ol>
 
-    <p>This chapter is significant because it {get_chapter_significance(book, chapter)}.
+    <p>This chapter is significant because it {get_chapter_significance(book, chapter, rng)}.
     When studying this passage, it's important to consider both its immediate context within {book}
     and its broader place in the scriptural canon.</p>
     """
@@ -3025,8 +2589,10 @@ def generate_chapter_overview(book, chapter, verses):
     return overview
 
 
-def generate_cross_references(book, chapter, verse, verse_text):
+def generate_cross_references(book, chapter, verse, verse_text, rng=None):
     """Generate simulated cross-references for a verse"""
+    rng = rng or commentary_rng(book, chapter, verse)
+
     # Dictionary of sample cross-references by theme
     theme_references = {
         "salvation": [
@@ -3059,18 +2625,18 @@ def generate_cross_references(book, chapter, verse, verse_text):
     # Identify themes in the verse text
     verse_themes = []
     for theme in theme_references.keys():
-        if theme in verse_text or random.random() < 0.2:  # Randomly include some themes
+        if theme in verse_text or rng.random() < 0.2:  # Randomly include some themes
             verse_themes.append(theme)
 
     # If no themes match, pick a random theme
     if not verse_themes:
-        verse_themes = [random.choice(list(theme_references.keys()))]
+        verse_themes = [rng.choice(list(theme_references.keys()))]
 
     # Get references for identified themes
     references = []
     for theme in verse_themes[:2]:  # Limit to two themes
         theme_refs = theme_references[theme]
-        for ref in random.sample(theme_refs, min(2, len(theme_refs))):
+        for ref in rng.sample(theme_refs, min(2, len(theme_refs))):
             # Skip self-references
             if ref["book"] == book and ref["chapter"] == chapter and ref["verse"] == verse:
                 continue
@@ -3083,7 +2649,7 @@ def generate_cross_references(book, chapter, verse, verse_text):
 
     # Ensure we have at least one reference
     if not references:
-        random_book = random.choice(["Matthew", "John", "Romans", "Psalms", "Proverbs"])
+        random_book = rng.choice(["Matthew", "John", "Romans", "Psalms", "Proverbs"])
         references.append({
             "text": f"{random_book} 1:1",
             "url": f"/book/{random_book}/chapter/1#verse-1",
@@ -3093,81 +2659,88 @@ def generate_cross_references(book, chapter, verse, verse_text):
     return references
 
 
-def get_theme(text):
+def get_theme(text, rng=None):
     """Extract a thematic element from text"""
-    themes = [
-        "redemption", "salvation", "faith", "obedience", "love",
-        "judgment", "mercy", "grace", "wisdom", "creation",
-        "covenant", "holiness", "righteousness", "truth", "hope",
-        "sacrifice", "worship", "prayer", "discipleship", "fellowship"
-    ]
+    rng = rng or commentary_rng(text)
+    keywords = find_verse_keywords(text)
 
     # First check if any themes appear directly in the text
-    for theme in themes:
-        if theme in text:
+    for theme in COMMENTARY_THEMES:
+        if theme in keywords:
             return theme
 
     # Otherwise return a random theme
-    return random.choice(themes)
+    return rng.choice(COMMENTARY_THEMES)
 
 
-def get_key_phrase(text):
+def get_key_phrase(text, rng=None):
     """Extract a key phrase from the text"""
+    rng = rng or commentary_rng(text)
+
     # Split the text into phrases
     phrases = text.replace(".", ". ").replace(";", "; ").replace(":", ": ").split()
 
     # Select a phrase of 3-5 words if the text is long enough
     if len(phrases) > 5:
-        start = random.randint(0, len(phrases) - 5)
-        length = random.randint(3, min(5, len(phrases) - start))
+        start = rng.randint(0, len(phrases) - 5)
+        length = rng.randint(3, min(5, len(phrases) - start))
         return " ".join(phrases[start:start+length])
     else:
         # If text is short, just return a portion of it
         return text[:min(len(text), 30)]
 
 
-def get_language_feature(text):
+def get_language_feature(text, rng=None):
     """Identify a language feature"""
+    rng = rng or commentary_rng(text)
+
     features = [
         "metaphorical language", "symbolic imagery", "parallelism",
         "rhetorical questioning", "imperative form", "poetic structure",
         "narrative technique", "prophetic language", "didactic teaching",
         "pastoral guidance", "theological explanation", "eschatological reference"
     ]
-    return random.choice(features)
+    return rng.choice(features)
 
 
-def get_literary_device(text):
+def get_literary_device(text, rng=None):
     """Identify a literary device"""
+    rng = rng or commentary_rng(text)
+
     devices = [
         "metaphor", "simile", "allusion", "personification", "hyperbole",
         "chiasm", "merism", "synecdoche", "parallelism", "inclusio",
         "rhetorical question", "allegory", "symbolic language", "irony"
     ]
-    return random.choice(devices)
+    return rng.choice(devices)
+
 
+CONCEPTS = [
+    "divine sovereignty", "human responsibility", "covenant faithfulness",
+    "sacrificial atonement", "spiritual renewal", "moral obligation",
+    "divine justice", "eschatological hope", "messianic expectation",
+    "communal worship", "spiritual discipline", "ethical living",
+    "divine revelation", "prophetic fulfillment", "kingdom ethics"
+]
 
-def get_concept(text):
+CULTURAL_ELEMENTS = [
+    "religious practice", "social custom", "cultural tradition",
+    "political structure", "economic system", "family relationship",
+    "legal requirement", "worship ritual", "purity regulation",
+    "agricultural reference", "military imagery", "architectural feature"
+]
+
+
+def get_concept(text, rng=None):
     """Identify a theological concept"""
-    concepts = [
-        "divine sovereignty", "human responsibility", "covenant faithfulness",
-        "sacrificial atonement", "spiritual renewal", "moral obligation",
-        "divine justice", "eschatological hope", "messianic expectation",
-        "communal worship", "spiritual discipline", "ethical living",
-        "divine revelation", "prophetic fulfillment", "kingdom ethics"
-    ]
-    return random.choice(concepts)
+    rng = rng or commentary_rng(text)
+    return rng.choice(CONCEPTS)
 
 
-def get_cultural_element(text):
+def get_cultural_element(text, rng=None):
     """Identify a cultural element"""
-    elements = [
-        "religious practice", "social custom", "cultural tradition",
-        "political structure", "economic system", "family relationship",
-        "legal requirement", "worship ritual", "purity regulation",
-        "agricultural reference", "military imagery", "architectural feature"
-    ]
-    return random.choice(elements)
+    rng = rng or commentary_rng(text)
+    return rng.choice(CULTURAL_ELEMENTS)
 
 
 def get_time_period(book):
@@ -3485,8 +3058,10 @@ def get_testament_for_book(book):
     return "Old Testament" if book in old_testament else "New Testament"
 
 
-def get_chapter_significance(book, chapter):
+def get_chapter_significance(book, chapter, rng=None):
     """Generate significance explanation for a chapter"""
+    rng = rng or commentary_rng(book, chapter)
+
     significance_templates = [
         "provides essential context for understanding God's covenant relationship with His people",
         "reveals key aspects of God's character through divine actions and declarations",
@@ -3517,7 +3092,7 @@ def get_chapter_significance(book, chapter):
     if (book, chapter) in special_significance:
         return special_significance[(book, chapter)]
     else:
-        return random.choice(significance_templates)
+        return rng.choice(significance_templates)
 
 
 def generate_book_commentary(book, chapters):
@@ -3994,7 +3569,21 @@ def generate_chapter_summaries(book, chapters):
 @app.get("/health")
 def health_check():
     """Health check endpoint for monitoring"""
-    return {"status": "healthy", "service": "kjv-study"}
+    return {
+        "status": "healthy",
+        "service": "kjv-study",
+        "bible_loaded": bible.is_ready(),
+        "search_cache": search_cache.stats(),
+        "chapter_cache": chapter_cache.stats(),
+    }
+
+
+@app.get("/ready")
+def readiness_check():
+    """Readiness endpoint: 503 until the Bible corpus has been loaded"""
+    if not bible.is_ready():
+        return JSONResponse({"status": "loading", "service": "kjv-study"}, status_code=503)
+    return {"status": "ready", "service": "kjv-study"}
 
 
 def generate_literary_features(book, genre):
@@ -4629,7 +4218,7 @@ def generate_book_tags(book, genre):
         tags.extend(book_specific_tags[book])
 
     # Return unique tags
-    return list(set(tags))
+    return list(dict.fromkeys(tags))
 
 
 def get_book_genre(book):
@@ -0,0 +1,88 @@
+"""Normalization of KJV word forms for search.
+
+normalize_word() maps an inflected or archaic form to the base word it comes
+from, so a search for one form also finds the others:
+
+    believeth, believest, believed, believing  -> believe
+    lovedst, loveth, lovest, loving, loves     -> love
+    sinneth, sinned                            -> sin
+    hath, hast, hadst                          -> have
+
+Suffixes are only stripped when the result is a word that actually occurs
+in the corpus (possibly after restoring a final "e", undoubling a consonant
+or turning "i" back into "y"), which keeps the light suffix rules from
+inventing stems such as "nazar" from "Nazareth".
+"""
+
+# Archaic forms that are not a suffix away from their base word.
+IRREGULAR_FORMS = {
+    "hath": "have",
+    "hast": "have",
+    "hadst": "have",
+    "doth": "do",
+    "dost": "do",
+    "didst": "do",
+    "saith": "say",
+    "shalt": "shall",
+    "wilt": "will",
+    "canst": "can",
+    "wast": "was",
+    "wert": "were",
+    "spake": "speak",
+}
+
+# Words that only look inflected ("forest" is not "for" + "-est").
+NOT_INFLECTED = frozenset([
+    "forest", "earnest", "digest", "wicked", "evening",
+])
+
+# (suffix, shortest base it may leave), tried in order.
+SUFFIXES = [
+    ("'s", 2),
+    ("edst", 2),
+    ("eth", 2),
+    ("est", 2),
+    ("ing", 3),
+    ("ed", 3),
+    ("s", 2),
+    ("es", 2),
+]
+
+VOWELS = frozenset("aeiou")
+
+
+def _attested(base, known):
+    """Returns the word in known that base is a stem of, or None."""
+    candidates = [base, base + "e"]
+    if len(base) > 2 and base[-1] == base[-2] and base[-1] not in VOWELS:
+        candidates.append(base[:-1])
+    if base.endswith("i"):
+        candidates.append(base[:-1] + "y")
+
+    for candidate in candidates:
+        if candidate in known:
+            return candidate
+    return None
+
+
+def normalize_word(word, known):
+    """Returns the base form of a lowercase word, or the word itself.
+
+    known is the set (or dict) of words in the corpus; a suffix is only
+    removed if what remains is one of them.
+    """
+    base = IRREGULAR_FORMS.get(word)
+    if base is not None:
+        return base if base in known else word
+
+    if len(word) < 5 or word in NOT_INFLECTED:
+        return word
+
+    for suffix, shortest in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= shortest:
+            base = _attested(word[:-len(suffix)], known)
+            if base is not None and base != word:
+                # "blessings" -> "blessing" -> "bless"
+                return normalize_word(base, known)
+
+    return word
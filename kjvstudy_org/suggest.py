@@ -0,0 +1,174 @@
+"""Search box autocomplete: book names, verse references and frequent words.
+
+Suggestions come from sorted arrays searched with bisect, so each keystroke
+costs a few binary searches instead of a search over the corpus:
+
+    "Jo"            -> Joshua, Job, Joel, ...    (book names and abbreviations)
+    "John 3:1"      -> John 3:1, John 3:10, ...  (from the chapter index)
+    "kingdom of he" -> kingdom of heaven, ...    (vocabulary, most frequent first)
+    "Melchisedek"   -> Melchisedec               (typo corrections)
+"""
+
+import heapq
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from urllib.parse import quote_plus
+
+from .kjv import bible
+from .references import BOOK_ABBREVIATIONS, BOOK_NAME_PATTERN, normalize_book_name
+from .search import TOKEN_PATTERN, get_search_index
+
+# "<book> <chapter>" or "<book> <chapter>:<verse prefix>".
+PARTIAL_REFERENCE_PATTERN = re.compile(
+    rf"^(?P<book>{BOOK_NAME_PATTERN})(?:\s*\.)?\s*(?P<chapter>\d+)(?:\s*[:.]\s*(?P<verse>\d*))?$",
+    re.IGNORECASE,
+)
+
+DEFAULT_SUGGESTION_LIMIT = 8
+
+
+def _prefix_range(keys, prefix):
+    """Returns the (start, end) slice of the sorted keys that start with prefix."""
+    start = bisect_left(keys, prefix)
+    end = bisect_left(keys, prefix + "\uffff", start)
+    return start, end
+
+
+class SuggestionIndex:
+    """Prefix lookups over the books, references and words of a Bible."""
+
+    def __init__(self, bible, search_index):
+        self.bible = bible
+
+        # Book name keys ("john", "jn", "1john", "songofsolomon") -> book, sorted.
+        book_keys = {}
+        for book in bible.get_books():
+            book_keys[normalize_book_name(book)] = book
+            for abbreviation in BOOK_ABBREVIATIONS.get(book, ()):
+                book_keys.setdefault(abbreviation, book)
+        self.book_keys = sorted(book_keys)
+        self.book_names = [book_keys[key] for key in self.book_keys]
+
+        # Vocabulary words (already sorted) and the number of verses they occur in.
+        self.search_index = search_index
+        self.words = search_index.vocabulary
+        self.word_numbers = search_index.word_numbers
+        self.word_counts = array("I", (len(search_index.postings[word]) for word in self.words))
+
+    @lru_cache(maxsize=4096)
+    def suggest(self, query, limit=DEFAULT_SUGGESTION_LIMIT):
+        """Returns up to limit suggestions for a partially typed query."""
+        query = query.strip()
+        if not query:
+            return []
+
+        references = self.suggest_references(query, limit)
+        if references is not None:
+            return references
+
+        suggestions = self.suggest_books(query, limit)
+        suggestions += self.suggest_words(query, limit - len(suggestions))
+        return suggestions
+
+    def suggest_books(self, query, limit):
+        """Completes a book name or abbreviation ("Jo" -> Joshua, Job, ...)."""
+        key = normalize_book_name(query)
+        if not key:
+            return []
+        start, end = _prefix_range(self.book_keys, key)
+        books = sorted(set(self.book_names[start:end]), key=self.bible.book_ordinal)
+        return [
+            {
+                "text": book,
+                "type": "book",
+                "url": f"/book/{book}",
+                "preview": f"{len(self.bible.get_chapters_for_book(book))} chapters",
+            }
+            for book in books[:limit]
+        ]
+
+    def suggest_references(self, query, limit):
+        """Completes a chapter or verse number ("John 3:1" -> John 3:1, 3:10, ...).
+
+        Returns None if the query does not look like a reference to a book.
+        """
+        match = PARTIAL_REFERENCE_PATTERN.match(query)
+        if match is None:
+            return None
+        book = self.bible.resolve_book(match.group("book"))
+        if book is None:
+            return None
+
+        chapter_prefix = match.group("chapter")
+        verse_prefix = match.group("verse")
+
+        if verse_prefix is None:
+            chapters = [c for c in self.bible.get_chapters_for_book(book) if str(c).startswith(chapter_prefix)]
+            return [
+                {
+                    "text": f"{book} {chapter}",
+                    "type": "chapter",
+                    "url": f"/book/{book}/chapter/{chapter}",
+                    "preview": self.bible.get_verse_text(book, chapter, 1) or "",
+                }
+                for chapter in chapters[:limit]
+            ]
+
+        chapter = int(chapter_prefix)
+        verse_ids = [
+            verse_id for verse_id in self.bible.get_verse_ids_by_book_chapter(book, chapter)
+            if str(verse_id & 0xFF).startswith(verse_prefix)
+        ]
+        return [
+            {
+                "text": self.bible.format_reference(verse_id),
+                "type": "verse",
+                "url": f"/book/{book}/chapter/{chapter}#verse-{verse_id & 0xFF}",
+                "preview": self.bible.get_text_by_id(verse_id),
+            }
+            for verse_id in verse_ids[:limit]
+        ]
+
+    def suggest_words(self, query, limit):
+        """Completes the last word of a query with the most frequent matching words."""
+        if limit <= 0:
+            return []
+
+        tokens = list(TOKEN_PATTERN.finditer(query.lower()))
+        if not tokens or tokens[-1].end() != len(query):
+            return []
+        last = tokens[-1]
+
+        start, end = _prefix_range(self.words, last.group())
+        best = heapq.nlargest(limit, range(start, end), key=self.word_counts.__getitem__)
+        if not best:
+            # No word starts with it: suggest corrections for a typo instead.
+            best = [self.word_numbers[word] for word in self.search_index.fuzzy_words(last.group())[:limit]]
+
+        head = query[:last.start()]
+        return [
+            {
+                "text": head + self.words[i],
+                "type": "word",
+                "url": f"/search?q={quote_plus(head + self.words[i])}",
+                "preview": f"{self.word_counts[i]:,} verses",
+            }
+            for i in best
+        ]
+
+
+_suggestion_index = None
+_suggestion_index_lock = threading.Lock()
+
+
+def get_suggestion_index():
+    """Returns the shared suggestion index, building it (once) on first use."""
+    global _suggestion_index
+    if _suggestion_index is None:
+        with _suggestion_index_lock:
+            if _suggestion_index is None:
+                _suggestion_index = SuggestionIndex(bible, get_search_index())
+    return _suggestion_index
@@ -0,0 +1,35 @@
+# PATH HACK
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from kjvstudy_org.cache import LRUCache
+
+
+def test_lru_eviction_by_size():
+    cache = LRUCache(5, sizeof=len)
+    cache.set("a", [1, 2])
+    cache.set("b", [1, 2])
+    assert cache.get("a") == [1, 2]
+
+    # "b" is now the least recently used.
+    cache.set("c", [1, 2])
+    assert cache.get("b") is None
+    assert cache.get("a") == [1, 2]
+    assert cache.get("c") == [1, 2]
+
+    # Too big to cache at all.
+    cache.set("d", [1] * 6)
+    assert cache.get("d") is None
+
+    assert cache.stats() == {
+        "entries": 2, "size": 4, "max_size": 5,
+        "hits": 3, "misses": 2, "evictions": 1, "hit_rate": 0.6,
+    }
+
+
+def test_ttl_expiry():
+    cache = LRUCache(10, ttl=-1)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0 and cache.size == 0
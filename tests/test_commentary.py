@@ -0,0 +1,111 @@
+# PATH HACK
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from kjvstudy_org.commentary import (
+    PrecomputedCommentary, commentary_fingerprint, get_curated_commentary, load_curated_commentary,
+    write_precomputed_commentary,
+)
+from kjvstudy_org.keywords import KeywordMatcher
+from kjvstudy_org.kjv import Verse
+from kjvstudy_org.server import (
+    chapter_cache, commentary_rng, generate_chapter_overview, generate_commentary, get_chapter_commentary,
+)
+
+
+def test_curated_commentary():
+    commentary = load_curated_commentary()
+
+    assert ("John", 3, 16) in commentary
+    assert all(entry["analysis"] and entry["historical"] and entry["questions"] for entry in commentary.values())
+    assert "cross_references" in commentary[("Revelation", 1, 1)]
+
+    assert get_curated_commentary("John", 3, 16) == commentary[("John", 3, 16)]
+    assert get_curated_commentary("John", 3, 17) is None
+
+
+OBADIAH = [
+    Verse(book="Obadiah", chapter=1, verse=1, text="The vision of Obadiah. Thus saith the Lord GOD concerning Edom;"),
+    Verse(book="Obadiah", chapter=1, verse=2, text="Behold, I have made thee small among the heathen: thou art greatly despised."),
+]
+
+
+def test_generated_commentary_is_deterministic():
+    assert generate_commentary("Obadiah", 1, OBADIAH[0]) == generate_commentary("Obadiah", 1, OBADIAH[0])
+    assert generate_chapter_overview("Obadiah", 1, OBADIAH) == generate_chapter_overview("Obadiah", 1, OBADIAH)
+    assert commentary_rng("Obadiah", 1, 1).random() == commentary_rng("Obadiah", 1, 1).random()
+    assert commentary_rng("Obadiah", 1, 1).random() != commentary_rng("Obadiah", 1, 2).random()
+
+
+def test_precomputed_commentary(tmp_path):
+    def commentary(text, references=1):
+        return {
+            "analysis": f"Analysis of {text}",
+            "historical": "Shared history",
+            "questions": [f"Why {text}?", "Shared question"],
+            "cross_references": [
+                {"text": "John 1:1", "url": "/book/John/chapter/1#verse-1", "context": text}
+            ] * references,
+        }
+
+    entries = [
+        (("John", 3, 16), commentary("John 3:16")),
+        (("John", 3, 17), commentary("John 3:17", 0)),
+        (("1 John", 4, 8), commentary("Ω", 2)),
+    ]
+    path = write_precomputed_commentary(tmp_path / "commentary.kjvm", entries, b"f" * 16)
+    precomputed = PrecomputedCommentary(path)
+
+    assert len(precomputed) == 3 and precomputed.fingerprint == b"f" * 16
+    for reference, expected in entries:
+        assert precomputed.get(*reference) == expected
+    assert precomputed.get("John", 3, 18) is None
+    assert precomputed.get("Acts", 1, 1) is None
+
+    with pytest.raises(ValueError):
+        write_precomputed_commentary(tmp_path / "unordered.kjvm", entries[::-1], b"f" * 16)
+
+
+def test_commentary_fingerprint(tmp_path, monkeypatch):
+    curated = tmp_path / "commentary.json"
+    corpus = tmp_path / "verses.json"
+    curated.write_text("{}")
+    corpus.write_text("[]")
+
+    fingerprint = commentary_fingerprint("", curated, corpus)
+    assert len(fingerprint) == 16
+    assert commentary_fingerprint("", curated, corpus) == fingerprint
+    assert commentary_fingerprint("2", curated, corpus) != fingerprint
+
+    corpus.write_text("[ ]")
+    assert commentary_fingerprint("", curated, corpus) != fingerprint
+    changed_corpus = commentary_fingerprint("", curated, corpus)
+
+    monkeypatch.setattr("kjvstudy_org.commentary.GENERATOR_VERSION", 2)
+    assert commentary_fingerprint("", curated, corpus) != changed_corpus
+
+
+def test_chapter_commentary_cache():
+    chapter_cache.clear()
+    hits = chapter_cache.hits
+
+    commentaries, overview = get_chapter_commentary("Obadiah", 1, OBADIAH)
+    assert list(commentaries) == [1, 2]
+    assert overview == generate_chapter_overview("Obadiah", 1, OBADIAH)
+    assert 0 < chapter_cache.size <= chapter_cache.max_size
+
+    assert get_chapter_commentary("Obadiah", 1, OBADIAH).commentaries is commentaries
+    assert chapter_cache.hits == hits + 1
+
+
+def test_keyword_matcher():
+    matcher = KeywordMatcher(["faith", "faithful", "as", "sin", "eternal life", "?"])
+
+    # Same as substring tests: inside words, overlapping, and across spaces.
+    assert matcher.find("he was faithful in business") == {"faith", "faithful", "as", "sin"}
+    assert matcher.find("is it eternal life?") == {"eternal life", "?"}
+    assert matcher.find("eternal  life") == set()
+    assert matcher.find("") == set()
@@ -1,9 +1,11 @@
 # PATH HACK
+import json
 import os
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from kjvstudy_org.kjv import VerseReference
+from kjvstudy_org.corpus import build_corpus
+from kjvstudy_org.kjv import Bible, LazyBible, Verse, VerseRecord, VerseReference, make_verse_id, split_verse_id
 
 def test_verse_references():
     # Test the parsing of a verse reference string
@@ -19,3 +21,146 @@ def test_verse_references():
     assert VerseReference.from_string("Matthew 5:14") == VerseReference(
         book="Matthew", chapter=5, verse=14
     )
+
+
+def test_bible_chapter_index(tmp_path):
+    # Keys are deliberately out of order to check the index sorts verses.
+    corpus = tmp_path / "verses.json"
+    corpus.write_text(json.dumps({
+        "Genesis 1:1": "# In the beginning God created the heaven and the earth.",
+        "Genesis 1:2": "And the earth was without form, and void;",
+        "Song of Solomon 1:1": "The song of songs, which [is] Solomon's.",
+        "Genesis 2:1": "Thus the heavens and the earth were finished,",
+        "Genesis 1:10": "And God called the dry [land] Earth;",
+    }))
+    bible = Bible(corpus)
+
+    assert bible.get_books() == ["Genesis", "Song of Solomon"]
+    assert bible.get_chapters_for_book("Genesis") == [1, 2]
+    assert bible.get_chapters() == [("Genesis", 1), ("Genesis", 2), ("Song of Solomon", 1)]
+    assert [v.verse for v in bible.get_verses_by_book_chapter("Genesis", 1)] == [1, 2, 10]
+    assert bible.get_verses_by_book_chapter("Genesis", 1)[0].text.startswith("In the beginning")
+    assert bible.get_verses_by_book_chapter("Genesis", 3) == []
+    assert bible.get_verses_by_book_chapter("Exodus", 1) == []
+
+
+def test_bible_cleans_text_once(tmp_path):
+    corpus = tmp_path / "verses.json"
+    corpus.write_text(json.dumps({
+        "Genesis 1:1": "# In the beginning God created the heaven and the earth.",
+        "Genesis 1:10": "And God called the dry [land] Earth;",
+    }))
+
+    bible = Bible(corpus)
+    assert bible.get_verse_text("Genesis", 1, 10) == "And God called the dry land Earth;"
+    assert bible["Genesis 1:1"] == "In the beginning God created the heaven and the earth."
+    assert bible.get_verse_text("Genesis", 1, 2) is None
+
+    bible = Bible(corpus, keep_raw=True)
+    assert bible.get_raw_verse_text("Genesis", 1, 10) == "And God called the dry [land] Earth;"
+
+
+def test_binary_corpus_matches_json(tmp_path):
+    source = tmp_path / "verses.json"
+    source.write_text(json.dumps({
+        "Genesis 1:1": "# In the beginning God created the heaven and the earth.",
+        "Genesis 1:2": "And the earth was without form, and void;",
+        "Song of Solomon 1:1": "The song of songs, which [is] Solomon's.",
+        "Genesis 2:1": "Thus the heavens and the earth were finished,",
+    }))
+    target = build_corpus(source, tmp_path / "verses.kjvc")
+
+    json_bible = Bible(source)
+    binary_bible = Bible(target)
+
+    assert dict(binary_bible.verses) == json_bible.verses
+    assert binary_bible.get_chapters() == json_bible.get_chapters()
+    assert binary_bible.get_verse_text("Song of Solomon", 1, 1) == "The song of songs, which is Solomon's."
+    assert "Genesis 3:1" not in binary_bible.verses
+
+
+def test_lazy_bible_loads_on_first_use(tmp_path):
+    corpus = tmp_path / "verses.json"
+    corpus.write_text(json.dumps({"Genesis 1:1": "# In the beginning God created the heaven and the earth."}))
+
+    bible = LazyBible(corpus)
+    assert not bible.is_ready()
+    assert bible.get_books() == ["Genesis"]
+    assert bible.is_ready()
+    assert bible["Genesis 1:1"].startswith("In the beginning")
+
+
+def test_verse_ids(tmp_path):
+    assert make_verse_id(43, 3, 16) == 0x2B0310
+    assert split_verse_id(make_verse_id(43, 3, 16)) == (43, 3, 16)
+    assert make_verse_id(1, 1, 1) < make_verse_id(1, 1, 2) < make_verse_id(1, 2, 1) < make_verse_id(2, 1, 1)
+
+    corpus = tmp_path / "verses.json"
+    corpus.write_text(json.dumps({
+        "Genesis 1:2": "And the earth was without form, and void;",
+        "Genesis 1:1": "# In the beginning God created the heaven and the earth.",
+        "Song of Solomon 1:1": "The song of songs, which [is] Solomon's.",
+    }))
+    bible = Bible(corpus)
+
+    verse_id = bible.get_verse_id("Song of Solomon", 1, 1)
+    assert verse_id == make_verse_id(2, 1, 1)
+    assert bible.book_ordinal("Song of Solomon") == 2
+    assert bible.book_name(2) == "Song of Solomon"
+    assert bible.format_reference(verse_id) == "Song of Solomon 1:1"
+    assert bible.get_text_by_id(verse_id) == "The song of songs, which is Solomon's."
+    assert list(bible.iter_verse_ids()) == [0x10101, 0x10102, 0x20101]
+    assert bible.get_verse_id("Genesis", 1, 3) is None
+    assert bible.get_verse_id("Exodus", 1, 1) is None
+
+
+def test_verse_records(tmp_path):
+    corpus = tmp_path / "verses.json"
+    corpus.write_text(json.dumps({
+        "Genesis 1:1": "# In the beginning God created the heaven and the earth.",
+        "Genesis 1:2": "And the earth was without form, and void;",
+    }))
+    bible = Bible(corpus)
+
+    records = list(bible.iter_verse_records())
+    assert records[1] == VerseRecord("Genesis", 1, 2, "And the earth was without form, and void;", 0x10102)
+    assert bible.get_verses_by_book_chapter("Genesis", 1) == records
+    assert list(bible.iter_verses()) == [record.to_verse() for record in records]
+    assert isinstance(next(bible.iter_verses()), Verse)
+
+
+def test_reference_parser(tmp_path):
+    corpus = tmp_path / "verses.json"
+    corpus.write_text(json.dumps({
+        **{f"John 3:{v}": f"John three {v}" for v in range(1, 37)},
+        **{f"John 4:{v}": f"John four {v}" for v in range(1, 55)},
+        **{f"1 Corinthians 13:{v}": f"Charity {v}" for v in range(1, 14)},
+        **{f"Ephesians 2:{v}": f"Ephesians two {v}" for v in range(1, 23)},
+    }))
+    bible = Bible(corpus)
+
+    def ref(book, chapter, verse):
+        return bible.get_verse_id(book, chapter, verse)
+
+    assert bible.parse_reference("John 3:16") == ((ref("John", 3, 16),) * 2,)
+    assert bible.parse_reference("Jn 3:16") == bible.parse_reference("John 3:16")
+    assert bible.parse_reference("Ephesians 2:8-9") == ((ref("Ephesians", 2, 8), ref("Ephesians", 2, 9)),)
+    assert bible.parse_reference("John 3:35-4:2") == ((ref("John", 3, 35), ref("John", 4, 2)),)
+    assert bible.parse_reference("John 3:16, 18; 4:1") == (
+        (ref("John", 3, 16), ref("John", 3, 16)),
+        (ref("John", 3, 18), ref("John", 3, 18)),
+        (ref("John", 4, 1), ref("John", 4, 1)),
+    )
+    assert bible.parse_reference("1 Cor 13") == ((ref("1 Corinthians", 13, 1), ref("1 Corinthians", 13, 13)),)
+    assert bible.parse_reference("I Cor. 13:4") == bible.parse_reference("1 Corinthians 13:4")
+    assert bible.parse_reference(" 1 Cor . 13 : 4 ") == bible.parse_reference("1 Corinthians 13:4")
+    assert bible.parse_reference("John 3:16; Eph 2:8") == (
+        (ref("John", 3, 16), ref("John", 3, 16)),
+        (ref("Ephesians", 2, 8), ref("Ephesians", 2, 8)),
+    )
+    assert len(list(bible.iter_verse_ids_in_spans(bible.parse_reference("John 3:35-4:2")))) == 4
+
+    assert bible.parse_reference("John 5:1") is None
+    assert bible.parse_reference("Genesis 1:1") is None
+    assert bible.parse_reference("the love of God") is None
+    assert bible.parse_reference("John 3:16, " + "16, " * 60) is None  # too long to be taken for a reference
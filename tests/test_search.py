@@ -0,0 +1,213 @@
+# PATH HACK
+import json
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from kjvstudy_org.kjv import Bible
+from kjvstudy_org.search import (
+    SearchIndex, SearchPatternError, edit_distance, intersect_spans, parse_query, required_words, tokenize,
+)
+from kjvstudy_org.stemming import normalize_word
+from kjvstudy_org.suggest import SuggestionIndex
+
+
+@pytest.fixture
+def bible(tmp_path):
+    corpus = tmp_path / "verses.json"
+    corpus.write_text(json.dumps({
+        "Genesis 1:1": "# In the beginning God created the heaven and the earth.",
+        "Matthew 5:3": "Blessed [are] the poor in spirit: for theirs is the kingdom of heaven.",
+        "Matthew 6:10": "Thy kingdom come. Thy will be done in earth, as [it is] in heaven.",
+        "John 3:16": "For God so loved the world, that he gave his only begotten Son,",
+        "1 John 4:8": "He that loveth not knoweth not God; for God is love.",
+    }))
+    return Bible(corpus)
+
+
+def ids(bible, *references):
+    return [bible.parse_reference(ref)[0][0] for ref in references]
+
+
+def test_tokenize():
+    assert tokenize("The LORD'S house, [is] it?") == ["the", "lord's", "house", "is", "it"]
+
+
+def test_search_index(bible):
+    index = SearchIndex(bible)
+
+    def search(text):
+        return index.search_query(parse_query(text))
+
+    assert search("kingdom heaven") == ids(bible, "Matthew 5:3", "Matthew 6:10")
+    assert search("love") == ids(bible, "John 3:16", "1 John 4:8")
+    assert search("heaven earth") == ids(bible, "Genesis 1:1", "Matthew 6:10")
+    assert search("kingdom loved") == []
+    assert search("zebra") == []
+
+
+def test_phrase_and_proximity_search(bible):
+    index = SearchIndex(bible)
+
+    # "kingdom ... heaven" in Matthew 6:10 is not the phrase.
+    assert index.search_query(parse_query('"kingdom of heaven"')) == ids(bible, "Matthew 5:3")
+    assert index.search_query(parse_query("kingdom heaven")) == ids(bible, "Matthew 5:3", "Matthew 6:10")
+    assert index.search_query(parse_query('"heaven and the earth"')) == ids(bible, "Genesis 1:1")
+    assert index.search_query(parse_query('"the kingdom heaven"')) == []
+
+    assert index.search_query(parse_query("kingdom NEAR/2 heaven")) == ids(bible, "Matthew 5:3")
+    assert index.search_query(parse_query("kingdom NEAR/12 heaven")) == ids(bible, "Matthew 5:3", "Matthew 6:10")
+    assert index.search_query(parse_query("heaven NEAR/2 kingdom")) == ids(bible, "Matthew 5:3")
+    assert index.search_query(parse_query('"for god" NEAR/1 so')) == ids(bible, "John 3:16")
+    assert index.search_query(parse_query('"for god" NEAR/2 love')) == ids(bible, "John 3:16", "1 John 4:8")
+
+
+def test_bm25_ranking(bible):
+    index = SearchIndex(bible)
+
+    def ranked(query):
+        parsed = parse_query(query)
+        scored = index.score_matches(parsed, index.search_query(parsed))
+        return [verse_id for score, verse_id in sorted(scored, key=lambda item: (-item[0], item[1]))]
+
+    # "God" twice in a short verse outranks "God" once in longer ones.
+    assert ranked("god")[0] == ids(bible, "1 John 4:8")[0]
+
+    # Rarer words weigh more than common ones.
+    [(kingdom, _)] = index.score_matches(parse_query("kingdom"), ids(bible, "Matthew 5:3"))
+    [(the, _)] = index.score_matches(parse_query("the"), ids(bible, "Matthew 5:3"))
+    assert kingdom > the > 0
+
+
+def test_fuzzy_search(bible):
+    index = SearchIndex(bible)
+
+    assert edit_distance("melchisedek", "melchisedec", 2) == 1
+    assert edit_distance("recieve", "receive", 2) == 1
+    assert edit_distance("kingdom", "heaven", 2) == 3
+
+    assert index.fuzzy_words("kingdon") == ("kingdom",)
+    assert index.fuzzy_words("begoten") == ("begotten",)
+    assert index.fuzzy_words("zebra") == ()
+    assert index.search_query(parse_query("kingdon heavan")) == ids(bible, "Matthew 5:3", "Matthew 6:10")
+
+
+def test_normalize_word():
+    known = {"believe", "love", "sin", "have", "bless", "blessing", "carry", "for", "lord", "nazareth"}
+
+    for word in ["believeth", "believest", "believed", "believing"]:
+        assert normalize_word(word, known) == "believe"
+    for word in ["lovedst", "loveth", "lovest", "loving", "loves"]:
+        assert normalize_word(word, known) == "love"
+    assert normalize_word("sinneth", known) == "sin"
+    assert normalize_word("hath", known) == "have"
+    assert normalize_word("blessings", known) == "bless"
+    assert normalize_word("carrieth", known) == "carry"
+    assert normalize_word("lord's", known) == "lord"
+
+    # Only stripped down to words that exist.
+    assert normalize_word("forest", known) == "forest"
+    assert normalize_word("nazareth", known) == "nazareth"
+    assert normalize_word("walketh", known) == "walketh"
+
+
+def test_search_word_forms(bible):
+    index = SearchIndex(bible)
+
+    assert index.search_query(parse_query("loving")) == ids(bible, "John 3:16", "1 John 4:8")
+
+
+def test_highlight_pattern(bible):
+    index = SearchIndex(bible)
+
+    def highlight(query, text):
+        return index.highlight_pattern(parse_query(query)).sub(r"<\g<0>>", text)
+
+    # Case-insensitive, whole words, prefixes and other forms.
+    assert highlight("god", "For God so loved") == "For <God> so loved"
+    assert highlight("lov", "For God so loved, LOVE") == "For God so <loved>, <LOVE>"
+    assert highlight("loving", "God so loved the world") == "God so <loved> the world"
+    assert highlight("kingdon", "Thy kingdom come") == "Thy <kingdom> come"
+
+    # One term inside another is not marked twice, phrases are marked whole.
+    assert highlight("he heaven", "He is in heaven") == "<He> is in <heaven>"
+    assert highlight('"kingdom of heaven" of', "kingdom of heaven, of") == "<kingdom of heaven>, <of>"
+    assert index.highlight_pattern(parse_query("")) is None
+
+
+def test_wildcard_search(bible):
+    index = SearchIndex(bible)
+
+    assert index.matching_words("lov*") == ["love", "loved", "loveth"]
+    assert index.matching_words("*eth") == ["knoweth", "loveth"]
+    assert index.matching_words("g?d") == ["god"]
+    assert index.search_query(parse_query("k?ngdom he*n")) == ids(bible, "Matthew 5:3", "Matthew 6:10")
+    assert index.search_query(parse_query("*")) == []
+
+
+def test_regex_search(bible):
+    index = SearchIndex(bible)
+
+    assert required_words(r"\bkingdom\b.*heav") == ["kingdom", "heav"]
+    assert required_words("lord|god") == []
+    assert index.search_query(parse_query("/kingdom (of|come)/")) == ids(bible, "Matthew 5:3", "Matthew 6:10")
+    assert index.search_query(parse_query("/kingdom (?:of )?(?:heaven|come)/")) == ids(bible, "Matthew 5:3", "Matthew 6:10")
+    assert index.search_query(parse_query(r"/\bgod\b.*\blove\b/")) == ids(bible, "1 John 4:8")
+
+    assert required_words(r"lo+ve (?:of )?god\.") == ["god"]
+    assert required_words(r"\x41bc[]x]def") == ["def"]
+    assert index.search_query(parse_query(r"/\bgod\b.*\blov\w+/")) == ids(bible, "John 3:16", "1 John 4:8")
+
+    for pattern in [
+        "/(a+)+b/", "/(ab|a)*x/", r"/(a)\1/", "/[/", "/" + "a" * 101 + "/",
+        "/" + ".*" * 5 + "~/", "/.*.*.*.*.*.*.*~/", r"/.*\s+~/", "/a*(?=x)b*/", r"/\w+ \w+ \w+/",
+        r"/(?:.?){20}the\d/", "/(?:.?){16}the/", "/(?:.?){22}zzq/", "/(?:.?.?){12}qqq/", r"/(?:\w+ )?x/",
+        "/" + ".?" * 20 + "x/", "/" + "(.|.)" * 20 + "/", "/(?:a|b){5}/", "/.*(?:e|.)(?:e|.).*~/",
+    ]:
+        with pytest.raises(SearchPatternError):
+            parse_query(pattern)
+
+    with pytest.raises(SearchPatternError):
+        index.search_regex(parse_query("/e/").regex, time_budget=-1)
+
+
+def test_scoped_search(bible):
+    index = SearchIndex(bible)
+    gospels = [bible.get_books_span("Matthew", "John")]
+
+    assert index.search_query(parse_query("god"), gospels) == ids(bible, "John 3:16")
+    assert index.search_query(parse_query("god"), [bible.get_books_span("1 John")]) == ids(bible, "1 John 4:8")
+    assert index.search_query(parse_query("heaven"), [bible.get_books_span("Matthew", None, 6, 6)]) == ids(bible, "Matthew 6:10")
+    assert index.search_query(parse_query("/god/"), gospels) == ids(bible, "John 3:16")
+
+    assert bible.get_books_span("John", "Matthew") is None
+    assert intersect_spans([(1, 5), (8, 12)], [(4, 9), (11, 20)]) == [(4, 5), (8, 9), (11, 12)]
+
+
+def test_parse_query():
+    query = parse_query('"Kingdom of heaven" faith NEAR/3 works near')
+    assert query.words == ["kingdom", "of", "heaven", "faith", "works", "near"]
+    assert query.operands[0].phrase and not query.operands[1].phrase
+    assert query.near == [(query.operands[1], query.operands[2], 3)]
+
+
+def test_suggestions(bible):
+    suggestions = SuggestionIndex(bible, SearchIndex(bible))
+
+    def texts(query):
+        return [suggestion["text"] for suggestion in suggestions.suggest(query)]
+
+    assert texts("Joh") == ["John"]
+    assert texts("mat") == ["Matthew"]
+    assert texts("1 jo") == ["1 John"]
+    assert texts("Matt 5") == ["Matthew 5"]
+    assert texts("John 3:1") == ["John 3:16"]
+    assert texts("Jn 3:") == ["John 3:16"]
+    assert texts("I Jo. 4") == ["1 John 4"]
+    assert texts("a" + " " * 4000 + "1") == []
+    assert texts("Matthew 7") == []
+    assert texts("kingdom of he") == ["kingdom of heaven", "kingdom of he"]
+    assert texts("lov") == ["love", "loved", "loveth"]
+    assert texts("begoten") == ["begotten"]
@@ -0,0 +1,133 @@
+# PATH HACK
+import json
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from kjvstudy_org import search, server
+from kjvstudy_org.kjv import Bible, bible
+from kjvstudy_org.server import MAX_SEARCH_PAGE_SIZE, SEARCH_PAGE_SIZE, app, search_cache
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    corpus = tmp_path / "verses.json"
+    corpus.write_text(json.dumps({
+        "Genesis 1:1": "In the beginning God created the heaven and the earth.",
+        "Genesis 29:20": "And Jacob served seven years for Rachel; and they seemed unto him but a few days, for the love he had to her.",
+        "Psalms 23:1": "The LORD is my shepherd; I shall not want.",
+        **{f"Psalms 119:{v}": f"O how love I thy law! it is my meditation all the day, {v}." for v in range(1, 61)},
+        "John 3:16": "For God so loved the world, that he gave his only begotten Son,",
+        "1 John 4:8": "He that loveth not knoweth not God; for God is love.",
+    }))
+
+    # The routes use the shared Bible and search index, so point them at the test corpus.
+    monkeypatch.setattr(bible, "_bible", Bible(corpus))
+    monkeypatch.setattr(search, "_search_index", None)
+    search_cache.clear()
+    server.testament_spans.cache_clear()
+    yield TestClient(app)
+    search_cache.clear()
+    server.testament_spans.cache_clear()
+
+
+def references(response):
+    assert response.status_code == 200
+    return [result["reference"] for result in response.json()["results"]]
+
+
+def test_search_api_pages(client):
+    everything = client.get("/api/search", params={"q": "love", "limit": MAX_SEARCH_PAGE_SIZE}).json()
+    assert everything["total"] == everything["count"] == 63
+    assert everything["next_cursor"] is None
+    ranked = [result["reference"] for result in everything["results"]]
+
+    # Without a limit, a page is SEARCH_PAGE_SIZE results.
+    page = client.get("/api/search", params={"q": "love"}).json()
+    assert page["count"] == SEARCH_PAGE_SIZE and page["total"] == 63
+    assert page["next_cursor"] is not None
+
+    # Following next_cursor walks the whole ranking.
+    seen = []
+    params = {"q": "love", "limit": 25}
+    while True:
+        page = client.get("/api/search", params=params).json()
+        seen += [result["reference"] for result in page["results"]]
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+    assert seen == ranked
+
+    assert references(client.get("/api/search", params={"q": "love", "limit": 3, "offset": 2})) == ranked[2:5]
+    first = client.get("/api/search", params={"q": "love", "limit": 4}).json()
+    after = client.get("/api/search", params={"q": "love", "limit": 2, "offset": 1, "cursor": first["next_cursor"]})
+    assert references(after) == ranked[5:7]
+
+
+def test_search_api_reference_pages(client):
+    first = client.get("/api/search", params={"q": "Psalm 119:1-10", "limit": 4}).json()
+    assert [result["reference"] for result in first["results"]] == [f"Psalms 119:{v}" for v in range(1, 5)]
+    assert first["total"] == 10
+
+    rest = client.get("/api/search", params={"q": "Psalm 119:1-10", "cursor": first["next_cursor"]}).json()
+    assert [result["reference"] for result in rest["results"]] == [f"Psalms 119:{v}" for v in range(5, 11)]
+    assert rest["next_cursor"] is None
+
+
+def test_search_api_rejects_bad_requests(client):
+    assert client.get("/api/search", params={"q": "love", "cursor": "nope"}).status_code == 400
+    assert client.get("/api/search", params={"q": "love", "limit": MAX_SEARCH_PAGE_SIZE + 1}).status_code == 422
+    assert client.get("/api/search", params={"q": "love", "limit": 0}).status_code == 422
+    assert client.get("/api/search", params={"q": "love " * 50}).status_code == 422
+    assert client.get("/api/search", params={"q": "/(a+)+/"}).status_code == 400
+
+
+def test_search_page_rejects_long_queries(client):
+    response = client.get("/search", params={"q": "love " * 50})
+    assert response.status_code == 200
+    assert "Queries are limited to 200 characters." in response.text
+
+
+def test_search_api_filters(client):
+    def search(**filters):
+        return references(client.get("/api/search", params={"q": "love", "limit": MAX_SEARCH_PAGE_SIZE, **filters}))
+
+    assert search(book="Genesis") == ["Genesis 29:20"]
+    assert search(book="gen", chapters="29") == ["Genesis 29:20"]
+    assert search(book="Psalms", chapters="1-118") == []
+    assert len(search(book="Psalms", chapters="100-150")) == 60
+    assert search(**{"from": "Genesis", "to": "Genesis"}) == ["Genesis 29:20"]
+    assert set(search(**{"from": "Psalms"})) - {f"Psalms 119:{v}" for v in range(1, 61)} == {"John 3:16", "1 John 4:8"}
+    assert sorted(search(testament="new")) == ["1 John 4:8", "John 3:16"]
+    assert len(search(testament="Old")) == 61
+    assert search(testament="new", book="Genesis") == []
+    assert references(client.get("/api/search", params={"q": "Gen 1:1", "testament": "new"})) == []
+
+
+def test_search_api_rejects_bad_filters(client):
+    def error(**filters):
+        response = client.get("/api/search", params={"q": "love", **filters})
+        assert response.status_code == 400
+        return response.json()["detail"]
+
+    assert error(book="Hezekiah") == "Unknown book: Hezekiah"
+    assert error(**{"to": "Hezekiah"}) == "Unknown book: Hezekiah"
+    assert error(**{"from": "1 John", "to": "Genesis"}) == "1 John comes after Genesis"
+    assert error(book="Psalms", chapters="119-23") == "Invalid chapter range: 119-23"
+    assert error(book="Psalms", chapters="three") == "Invalid chapter range: three"
+    assert error(chapters="3") == "A chapter range needs a single book"
+    assert error(**{"from": "Genesis", "to": "Psalms", "chapters": "3"}) == "A chapter range needs a single book"
+    assert error(testament="apocrypha") == "Unknown testament: apocrypha"
+
+
+def test_search_page_shows_filter_errors(client):
+    response = client.get("/search", params={"q": "love", "book": "Psalms", "chapters": "119-23"})
+    assert response.status_code == 200
+    assert "Invalid chapter range: 119-23" in response.text
+
+    response = client.get("/search", params={"q": "love", "testament": "new"})
+    assert response.status_code == 200
+    assert "1 John 4:8" in response.text and "Psalms 119:1" not in response.text